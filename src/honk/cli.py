@@ -81,6 +81,8 @@ def main_callback(
         from rich.console import Console
         Console._environ = {"TERM": "dumb"}
         os.environ["NO_COLOR"] = "1"
+        from honk.ui import reset_json_mode
+        reset_json_mode()
 
 
 @app.command()
@@ -0,0 +1,15 @@
+"""File-system helpers shared by honk commands."""
+
+import os
+from pathlib import Path
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write a file via a sibling temp file so it's never left half-written."""
+    temp_path = path.with_suffix(path.suffix + ".tmp")
+    try:
+        temp_path.write_bytes(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
@@ -1,6 +1,8 @@
+import os
+import stat
 from pathlib import Path
 from string import Template
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 
 class TemplateEngine:
     """
@@ -11,24 +13,57 @@ class TemplateEngine:
         self.template_dir = template_dir
         if not self.template_dir.is_dir():
             raise ValueError(f"Template directory not found: {template_dir}")
+        # Parsed templates by name, with the (st_mtime_ns, st_size) they were read at
+        self._compiled: Dict[str, Tuple[Tuple[int, int], Template]] = {}
+        # Template names with the directory st_mtime_ns they were listed at
+        self._listing: Optional[Tuple[int, Tuple[str, ...]]] = None
 
     def render(self, template_name: str, context: Dict[str, Any]) -> str:
         """
         Renders a template file with the given context.
         Variables in the template should be in the format ${VARIABLE_NAME}.
         """
-        template_path = self.template_dir / template_name
-        if not template_path.is_file():
-            raise FileNotFoundError(f"Template file not found: {template_path}")
-
-        template_content = template_path.read_text()
-        template = Template(template_content)
+        template = self._load(template_name)
         
         # Perform substitution. Missing keys will raise KeyError.
         # For more Jinja2-like behavior (e.g., silent missing keys),
         # a more complex implementation or actual Jinja2 would be needed.
         return template.substitute(context)
 
+    def available_templates(self, suffix: str = ".agent.md") -> Tuple[str, ...]:
+        """
+        Returns the names of the templates ending in suffix, without the suffix.
+        The listing is cached until the directory's mtime changes.
+        """
+        mtime_ns = os.stat(self.template_dir).st_mtime_ns
+        if self._listing is None or self._listing[0] != mtime_ns:
+            with os.scandir(self.template_dir) as it:
+                names = tuple(
+                    entry.name[:-len(suffix)]
+                    for entry in it
+                    if entry.name.endswith(suffix)
+                )
+            self._listing = (mtime_ns, names)
+        return self._listing[1]
+
+    def _load(self, template_name: str) -> Template:
+        """
+        Returns the parsed template, re-reading it only when the file changed.
+        """
+        template_path = self.template_dir / template_name
+        try:
+            st = os.stat(template_path)
+        except OSError:
+            st = None
+        if st is None or not stat.S_ISREG(st.st_mode):
+            raise FileNotFoundError(f"Template file not found: {template_path}")
+
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._compiled.get(template_name)
+        if cached is None or cached[0] != key:
+            cached = self._compiled[template_name] = (key, Template(template_path.read_text()))
+        return cached[1]
+
     def validate_template(self, template_name: str, required_vars: List[str]) -> None:
         """
         Validates if a template contains all required variables.
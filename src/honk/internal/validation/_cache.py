@@ -0,0 +1,248 @@
+"""Process-wide caches of frontmatter validators and validation results."""
+import atexit
+import copy
+import functools
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Hashable, Iterator, Optional, Sequence, Union
+
+from honk import __version__
+from honk.internal.validation.yaml_validator import ValidationResult, YAMLFrontmatterValidator
+
+# Validation results kept in memory and persisted between runs
+VALIDATION_CACHE_SIZE = 2000
+VALIDATION_CACHE_FILE = Path("honk/validation.json")  # Relative to $XDG_CACHE_HOME (~/.cache)
+
+# Bump when the persisted layout or the meaning of a result changes; results
+# saved by another format or honk version are dropped on load
+CACHE_FORMAT = 1
+
+# Set to "1" to neither read nor write the persisted results
+NO_CACHE_ENV = "HONK_NO_VALIDATION_CACHE"
+
+# Batches of at least this many files are read concurrently, on at most MAX_READ_WORKERS threads
+PARALLEL_READ_THRESHOLD = 4
+MAX_READ_WORKERS = 8
+
+
+def get_validator(schema_path: Union[str, Path]) -> YAMLFrontmatterValidator:
+    """Get the shared validator for a schema.
+    
+    The schema is loaded and compiled once per process; relative paths are
+    made absolute first so a change of working directory can't reuse the
+    wrong schema.
+    """
+    return _validator_for(os.path.abspath(schema_path))
+
+
+@functools.lru_cache(maxsize=4)
+def _validator_for(schema_path: str) -> YAMLFrontmatterValidator:
+    return YAMLFrontmatterValidator(schema_path=Path(schema_path))
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+@functools.lru_cache(maxsize=4)
+def _schema_digest(schema_path: str) -> str:
+    with open(schema_path, "rb") as f:
+        return _digest(f.read())
+
+
+class TrackedLRUCache:
+    """Least-recently-used mapping that counts hits and misses."""
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a value and mark it as recently used, or None on a miss."""
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self._data[key]
+    
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def items(self):
+        """Entries from least to most recently used."""
+        return self._data.items()
+
+
+_results = TrackedLRUCache(VALIDATION_CACHE_SIZE)
+_results_loaded = False
+_results_dirty = False
+
+
+def validate_file_cached(file_path: Path, schema_path: Union[str, Path]) -> ValidationResult:
+    """Validate a file, reusing the result for content seen before.
+    
+    Results are keyed by digests of the schema and of the file bytes (never
+    the path), kept in memory and, when new ones were added, saved to
+    $XDG_CACHE_HOME/honk/validation.json at exit so unchanged files are not
+    parsed again on the next run by the same honk version. Set HONK_NO_VALIDATION_CACHE=1 to skip
+    the file. Each call returns its own copy of the result.
+    """
+    return _validate_cached(_read_file(file_path), Path(file_path), schema_path)
+
+
+def validate_files_cached(
+    file_paths: Sequence[Union[str, os.PathLike]],
+    schema_path: Union[str, Path],
+) -> Iterator[ValidationResult]:
+    """Validate several files like validate_file_cached, yielding results in order.
+    
+    The files are read up front, concurrently for larger batches, so the
+    reads overlap instead of each waiting on the previous file.
+    """
+    if len(file_paths) >= PARALLEL_READ_THRESHOLD:
+        workers = min(MAX_READ_WORKERS, len(file_paths))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            contents = list(pool.map(_read_file, file_paths))
+    else:
+        contents = [_read_file(p) for p in file_paths]
+    
+    for file_path, data in zip(file_paths, contents):
+        yield _validate_cached(data, Path(file_path), schema_path)
+
+
+def _read_file(file_path: Union[str, os.PathLike]) -> Optional[bytes]:
+    """Read a whole file, or None if it does not exist."""
+    try:
+        with open(file_path, "rb", buffering=0) as f:
+            return f.readall()
+    except FileNotFoundError:
+        return None
+
+
+def _validate_cached(
+    data: Optional[bytes],
+    file_path: Path,
+    schema_path: Union[str, Path],
+) -> ValidationResult:
+    """Validate file content through the result cache."""
+    validator = get_validator(schema_path)
+    if data is None:
+        return validator.validate_file(file_path)  # Reports the missing file
+    
+    try:
+        key = f"{_schema_digest(os.fspath(validator.schema_path))}:{_digest(data)}"
+    except OSError:
+        # Unreadable schema: let the validator report it, nothing to key on
+        return validator.validate_bytes(data)
+    
+    _load_results()
+    result = _results.get(key)
+    if result is None:
+        result = validator.validate_bytes(data)
+        _results[key] = result
+        _mark_dirty()
+    # Callers may modify what they get back; the cached entry stays intact
+    return _copy_result(result)
+
+
+def _copy_result(result: ValidationResult) -> ValidationResult:
+    """Copy a result down to its frontmatter values."""
+    return ValidationResult(
+        result.is_valid, list(result.errors), copy.deepcopy(result.frontmatter)
+    )
+
+
+def _cache_file() -> Optional[Path]:
+    """Get the persisted results file, or None when persistence is turned off."""
+    if os.getenv(NO_CACHE_ENV) == "1":
+        return None
+    cache_home = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / VALIDATION_CACHE_FILE
+
+
+def _load_results() -> None:
+    """Read persisted results once per process."""
+    global _results_loaded
+    
+    if _results_loaded:
+        return
+    _results_loaded = True
+    
+    cache_file = _cache_file()
+    if cache_file is None:
+        return
+    
+    try:
+        saved = json.loads(cache_file.read_bytes())
+        if saved.get("format") != _cache_stamp():
+            return  # Written by another honk version: its verdicts may be stale
+        entries: Dict[str, Dict[str, Any]] = saved["entries"]
+        for key, entry in entries.items():
+            _results[key] = ValidationResult(entry["valid"], entry["errors"], entry["frontmatter"])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        pass  # Missing or unreadable cache: start empty
+
+
+def _cache_stamp() -> str:
+    """Identify the cache format and the honk version whose results it holds."""
+    return f"{CACHE_FORMAT}:{__version__}"
+
+
+def _mark_dirty() -> None:
+    """Note new results, saving them at exit the first time unless persistence is off."""
+    global _results_dirty
+    
+    if _results_dirty:
+        return
+    _results_dirty = True
+    
+    cache_file = _cache_file()
+    if cache_file is not None:
+        atexit.register(_save_results, cache_file)
+
+
+def _save_results(cache_file: Path) -> None:
+    """Write the results to the cache file, skipping ones that aren't plain JSON."""
+    entries = {}
+    for key, result in _results.items():
+        entry = {"valid": result.is_valid, "errors": result.errors, "frontmatter": result.frontmatter}
+        try:
+            json.dumps(entry)
+        except (TypeError, ValueError):
+            continue  # e.g. YAML dates in the frontmatter
+        entries[key] = entry
+    
+    payload = json.dumps({"format": _cache_stamp(), "entries": entries})
+    
+    temp_name = None
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # A private temp file per process, so concurrent runs never share a half-written one
+        with tempfile.NamedTemporaryFile(
+            "w", dir=cache_file.parent, prefix=cache_file.name, suffix=".tmp", delete=False
+        ) as f:
+            temp_name = f.name
+            f.write(payload)
+        os.replace(temp_name, cache_file)
+    except OSError:
+        # The cache is only an optimization
+        if temp_name is not None:
+            try:
+                os.unlink(temp_name)
+            except OSError:
+                pass
@@ -0,0 +1,21 @@
+"""Frontmatter splitting shared by agent validation and listing."""
+from typing import AnyStr, Optional
+
+
+def split_frontmatter(content: AnyStr) -> Optional[AnyStr]:
+    """Get the YAML between the opening `---` line and the next line starting with `---`.
+    
+    Works on str or bytes, so file data can be split before it is decoded.
+    Kept free of YAML and schema imports so listing stays cheap.
+    """
+    dashes, newline = ("---", "\n") if isinstance(content, str) else (b"---", b"\n")
+    content = content.lstrip()
+    if not content.startswith(dashes):
+        return None
+    first_line_end = content.find(newline)
+    if first_line_end < 0 or content[len(dashes):first_line_end].strip():
+        return None
+    end = content.find(newline + dashes, first_line_end)
+    if end < 0:
+        return None
+    return content[first_line_end + 1:end]
@@ -1,14 +1,28 @@
-import re
 import yaml
 from pathlib import Path
 from typing import List, Dict, Any, Optional
-from jsonschema import validate, ValidationError
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
+
+from honk.internal.validation.frontmatter import split_frontmatter
+
+# libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore[assignment]
 
 class ValidationResult:
     """Represents the result of a YAML frontmatter validation."""
-    def __init__(self, is_valid: bool, errors: Optional[List[str]] = None):
+    def __init__(
+        self,
+        is_valid: bool,
+        errors: Optional[List[str]] = None,
+        frontmatter: Optional[Dict[str, Any]] = None,
+    ):
         self.is_valid = is_valid
         self.errors = errors if errors is not None else []
+        self.frontmatter = frontmatter if frontmatter is not None else {}
 
     @property
     def valid(self) -> bool:
@@ -24,14 +38,24 @@ class YAMLFrontmatterValidator:
     def __init__(self, schema_path: Path):
         self.schema_path = schema_path
         self._schema: Optional[Dict[str, Any]] = None
+        self._checker: Optional[Any] = None
 
     @property
     def schema(self) -> Dict[str, Any]:
         if self._schema is None:
             with open(self.schema_path, 'r') as f:
-                self._schema = yaml.safe_load(f)
+                self._schema = yaml.load(f, Loader=SafeLoader)
         return self._schema
 
+    @property
+    def checker(self) -> Any:
+        """The JSON schema validator, checked and compiled once per schema load."""
+        if self._checker is None:
+            cls = validator_for(self.schema)
+            cls.check_schema(self.schema)
+            self._checker = cls(self.schema)
+        return self._checker
+
     def validate_file(self, file_path: Path) -> ValidationResult:
         """
         Reads a file, extracts YAML frontmatter, and validates it.
@@ -39,16 +63,37 @@ class YAMLFrontmatterValidator:
         if not file_path.exists():
             return ValidationResult(False, [f"File not found: {file_path}"])
 
-        content = file_path.read_text()
-        frontmatter_match = re.search(r"^\s*---\s*\n(?P<frontmatter>.*?)\n*---\s*", content, re.DOTALL)
+        return self.validate_bytes(file_path.read_bytes())
+
+    def validate_bytes(self, data: bytes) -> ValidationResult:
+        """
+        Extracts YAML frontmatter from raw file data and validates it.
+        Only the frontmatter block is decoded; the markdown body is never touched.
+        """
+        frontmatter = split_frontmatter(data)
+        if frontmatter is None:
+            return ValidationResult(False, ["No YAML frontmatter found."])
+        try:
+            frontmatter_str = frontmatter.decode("utf-8")
+        except UnicodeDecodeError as e:
+            return ValidationResult(False, [f"Frontmatter is not valid UTF-8: {e}"])
+        return self._validate_frontmatter(frontmatter_str)
 
-        if not frontmatter_match:
+    def validate_content(self, content: str) -> ValidationResult:
+        """
+        Extracts YAML frontmatter from file content and validates it.
+        """
+        frontmatter = split_frontmatter(content)
+        if frontmatter is None:
             return ValidationResult(False, ["No YAML frontmatter found."])
+        return self._validate_frontmatter(frontmatter)
 
-        frontmatter_str = frontmatter_match.group('frontmatter')
-        
+    def _validate_frontmatter(self, frontmatter_str: str) -> ValidationResult:
+        """
+        Parses a frontmatter block and validates it against the schema.
+        """
         try:
-            frontmatter_data = yaml.safe_load(frontmatter_str)
+            frontmatter_data = yaml.load(frontmatter_str, Loader=SafeLoader)
             if frontmatter_data is None: # Handle empty frontmatter block
                 frontmatter_data = {}
         except yaml.YAMLError as e:
@@ -58,11 +103,13 @@ class YAMLFrontmatterValidator:
             return ValidationResult(False, ["Frontmatter is not a valid YAML object (must be a dictionary)."])
 
         try:
-            validate(instance=frontmatter_data, schema=self.schema)
-            return ValidationResult(True)
-        except ValidationError as e:
-            errors = [f"Validation Error: {e.message} (Path: {e.path})"]
-            return ValidationResult(False, errors)
+            # Same error selection as jsonschema.validate(), without re-checking the schema
+            error = best_match(self.checker.iter_errors(frontmatter_data))
         except Exception as e:
             return ValidationResult(False, [f"An unexpected error occurred during validation: {e}"])
 
+        if error is not None:
+            errors = [f"Validation Error: {error.message} (Path: {error.path})"]
+            return ValidationResult(False, errors)
+        return ValidationResult(True, frontmatter=frontmatter_data)
+
@@ -4,9 +4,13 @@ import os
 import json
 import logging
 from logging.handlers import RotatingFileHandler
+from typing import Iterator
 
 LOG_FILE_PATH = os.path.expanduser("~/.local/state/honk/honk.log")
 
+# Bytes read per step when scanning a log file from the end
+READ_CHUNK_SIZE = 64 * 1024
+
 def setup_logging():
     """Configure the global logger for structured JSON logging."""
     log_dir = os.path.dirname(LOG_FILE_PATH)
@@ -32,3 +36,25 @@ def log_event(event_type: str, data: dict):
     
     log_message = json.dumps({"event_type": event_type, **data})
     logger.info(log_message)
+
+def read_lines_reversed(path: str, chunk_size: int = READ_CHUNK_SIZE) -> Iterator[bytes]:
+    """Yield the non-empty lines of a file from last to first.
+    
+    Reads backwards from the end in chunks, so finding the most recent
+    entries doesn't load the whole file.
+    """
+    with open(path, "rb") as f:
+        position = f.seek(0, os.SEEK_END)
+        partial = b""
+        while position > 0:
+            read_size = min(chunk_size, position)
+            position -= read_size
+            f.seek(position)
+            lines = (f.read(read_size) + partial).split(b"\n")
+            # The first piece may continue in the previous chunk
+            partial = lines[0]
+            for line in reversed(lines[1:]):
+                if line:
+                    yield line
+        if partial:
+            yield partial
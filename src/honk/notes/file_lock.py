@@ -8,13 +8,6 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
-try:
-    import psutil
-
-    HAS_PSUTIL = True
-except ImportError:
-    HAS_PSUTIL = False
-
 
 @dataclass
 class FileLock:
@@ -60,16 +53,17 @@ class FileLockManager:
             if not pid:
                 return True
 
-            # Check if process exists
-            if HAS_PSUTIL:
-                return not psutil.pid_exists(pid)
-            else:
+            # Check if process exists (psutil imported here to keep it off CLI startup)
+            try:
+                import psutil
+            except ImportError:
                 # Fallback: try to send signal 0 (doesn't actually send signal)
                 try:
                     os.kill(pid, 0)
                     return False
                 except OSError:
                     return True
+            return not psutil.pid_exists(pid)
 
         except (json.JSONDecodeError, FileNotFoundError, KeyError):
             # Lock file is corrupt or missing, consider it stale
@@ -1,11 +1,11 @@
 """Commit analyzer for release type recommendation."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import List
+from typing import Iterable, List
 
 from honk.shared.git import Commit
-from honk.release.commit_parser import ConventionalCommitParser, CommitType
+from honk.release.commit_parser import ConventionalCommitParser, CommitType, ParsedCommit
 
 
 class ReleaseType(Enum):
@@ -29,6 +29,8 @@ class CommitAnalysis:
     other: List[Commit]
     recommended_type: ReleaseType
     reasons: List[str]
+    commits: List[Commit] = field(default_factory=list)
+    parsed: List[ParsedCommit] = field(default_factory=list)
     
     @property
     def total_commits(self) -> int:
@@ -63,7 +65,7 @@ class CommitAnalyzer:
         """Initialize commit analyzer."""
         self.parser = ConventionalCommitParser()
     
-    def analyze(self, commits: List[Commit]) -> CommitAnalysis:
+    def analyze(self, commits: Iterable[Commit]) -> CommitAnalysis:
         """Analyze commits and recommend release type.
         
         Rules:
@@ -72,28 +74,36 @@ class CommitAnalyzer:
         - If only fixes → PATCH
         - If no conventional commits → PATCH (default)
         
+        The commits are consumed once, so a lazy iterator can be
+        passed. The parsed messages are kept on the result so callers (e.g.
+        the changelog generator) don't have to parse them again.
+        
         Args:
-            commits: List of commits to analyze
+            commits: Commits to analyze
             
         Returns:
             CommitAnalysis with categorized commits and recommendation
         """
-        breaking_changes = []
-        features = []
-        fixes = []
-        other = []
+        breaking_changes: List[Commit] = []
+        features: List[Commit] = []
+        fixes: List[Commit] = []
+        other: List[Commit] = []
+        all_commits: List[Commit] = []
+        all_parsed: List[ParsedCommit] = []
+        
+        # Non-breaking commits go to the bucket for their type, or to `other`
+        bucket_for_type = {CommitType.FEAT: features, CommitType.FIX: fixes}
         
         for commit in commits:
             parsed = self.parser.parse(commit.message)
             
             if parsed.breaking:
                 breaking_changes.append(commit)
-            elif parsed.type == CommitType.FEAT:
-                features.append(commit)
-            elif parsed.type == CommitType.FIX:
-                fixes.append(commit)
             else:
-                other.append(commit)
+                bucket_for_type.get(parsed.type, other).append(commit)
+            
+            all_commits.append(commit)
+            all_parsed.append(parsed)
         
         # Determine release type based on semantic versioning rules
         if breaking_changes:
@@ -137,7 +147,9 @@ class CommitAnalyzer:
             fixes=fixes,
             other=other,
             recommended_type=recommended,
-            reasons=reasons
+            reasons=reasons,
+            commits=all_commits,
+            parsed=all_parsed
         )
     
     def get_summary(self, analysis: CommitAnalysis) -> str:
@@ -1,8 +1,9 @@
 """AI-powered changelog generator (placeholder)."""
 
-from typing import List
+from typing import List, Optional
 
 from honk.shared.git import Commit
+from honk.release.commit_parser import ParsedCommit
 from honk.release.changelog.generator import ChangelogGenerator
 from honk.release.ai.copilot import CopilotCLI
 
@@ -15,26 +16,37 @@ class AIChangelogGenerator:
         self.copilot = CopilotCLI()
         self.fallback = ChangelogGenerator()
     
-    def generate(self, commits: List[Commit], version: str) -> str:
+    def generate(
+        self,
+        commits: List[Commit],
+        version: str,
+        parsed_commits: Optional[List[ParsedCommit]] = None
+    ) -> str:
         """Generate changelog with AI (or fallback).
         
         Args:
             commits: List of commits
             version: Version number
+            parsed_commits: Already-parsed commit messages, aligned with commits
             
         Returns:
             Generated changelog
         """
         try:
             if self.copilot.available:
-                return self._generate_with_ai(commits, version)
+                return self._generate_with_ai(commits, version, parsed_commits)
         except Exception:
             pass
         
         # Fallback to traditional generator
-        return self.fallback.generate(commits, version)
+        return self.fallback.generate(commits, version, parsed_commits)
     
-    def _generate_with_ai(self, commits: List[Commit], version: str) -> str:
+    def _generate_with_ai(
+        self,
+        commits: List[Commit],
+        version: str,
+        parsed_commits: Optional[List[ParsedCommit]] = None
+    ) -> str:
         """Generate with AI (placeholder).
         
         Full implementation would:
@@ -43,4 +55,4 @@ class AIChangelogGenerator:
         3. Parse and validate AI response
         """
         # For now, use fallback
-        return self.fallback.generate(commits, version)
+        return self.fallback.generate(commits, version, parsed_commits)
@@ -1,10 +1,10 @@
 """Traditional changelog generator (non-AI fallback)."""
 
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from honk.shared.git import Commit
-from honk.release.commit_parser import ConventionalCommitParser, CommitType
+from honk.release.commit_parser import ConventionalCommitParser, CommitType, ParsedCommit
 
 
 class ChangelogGenerator:
@@ -14,12 +14,18 @@ class ChangelogGenerator:
         """Initialize changelog generator."""
         self.parser = ConventionalCommitParser()
     
-    def generate(self, commits: List[Commit], version: str) -> str:
+    def generate(
+        self,
+        commits: List[Commit],
+        version: str,
+        parsed_commits: Optional[List[ParsedCommit]] = None
+    ) -> str:
         """Generate changelog entry for commits.
         
         Args:
             commits: List of commits to include
             version: Version number for this release
+            parsed_commits: Already-parsed commit messages, aligned with commits
             
         Returns:
             Formatted changelog text (Keep a Changelog format)
@@ -36,9 +42,10 @@ class ChangelogGenerator:
         
         breaking_changes: List[str] = []
         
-        for commit in commits:
-            parsed = self.parser.parse(commit.message)
-            
+        if parsed_commits is None:
+            parsed_commits = [self.parser.parse(c.message) for c in commits]
+        
+        for parsed in parsed_commits:
             # Skip non-conventional commits
             if parsed.type is None:
                 continue
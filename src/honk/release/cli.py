@@ -1,91 +1,113 @@
 """Release tool CLI commands."""
 
+import functools
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
 import typer
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
-from honk.shared.git import GitOperations
-from honk.release.analyzer import CommitAnalyzer, ReleaseType
-from honk.release.versioning.bumper import VersionBumper
+if TYPE_CHECKING:
+    from honk.release.analyzer import ReleaseType
 
 app = typer.Typer(help="Release automation tools")
 console = Console()
 
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _with_error_handling(fn: F) -> F:
+    """Report unexpected errors as `Error: ...` and exit with status 1."""
+    @functools.wraps(fn)
+    def wrapped(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return fn(*args, **kwargs)
+        except typer.Exit:
+            raise
+        except Exception as e:
+            console.print(f"[red]Error:[/] {e}")
+            raise typer.Exit(1)
+    return wrapped  # type: ignore[return-value]
+
 
 @app.command()
 def status():
     """Show release status and current version."""
-    try:
-        git = GitOperations()
-        bumper = VersionBumper()
-        analyzer = CommitAnalyzer()
-        
-        current_version = git.get_current_version() or "0.0.0"
-        commits = git.get_commits_since_last_tag()
-        analysis = analyzer.analyze(commits)
-        
-        # Create status table
-        table = Table(title="Release Status")
-        table.add_column("Item", style="cyan")
-        table.add_column("Value", style="yellow")
-        
-        table.add_row("Current Version", current_version)
-        table.add_row("Commits Since Last Tag", str(len(commits)))
-        table.add_row("Breaking Changes", str(len(analysis.breaking_changes)))
-        table.add_row("Features", str(len(analysis.features)))
-        table.add_row("Fixes", str(len(analysis.fixes)))
-        table.add_row("Recommended Release", analysis.recommended_type.value.upper())
-        
-        new_version_obj = bumper.get_current_version().bump(analysis.recommended_type)
-        table.add_row("Next Version", str(new_version_obj))
-        
-        console.print(table)
-        
-        # Show reasoning
-        console.print("\n[bold]Reasoning:[/]")
-        for reason in analysis.reasons:
-            console.print(f"  • {reason}")
-            
-    except Exception as e:
-        console.print(f"[red]Error:[/] {e}")
-        raise typer.Exit(1)
+    _print_status()
+
+
+@_with_error_handling
+def _print_status():
+    """Print release status table and reasoning."""
+    from rich.table import Table
+    from honk.shared.git import GitOperations
+    from honk.release.analyzer import CommitAnalyzer
+    from honk.release.versioning.bumper import VersionBumper
+    
+    git = GitOperations()
+    bumper = VersionBumper()
+    analyzer = CommitAnalyzer()
+    
+    current_version = git.get_current_version() or "0.0.0"
+    commits = git.get_commits_since_last_tag()
+    analysis = analyzer.analyze(commits)
+    
+    # Create status table
+    table = Table(title="Release Status")
+    table.add_column("Item", style="cyan")
+    table.add_column("Value", style="yellow")
+    
+    table.add_row("Current Version", current_version)
+    table.add_row("Commits Since Last Tag", str(len(commits)))
+    table.add_row("Breaking Changes", str(len(analysis.breaking_changes)))
+    table.add_row("Features", str(len(analysis.features)))
+    table.add_row("Fixes", str(len(analysis.fixes)))
+    table.add_row("Recommended Release", analysis.recommended_type.value.upper())
+    
+    new_version_obj = bumper.get_current_version().bump(analysis.recommended_type)
+    table.add_row("Next Version", str(new_version_obj))
+    
+    console.print(table)
+    
+    # Show reasoning
+    console.print("\n[bold]Reasoning:[/]")
+    for reason in analysis.reasons:
+        console.print(f"  • {reason}")
 
 
 @app.command()
+@_with_error_handling
 def preview():
     """Preview what a release would look like (dry run)."""
-    try:
-        git = GitOperations()
-        bumper = VersionBumper()
-        analyzer = CommitAnalyzer()
-        
-        console.print("[cyan]Analyzing commits...[/]")
-        commits = git.get_commits_since_last_tag()
-        analysis = analyzer.analyze(commits)
-        
-        old_version, new_version = bumper.bump_version(
-            analysis.recommended_type,
-            dry_run=True
-        )
-        
-        console.print(Panel(
-            f"[bold]Release Preview[/]\n\n"
-            f"Current: {old_version}\n"
-            f"New: [green]{new_version}[/] ({analysis.recommended_type.value.upper()})\n"
-            f"Commits: {len(commits)}",
-            title="Preview",
-            border_style="green"
-        ))
-        
-        console.print("\n[bold]Summary:[/]")
-        console.print(analyzer.get_summary(analysis))
-        
-    except Exception as e:
-        console.print(f"[red]Error:[/] {e}")
-        raise typer.Exit(1)
+    from rich.panel import Panel
+    from honk.shared.git import GitOperations
+    from honk.release.analyzer import CommitAnalyzer
+    from honk.release.versioning.bumper import VersionBumper
+    
+    git = GitOperations()
+    bumper = VersionBumper()
+    analyzer = CommitAnalyzer()
+    
+    console.print("[cyan]Analyzing commits...[/]")
+    commits = git.get_commits_since_last_tag()
+    analysis = analyzer.analyze(commits)
+    
+    old_version, new_version = bumper.bump_version(
+        analysis.recommended_type,
+        dry_run=True
+    )
+    
+    console.print(Panel(
+        f"[bold]Release Preview[/]\n\n"
+        f"Current: {old_version}\n"
+        f"New: [green]{new_version}[/] ({analysis.recommended_type.value.upper()})\n"
+        f"Commits: {len(commits)}",
+        title="Preview",
+        border_style="green"
+    ))
+    
+    console.print("\n[bold]Summary:[/]")
+    console.print(analyzer.get_summary(analysis))
 
 
 @app.command()
@@ -93,6 +115,7 @@ def patch(
     plan: bool = typer.Option(False, "--plan", help="Dry run, don't make changes")
 ):
     """Create a PATCH release (bug fixes only)."""
+    from honk.release.analyzer import ReleaseType
     _execute_release(ReleaseType.PATCH, plan)
 
 
@@ -101,6 +124,7 @@ def minor(
     plan: bool = typer.Option(False, "--plan", help="Dry run, don't make changes")
 ):
     """Create a MINOR release (new features)."""
+    from honk.release.analyzer import ReleaseType
     _execute_release(ReleaseType.MINOR, plan)
 
 
@@ -109,47 +133,48 @@ def major(
     plan: bool = typer.Option(False, "--plan", help="Dry run, don't make changes")
 ):
     """Create a MAJOR release (breaking changes)."""
+    from honk.release.analyzer import ReleaseType
     _execute_release(ReleaseType.MAJOR, plan)
 
 
-def _execute_release(release_type: ReleaseType, dry_run: bool = False):
+@_with_error_handling
+def _execute_release(release_type: "ReleaseType", dry_run: bool = False):
     """Execute release workflow."""
-    try:
-        git = GitOperations()
-        bumper = VersionBumper()
-        
-        # Pre-flight checks
-        if not git.is_working_tree_clean():
-            console.print("[red]Error: Working tree is not clean![/]")
-            console.print("Commit or stash changes before releasing.")
-            raise typer.Exit(1)
-        
-        # Bump version
-        old_version, new_version = bumper.bump_version(release_type, dry_run=dry_run)
+    from honk.shared.git import GitOperations
+    from honk.release.versioning.bumper import VersionBumper
+    
+    git = GitOperations()
+    bumper = VersionBumper()
+    
+    # Pre-flight checks
+    if not git.is_working_tree_clean():
+        console.print("[red]Error: Working tree is not clean![/]")
+        console.print("Commit or stash changes before releasing.")
+        raise typer.Exit(1)
+    
+    # Bump version
+    old_version, new_version = bumper.bump_version(release_type, dry_run=dry_run)
+    
+    mode = "[yellow]DRY RUN[/]" if dry_run else "[green]RELEASE[/]"
+    console.print(f"\n{mode} {release_type.value.upper()}: {old_version} → {new_version}\n")
+    
+    if dry_run:
+        console.print("[yellow]No changes made (--plan mode)[/]")
+    else:
+        # Commit version changes
+        cwd = Path.cwd()
+        files = [str(f.relative_to(cwd)) for f in bumper.get_version_files()]
+        commit_msg = f"chore(release): bump version to {new_version}"
+        git.commit_files(files, commit_msg)
         
-        mode = "[yellow]DRY RUN[/]" if dry_run else "[green]RELEASE[/]"
-        console.print(f"\n{mode} {release_type.value.upper()}: {old_version} → {new_version}\n")
+        # Create tag
+        git.create_tag(str(new_version), f"Release {new_version}")
         
-        if dry_run:
-            console.print("[yellow]No changes made (--plan mode)[/]")
-        else:
-            # Commit version changes
-            files = [str(f.relative_to(Path.cwd())) for f in bumper.get_version_files()]
-            commit_msg = f"chore(release): bump version to {new_version}"
-            git.commit_files(files, commit_msg)
-            
-            # Create tag
-            git.create_tag(str(new_version), f"Release {new_version}")
-            
-            console.print(f"[green]✓[/] Version bumped to {new_version}")
-            console.print(f"[green]✓[/] Tag v{new_version} created")
-            console.print("\n[bold]Next steps:[/]")
-            console.print("  • Push commits: git push")
-            console.print(f"  • Push tag: git push origin v{new_version}")
-            
-    except Exception as e:
-        console.print(f"[red]Error:[/] {e}")
-        raise typer.Exit(1)
+        console.print(f"[green]✓[/] Version bumped to {new_version}")
+        console.print(f"[green]✓[/] Tag v{new_version} created")
+        console.print("\n[bold]Next steps:[/]")
+        console.print("  • Push commits: git push")
+        console.print(f"  • Push tag: git push origin v{new_version}")
 
 
 @app.callback(invoke_without_command=True)
@@ -161,4 +186,4 @@ def main(ctx: typer.Context):
     """
     if ctx.invoked_subcommand is None:
         # No subcommand = show status
-        status()
+        _print_status()
@@ -29,6 +29,10 @@ class CommitType(Enum):
             return None
 
 
+# Commit types that always appear in the changelog
+_CHANGELOG_TYPES = frozenset({CommitType.FEAT, CommitType.FIX})
+
+
 @dataclass
 class ParsedCommit:
     """Parsed conventional commit information."""
@@ -54,7 +58,7 @@ class ParsedCommit:
     def affects_changelog(self) -> bool:
         """Check if this commit should appear in changelog."""
         # Features, fixes, and breaking changes appear in changelog
-        return self.is_feature or self.is_fix or self.breaking
+        return self.type in _CHANGELOG_TYPES or self.breaking
 
 
 class ConventionalCommitParser:
@@ -76,9 +80,9 @@ class ConventionalCommitParser:
         Returns:
             ParsedCommit with extracted information
         """
-        lines = message.split('\n', 1)
-        subject = lines[0].strip()
-        body = lines[1].strip() if len(lines) > 1 else ""
+        subject, sep, body = message.partition('\n')
+        subject = subject.strip()
+        body = body.strip() if sep else ""
         
         # Parse subject line
         commit_type = None
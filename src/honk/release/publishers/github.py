@@ -1,20 +1,52 @@
 """GitHub Releases publisher."""
 
+import os
+import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:
+    import httpx
+
+GITHUB_API_URL = "https://api.github.com"
+
+# Maximum number of concurrent asset uploads
+MAX_PARALLEL_UPLOADS = 8
+
+# owner/name from git@github.com:owner/name.git or https://github.com/owner/name(.git)
+_GITHUB_REMOTE_RE = re.compile(r'github\.com[:/]([^/]+)/(.+?)(?:\.git)?/?$')
 
 
 class GitHubPublisher:
-    """Creates GitHub releases."""
+    """Creates GitHub releases.
+    
+    Uses the GitHub REST API when a token is available (``token`` argument,
+    ``GITHUB_TOKEN`` or ``GH_TOKEN``), otherwise falls back to the ``gh`` CLI.
+    """
     
-    def __init__(self, project_root: Optional[Path] = None):
+    def __init__(
+        self,
+        project_root: Optional[Path] = None,
+        token: Optional[str] = None,
+        repo: Optional[str] = None,
+        client: Optional["httpx.Client"] = None
+    ):
         """Initialize GitHub publisher.
         
         Args:
             project_root: Project root directory
+            token: GitHub API token (or from GITHUB_TOKEN/GH_TOKEN env vars)
+            repo: Repository as "owner/name" (or detected from origin remote)
+            client: Preconfigured HTTP client for the GitHub API, left open
+                for the caller to close (otherwise one is opened per release)
         """
         self.project_root = project_root or Path.cwd()
+        self.token = token or os.getenv("GITHUB_TOKEN") or os.getenv("GH_TOKEN")
+        self.repo = repo
+        self._client = client
     
     def create_release(
         self,
@@ -46,6 +78,18 @@ class GitHubPublisher:
                 print(f"  With {len(artifacts)} artifact(s)")
             return
         
+        if self._client is not None or self.token:
+            payload = {
+                "tag_name": tag,
+                "name": f"Release {version}",
+                "body": changelog,
+                "draft": draft,
+                "prerelease": prerelease,
+            }
+            with self._open_client() as client:
+                self._create_release_api(client, payload, artifacts or [])
+            return
+        
         # Build gh CLI command
         cmd = ["gh", "release", "create", tag]
         
@@ -60,14 +104,102 @@ class GitHubPublisher:
         
         # Add artifacts
         if artifacts:
-            cmd.extend(str(a) for a in artifacts)
+            cmd.extend(map(os.fspath, artifacts))
         
         result = subprocess.run(
             cmd,
             cwd=self.project_root,
-            capture_output=True,
+            stdout=None,  # Let progress output stream to the terminal
+            stderr=subprocess.PIPE,
             text=True
         )
         
         if result.returncode != 0:
             raise RuntimeError(f"GitHub release failed: {result.stderr}")
+    
+    def _open_client(self) -> AbstractContextManager["httpx.Client"]:
+        """Open an HTTP client for the GitHub API, closed when the release is done.
+        
+        A client passed to the constructor is reused and left open.
+        """
+        if self._client is not None:
+            return nullcontext(self._client)
+        
+        import httpx
+        
+        return httpx.Client(
+            base_url=GITHUB_API_URL,
+            headers={
+                "Accept": "application/vnd.github+json",
+                "Authorization": f"Bearer {self.token}",
+                "X-GitHub-Api-Version": "2022-11-28",
+            },
+            timeout=60.0
+        )
+    
+    def _get_repo(self) -> str:
+        """Get the "owner/name" slug of the repository to release.
+        
+        Raises:
+            RuntimeError: If the repository cannot be determined
+        """
+        if self.repo is None:
+            from honk.shared.git import GitOperations
+            
+            url = GitOperations(self.project_root).get_remote_url()
+            match = _GITHUB_REMOTE_RE.search(url or "")
+            if not match:
+                raise RuntimeError(
+                    "GitHub release failed: cannot determine repository from origin remote"
+                )
+            self.repo = f"{match.group(1)}/{match.group(2)}"
+        return self.repo
+    
+    def _create_release_api(
+        self, client: "httpx.Client", payload: Dict[str, Any], artifacts: List[Path]
+    ) -> None:
+        """Create release and upload artifacts through the REST API.
+        
+        Args:
+            client: HTTP client for the GitHub API
+            payload: Release creation request body
+            artifacts: Files to attach to release
+            
+        Raises:
+            RuntimeError: If release creation or an upload fails
+        """
+        response = client.post(f"/repos/{self._get_repo()}/releases", json=payload)
+        if response.status_code >= 400:
+            raise RuntimeError(f"GitHub release failed: {response.text}")
+        
+        # upload_url is a URI template: .../assets{?name,label}
+        upload_url = response.json()["upload_url"].split("{", 1)[0]
+        
+        if not artifacts:
+            return
+        
+        # Uploads are independent requests, run them concurrently on the shared client
+        with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_UPLOADS, len(artifacts))) as executor:
+            list(executor.map(lambda a: self._upload_artifact(client, upload_url, a), artifacts))
+    
+    def _upload_artifact(self, client: "httpx.Client", upload_url: str, artifact: Path) -> None:
+        """Upload a single release asset.
+        
+        Args:
+            client: HTTP client for the GitHub API
+            upload_url: Release asset upload URL
+            artifact: File to upload
+            
+        Raises:
+            RuntimeError: If the upload fails
+        """
+        upload = client.post(
+            upload_url,
+            params={"name": artifact.name},
+            content=artifact.read_bytes(),
+            headers={"Content-Type": "application/octet-stream"}
+        )
+        if upload.status_code >= 400:
+            raise RuntimeError(
+                f"GitHub release failed: uploading {artifact.name}: {upload.text}"
+            )
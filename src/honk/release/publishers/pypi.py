@@ -61,12 +61,13 @@ class PyPIPublisher:
         if repository != "pypi":
             cmd.extend(["--publish-url", "https://upload.pypi.org/legacy/"])
         
-        cmd.extend(str(a) for a in artifacts)
+        cmd.extend(map(os.fspath, artifacts))
         
         result = subprocess.run(
             cmd,
             cwd=self.project_root,
-            capture_output=True,
+            stdout=None,  # Let progress output stream to the terminal
+            stderr=subprocess.PIPE,
             text=True
         )
         
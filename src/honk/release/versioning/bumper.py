@@ -1,12 +1,31 @@
 """Semantic version bumper."""
 
+import mmap
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional
 
 from honk.release.analyzer import ReleaseType
 
+# Matches the top-level `version = "x.y.z"` line in pyproject.toml
+_PYPROJECT_VERSION_RE = re.compile(rb'^version\s*=\s*"([^"]+)"', re.MULTILINE)
+
+# Semantic version: MAJOR.MINOR.PATCH[-PRERELEASE][+BUILD]
+_SEMVER_RE = re.compile(
+    r'^(\d+)\.(\d+)\.(\d+)(?:-([0-9A-Za-z.\-]+))?(?:\+([0-9A-Za-z.\-]+))?$'
+)
+
+
+def _read_text_if_exists(path: Path) -> Optional[str]:
+    """Read a text file, returning None if it doesn't exist."""
+    try:
+        return path.read_text()
+    except FileNotFoundError:
+        return None
+
 
 @dataclass
 class Version:
@@ -32,12 +51,9 @@ class Version:
             ValueError: If version string is invalid
         """
         # Remove 'v' prefix if present
-        if version_string.startswith('v'):
-            version_string = version_string[1:]
+        version_string = version_string.removeprefix('v')
         
-        # Parse with regex
-        pattern = r'^(\d+)\.(\d+)\.(\d+)(?:-([0-9A-Za-z-\.]+))?(?:\+([0-9A-Za-z-\.]+))?$'
-        match = re.match(pattern, version_string)
+        match = _SEMVER_RE.match(version_string)
         
         if not match:
             raise ValueError(f"Invalid version string: {version_string}")
@@ -117,6 +133,10 @@ class VersionBumper:
             project_root: Project root directory (defaults to current directory)
         """
         self.project_root = project_root or Path.cwd()
+        self._version_files = (
+            self.project_root / "pyproject.toml",
+            self.project_root / "src" / "honk" / "__init__.py",
+        )
     
     def get_current_version(self) -> Version:
         """Get current version from pyproject.toml.
@@ -133,32 +153,37 @@ class VersionBumper:
         if not pyproject_path.exists():
             raise FileNotFoundError(f"pyproject.toml not found at {pyproject_path}")
         
-        content = pyproject_path.read_text()
-        
-        # Find version line
-        pattern = r'version\s*=\s*"([^"]+)"'
-        match = re.search(pattern, content)
+        # Scan the raw bytes instead of decoding the whole file
+        version_bytes = None
+        with open(pyproject_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size > 0:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    match = _PYPROJECT_VERSION_RE.search(mm)
+                    if match:
+                        version_bytes = match.group(1)
         
-        if not match:
+        if version_bytes is None:
             raise ValueError("Version not found in pyproject.toml")
         
-        return Version.parse(match.group(1))
+        return Version.parse(version_bytes.decode("utf-8"))
     
     def bump_version(
         self,
         release_type: ReleaseType,
-        dry_run: bool = False
+        dry_run: bool = False,
+        current_version: Optional[Version] = None
     ) -> tuple[Version, Version]:
         """Bump version in project files.
         
         Args:
             release_type: Type of release (MAJOR, MINOR, PATCH)
             dry_run: If True, don't modify files
+            current_version: Version already read with get_current_version
             
         Returns:
             Tuple of (old_version, new_version)
         """
-        old_version = self.get_current_version()
+        old_version = current_version if current_version is not None else self.get_current_version()
         new_version = old_version.bump(release_type)
         
         if not dry_run:
@@ -173,36 +198,36 @@ class VersionBumper:
             old_version: Current version
             new_version: New version
         """
-        files_to_update = [
-            self.project_root / "pyproject.toml",
-            self.project_root / "src" / "honk" / "__init__.py",
-        ]
-        
         new_str = str(new_version)
         
-        for file_path in files_to_update:
-            if not file_path.exists():
-                continue
+        # Version files are independent, so overlap their reads and writes
+        with ThreadPoolExecutor(max_workers=len(self._version_files)) as executor:
+            contents = list(executor.map(_read_text_if_exists, self._version_files))
+            updates = []
             
-            content = file_path.read_text()
+            for file_path, content in zip(self._version_files, contents):
+                if content is None:
+                    continue
+                
+                # Update version string
+                if file_path.name == "pyproject.toml":
+                    # Update TOML format: version = "x.y.z"
+                    content = re.sub(
+                        r'version\s*=\s*"[^"]+"',
+                        f'version = "{new_str}"',
+                        content
+                    )
+                else:
+                    # Update Python format: __version__ = "x.y.z"
+                    content = re.sub(
+                        r'__version__\s*=\s*"[^"]+"',
+                        f'__version__ = "{new_str}"',
+                        content
+                    )
+                
+                updates.append((file_path, content))
             
-            # Update version string
-            if "pyproject.toml" in str(file_path):
-                # Update TOML format: version = "x.y.z"
-                content = re.sub(
-                    r'version\s*=\s*"[^"]+"',
-                    f'version = "{new_str}"',
-                    content
-                )
-            else:
-                # Update Python format: __version__ = "x.y.z"
-                content = re.sub(
-                    r'__version__\s*=\s*"[^"]+"',
-                    f'__version__ = "{new_str}"',
-                    content
-                )
-            
-            file_path.write_text(content)
+            list(executor.map(lambda update: update[0].write_text(update[1]), updates))
     
     def get_version_files(self) -> List[Path]:
         """Get list of files that contain version strings.
@@ -210,7 +235,4 @@ class VersionBumper:
         Returns:
             List of file paths
         """
-        return [
-            self.project_root / "pyproject.toml",
-            self.project_root / "src" / "honk" / "__init__.py",
-        ]
+        return list(self._version_files)
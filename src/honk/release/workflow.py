@@ -1,5 +1,6 @@
 """Release workflow orchestration."""
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
@@ -56,8 +57,15 @@ class ReleaseWorkflow:
             ReleaseResult with operation details
         """
         try:
+            # Pre-flight queries are independent, run them concurrently; results
+            # are still checked in order (dirty tree, no commits, version errors)
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                f_commits = executor.submit(self.git.get_commits_since_last_tag)
+                f_clean = None if dry_run else executor.submit(self.git.is_working_tree_clean)
+                f_version = executor.submit(self.bumper.get_current_version)
+            
             # 1. Pre-flight checks
-            if not dry_run and not self.git.is_working_tree_clean():
+            if f_clean is not None and not f_clean.result():
                 return ReleaseResult(
                     success=False,
                     old_version="",
@@ -68,7 +76,7 @@ class ReleaseWorkflow:
                 )
             
             # 2. Analyze commits
-            commits = self.git.get_commits_since_last_tag()
+            commits = f_commits.result()
             if not commits:
                 return ReleaseResult(
                     success=False,
@@ -87,11 +95,16 @@ class ReleaseWorkflow:
             # 3. Bump version
             old_version, new_version = self.bumper.bump_version(
                 final_release_type,
-                dry_run=dry_run
+                dry_run=dry_run,
+                current_version=f_version.result()
             )
             
             # 4. Generate changelog
-            changelog = self.changelog_gen.generate(commits, str(new_version))
+            changelog = self.changelog_gen.generate(
+                analysis.commits,
+                str(new_version),
+                parsed_commits=analysis.parsed
+            )
             
             # 5. Commit and tag (if not dry run)
             commit_sha = None
@@ -1,12 +1,14 @@
 """Result envelope for honk CLI commands."""
 
 from typing import Any, Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Link(BaseModel):
     """Link to related resources."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     rel: str
     href: str
 
@@ -14,6 +16,8 @@ class Link(BaseModel):
 class NextStep(BaseModel):
     """Suggested next command to run."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     run: list[str]
     summary: str
 
@@ -21,6 +25,8 @@ class NextStep(BaseModel):
 class PackResult(BaseModel):
     """Result from a doctor pack check."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     pack: str
     status: Literal["ok", "failed", "skipped"]
     duration_ms: int
@@ -29,6 +35,8 @@ class PackResult(BaseModel):
 class ResultEnvelope(BaseModel):
     """Standard result envelope for all honk commands."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     version: str = Field(default="1.0")
     command: list[str]
     status: str
@@ -1,13 +1,35 @@
 """Shared Git operations for Honk tools."""
 
+import functools
+import os
+import re
 import subprocess
-from dataclasses import dataclass
-from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, TypeVar
 
+try:
+    import pygit2
+    from pygit2.enums import DescribeStrategy, SortMode
 
-@dataclass
+    HAS_PYGIT2 = True
+except ImportError:
+    HAS_PYGIT2 = False
+
+
+# Conventional commit subject: type(scope)!: description
+_CONVENTIONAL_SUBJECT_RE = re.compile(
+    r'^(?P<type>\w+)(?:\((?P<scope>[^)]*)\))?(?P<bang>!)?:\s*(?P<description>.*)$'
+)
+
+# Breaking change footer anywhere in the body
+_BREAKING_BODY_RE = re.compile(r'BREAKING[ -]CHANGE', re.IGNORECASE)
+
+
+@dataclass(slots=True, frozen=True)
 class Commit:
     """Represents a Git commit."""
     
@@ -19,56 +41,122 @@ class Commit:
     message: str
     body: str
     
+    # Parsed once from the subject in __post_init__
+    _subject: str = field(init=False, repr=False, compare=False)
+    _type: Optional[str] = field(init=False, repr=False, compare=False)
+    _scope: Optional[str] = field(init=False, repr=False, compare=False)
+    _description: str = field(init=False, repr=False, compare=False)
+    _breaking_prefix: bool = field(init=False, repr=False, compare=False)
+    _breaking_body: Optional[bool] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        """Parse the conventional commit subject."""
+        subject = self.message.partition('\n')[0]
+        match = _CONVENTIONAL_SUBJECT_RE.match(subject)
+        
+        # Frozen dataclass: derived fields must bypass __setattr__
+        set_field = object.__setattr__
+        set_field(self, '_subject', subject)
+        if match:
+            set_field(self, '_type', match['type'].lower())
+            set_field(self, '_scope', match['scope'])
+            set_field(self, '_description', match['description'].strip())
+            set_field(self, '_breaking_prefix', match['bang'] is not None)
+        else:
+            set_field(self, '_type', None)
+            set_field(self, '_scope', None)
+            set_field(self, '_description', subject)
+            set_field(self, '_breaking_prefix', False)
+    
     @property
     def subject(self) -> str:
         """First line of commit message."""
-        return self.message.split('\n')[0]
+        return self._subject
     
     @property
     def type(self) -> Optional[str]:
         """Conventional commit type (feat, fix, etc.)."""
-        subject = self.subject
-        if ':' in subject:
-            prefix = subject.split(':')[0].strip()
-            # Handle scope: feat(scope): message
-            if '(' in prefix:
-                prefix = prefix.split('(')[0]
-            return prefix.lower()
-        return None
+        return self._type
     
     @property
     def scope(self) -> Optional[str]:
         """Conventional commit scope."""
-        subject = self.subject
-        if '(' in subject and ')' in subject:
-            start = subject.index('(') + 1
-            end = subject.index(')')
-            return subject[start:end]
-        return None
+        return self._scope
     
     @property
     def description(self) -> str:
         """Commit description (after type and scope)."""
-        subject = self.subject
-        if ':' in subject:
-            return subject.split(':', 1)[1].strip()
-        return subject
+        return self._description
     
     def is_breaking(self) -> bool:
         """Check if this is a breaking change."""
         # Check for ! in type: feat!: or fix!:
-        if '!' in self.subject and ':' in self.subject:
-            prefix = self.subject.split(':')[0]
-            if '!' in prefix:
-                return True
+        if self._breaking_prefix:
+            return True
         
-        # Check for BREAKING CHANGE in body
-        body_upper = self.body.upper()
-        return 'BREAKING CHANGE' in body_upper or 'BREAKING-CHANGE' in body_upper
+        # Check for BREAKING CHANGE in body (scanned once, then cached)
+        if self._breaking_body is not None:
+            return self._breaking_body
+        
+        breaking_body = _BREAKING_BODY_RE.search(self.body) is not None
+        object.__setattr__(self, '_breaking_body', breaking_body)
+        return breaking_body
+
+
+# Fields per commit in the `git log -z` format used below
+_LOG_FIELD_COUNT = 7
+
+# Read size for streamed git output
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Commit-graph files, relative to the (common) git directory
+_COMMIT_GRAPH_PATHS = (
+    Path('objects/info/commit-graph'),
+    Path('objects/info/commit-graphs/commit-graph-chain'),
+)
+
+# Git directories already known to have a commit-graph
+_repos_with_commit_graph: Set[Path] = set()
+
+
+def _git_env() -> Dict[str, str]:
+    """Environment for git subprocesses.
+    
+    GIT_OPTIONAL_LOCKS=0 stops read-only commands such as `git status` from
+    taking the index lock to write back refreshed stat data.
+    """
+    return {**os.environ, 'GIT_OPTIONAL_LOCKS': '0'}
+
+
+def _decode_output(output: bytes) -> str:
+    """Decode a short git command output to stripped text."""
+    return output.decode('utf-8', 'replace').strip()
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _cached_query(method: F) -> F:
+    """Cache a read-only query on the GitOperations instance.
+    
+    Results are reused until `GitOperations.invalidate_cache()` is called,
+    which every write operation does.
+    """
+    @functools.wraps(method)
+    def wrapper(self: "GitOperations", *args: Any, **kwargs: Any) -> Any:
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        if key not in self._cache:
+            self._cache[key] = method(self, *args, **kwargs)
+        return self._cache[key]
+    return wrapper  # type: ignore[return-value]
 
 
 class GitOperations:
-    """Git operations for release automation."""
+    """Git operations for release automation.
+    
+    Read-only history queries go through libgit2 in-process when pygit2 is
+    installed; everything else (and the fallback) runs the git CLI.
+    """
     
     def __init__(self, repo_path: Optional[Path] = None):
         """Initialize Git operations.
@@ -77,6 +165,30 @@ class GitOperations:
             repo_path: Path to git repository (defaults to current directory)
         """
         self.repo_path = repo_path or Path.cwd()
+        self._repo = self._open_repository()
+        self._cache: Dict[Tuple[Any, ...], Any] = {}
+    
+    def invalidate_cache(self) -> None:
+        """Forget cached query results (called after any write)."""
+        self._cache.clear()
+    
+    def _open_repository(self) -> Optional["pygit2.Repository"]:
+        """Open the repository with libgit2.
+        
+        Returns:
+            Repository, or None if pygit2 is not installed or no repository was found
+        """
+        if not HAS_PYGIT2:
+            return None
+        
+        git_dir = pygit2.discover_repository(str(self.repo_path))
+        if git_dir is None:
+            return None
+        
+        try:
+            return pygit2.Repository(git_dir)
+        except pygit2.GitError:
+            return None
     
     def _run_git(self, *args: str, check: bool = True) -> subprocess.CompletedProcess:
         """Run a git command.
@@ -86,12 +198,13 @@ class GitOperations:
             check: Raise exception on non-zero exit code
             
         Returns:
-            CompletedProcess result
+            CompletedProcess result (stdout/stderr as bytes)
         """
         return subprocess.run(
-            ['git', '-C', str(self.repo_path), *args],
+            ['git', *args],
+            cwd=self.repo_path,
+            env=_git_env(),
             capture_output=True,
-            text=True,
             check=check
         )
     
@@ -101,79 +214,254 @@ class GitOperations:
         Returns:
             Version string (e.g., "0.1.0") or None if no tags
         """
-        result = self._run_git('describe', '--tags', '--abbrev=0', check=False)
-        if result.returncode != 0:
+        tag = self._get_last_tag()
+        if tag is None:
             return None
         
-        tag = result.stdout.strip()
         # Remove 'v' prefix if present
         if tag.startswith('v'):
             tag = tag[1:]
         return tag
     
-    def get_commits_since_last_tag(self) -> List[Commit]:
+    @_cached_query
+    def _get_last_tag(self) -> Optional[str]:
+        """Get the most recent tag reachable from HEAD.
+        
+        Returns:
+            Tag name or None if there are no tags
+        """
+        if self._repo is not None:
+            try:
+                return self._repo.describe(
+                    describe_strategy=DescribeStrategy.TAGS,
+                    abbreviated_size=0
+                )
+            except (KeyError, pygit2.GitError):
+                return None
+        
+        result = self._run_git('describe', '--tags', '--abbrev=0', check=False)
+        if result.returncode != 0:
+            return None
+        return _decode_output(result.stdout)
+    
+    def get_commits_since_last_tag(self, limit: Optional[int] = None) -> List[Commit]:
         """Get all commits since the last tag.
         
+        Args:
+            limit: Maximum number of commits to return (all of them by default,
+                the whole history when there are no tags yet)
+            
         Returns:
             List of Commit objects
         """
+        return list(self.iter_commits_since_last_tag(limit))
+    
+    def iter_commits_since_last_tag(self, limit: Optional[int] = None) -> Iterator[Commit]:
+        """Iterate over commits since the last tag, newest first.
+        
+        Commits are produced as git log output is read, so callers that stop
+        early don't pay for the rest of the history.
+        
+        Args:
+            limit: Maximum number of commits to yield
+            
+        Yields:
+            Commit objects
+        """
         # Get last tag
-        last_tag_result = self._run_git('describe', '--tags', '--abbrev=0', check=False)
+        last_tag = self._get_last_tag()
+        
+        if self._repo is not None:
+            yield from islice(self._walk_commits(last_tag), limit)
+            return
         
-        if last_tag_result.returncode == 0:
-            last_tag = last_tag_result.stdout.strip()
+        if last_tag is not None:
             rev_range = f"{last_tag}..HEAD"
         else:
             # No tags yet, get all commits
             rev_range = "HEAD"
         
-        # Get commit list
-        result = self._run_git(
+        log_args = [rev_range]
+        if limit is not None:
+            log_args.append(f'--max-count={limit}')
+        
+        # With -z every field and every record is NUL-terminated, and commit
+        # messages can't contain NUL, so each commit is exactly 7 fields
+        fields: List[bytes] = []
+        for raw_field in self._stream_git_fields(
             'log',
-            rev_range,
-            '--format=%H%x00%h%x00%an%x00%ae%x00%aI%x00%s%x00%b%x00',
+            *log_args,
+            '-z',
+            '--format=%H%x00%h%x00%an%x00%ae%x00%aI%x00%s%x00%b',
             '--no-merges'
-        )
-        
-        commits = []
-        for line in result.stdout.split('\x00\x00'):
-            line = line.strip()
-            if not line:
+        ):
+            fields.append(raw_field)
+            if len(fields) < _LOG_FIELD_COUNT:
                 continue
             
-            parts = line.split('\x00')
-            if len(parts) < 7:
-                continue
-            
-            sha, short_sha, author, email, date_str, subject, body = parts[:7]
+            sha, short_sha, author, email, date_str, subject, body = (
+                f.decode('utf-8', 'replace') for f in fields
+            )
+            fields = []
             
-            # Parse date
+            # Parse date (%aI is strict ISO 8601, which fromisoformat accepts as-is)
             try:
-                date = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+                date = datetime.fromisoformat(date_str)
             except ValueError:
                 date = datetime.now()
             
-            commits.append(Commit(
+            yield Commit(
                 sha=sha,
                 short_sha=short_sha,
                 author=author,
                 email=email,
                 date=date,
                 message=subject,
-                body=body
-            ))
+                body=body.strip()
+            )
+    
+    def _git_common_dir(self) -> Optional[Path]:
+        """Locate the git directory that holds the object database.
+        
+        Returns:
+            Path to the common git directory, or None outside a repository
+        """
+        if self._repo is not None:
+            git_dir = Path(self._repo.path)
+            # Linked worktrees point at the main repository's git directory
+            commondir = git_dir / 'commondir'
+            if commondir.is_file():
+                git_dir = git_dir / commondir.read_text().strip()
+            return git_dir
+        
+        result = self._run_git('rev-parse', '--git-common-dir', check=False)
+        if result.returncode != 0:
+            return None
+        return self.repo_path / _decode_output(result.stdout)
+    
+    def ensure_commit_graph(self) -> None:
+        """Write a commit-graph for the repository if it doesn't have one.
+        
+        The commit-graph lets git (and libgit2) walk history without parsing
+        commit objects, and --changed-paths adds Bloom filters for path
+        limited logs. This writes into the repository, so only mutating
+        commands call it; the result is cached per git directory. Failures
+        (e.g. a read-only or shallow repository) are ignored.
+        """
+        git_dir = self._git_common_dir()
+        if git_dir is None or git_dir in _repos_with_commit_graph:
+            return
+        
+        if not any((git_dir / path).exists() for path in _COMMIT_GRAPH_PATHS):
+            result = self._run_git(
+                'commit-graph', 'write', '--reachable', '--changed-paths', check=False
+            )
+            if result.returncode != 0:
+                return
+        
+        _repos_with_commit_graph.add(git_dir)
+    
+    def _stream_git_fields(self, *args: str) -> Iterator[bytes]:
+        """Run a git command and yield its NUL-separated output fields.
+        
+        Output is read in chunks; only the current partial field is buffered.
+        
+        Args:
+            *args: Git command arguments
+            
+        Yields:
+            Raw field bytes
+            
+        Raises:
+            subprocess.CalledProcessError: If git exits with non-zero status
+        """
+        cmd = ['git', *args]
+        with subprocess.Popen(
+            cmd,
+            cwd=self.repo_path,
+            env=_git_env(),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        ) as proc:
+            assert proc.stdout is not None and proc.stderr is not None
+            try:
+                carry = b''
+                while chunk := proc.stdout.read(_STREAM_CHUNK_SIZE):
+                    *complete, carry = (carry + chunk).split(b'\x00')
+                    yield from complete
+                if carry:
+                    yield carry
+                
+                stderr = proc.stderr.read()
+                if proc.wait() != 0:
+                    raise subprocess.CalledProcessError(
+                        proc.returncode, cmd, stderr=stderr.decode('utf-8', 'replace')
+                    )
+            finally:
+                # Consumer stopped early: don't wait for the rest of the log
+                if proc.poll() is None:
+                    proc.kill()
+    
+    def _walk_commits(self, last_tag: Optional[str]) -> Iterator[Commit]:
+        """Walk non-merge commits from HEAD back to last_tag with libgit2.
         
-        return commits
+        Args:
+            last_tag: Tag to stop at (or None to walk the whole history)
+            
+        Yields:
+            Commit objects, newest first
+        """
+        assert self._repo is not None
+        repo = self._repo
+        
+        # Same order as git log: newest first, never a parent before its children
+        walker = repo.walk(repo.head.target, SortMode.TOPOLOGICAL | SortMode.TIME)
+        if last_tag is not None:
+            walker.hide(repo.revparse_single(last_tag).peel(pygit2.Commit).id)
+        
+        for git_commit in walker:
+            # Equivalent of --no-merges
+            if len(git_commit.parent_ids) > 1:
+                continue
+            
+            author = git_commit.author
+            # Same split as git's %s (first paragraph, unwrapped) and %b
+            subject, _, body = git_commit.message.partition('\n\n')
+            
+            yield Commit(
+                sha=str(git_commit.id),
+                short_sha=git_commit.short_id,
+                author=author.name,
+                email=author.email,
+                date=datetime.fromtimestamp(
+                    author.time,
+                    timezone(timedelta(minutes=author.offset))
+                ),
+                message=' '.join(subject.strip().splitlines()),
+                body=body.strip()
+            )
     
+    # Not cached: the working tree changes without going through GitOperations
+    # (the release bumper rewrites version files directly)
     def is_working_tree_clean(self) -> bool:
         """Check if working tree is clean (no uncommitted changes).
         
         Returns:
             True if clean, False if there are uncommitted changes
         """
-        result = self._run_git('status', '--porcelain')
-        return len(result.stdout.strip()) == 0
+        # Unstaged, then staged changes; each diff stops at the first difference
+        for args in (('diff', '--quiet'), ('diff', '--cached', '--quiet')):
+            result = self._run_git(*args, check=False)
+            if result.returncode == 1:
+                return False
+            result.check_returncode()
+        
+        result = self._run_git(
+            'ls-files', '--others', '--exclude-standard', '--directory', '--no-empty-directory', '-z'
+        )
+        return not result.stdout
     
+    @_cached_query
     def get_current_branch(self) -> str:
         """Get current branch name.
         
@@ -181,7 +469,7 @@ class GitOperations:
             Branch name
         """
         result = self._run_git('rev-parse', '--abbrev-ref', 'HEAD')
-        return result.stdout.strip()
+        return _decode_output(result.stdout)
     
     def create_tag(self, version: str, message: str) -> None:
         """Create an annotated tag.
@@ -192,6 +480,7 @@ class GitOperations:
         """
         tag_name = f"v{version}"
         self._run_git('tag', '-a', tag_name, '-m', message)
+        self.invalidate_cache()
     
     def push_tag(self, version: str) -> None:
         """Push a tag to remote.
@@ -201,10 +490,14 @@ class GitOperations:
         """
         tag_name = f"v{version}"
         self._run_git('push', 'origin', tag_name)
+        self.invalidate_cache()
     
     def commit_files(self, files: List[str], message: str) -> str:
         """Stage and commit files.
         
+        Uses `git commit --only` so staging and committing happen in one
+        git invocation. The files must already be tracked.
+        
         Args:
             files: List of file paths to commit
             message: Commit message
@@ -212,15 +505,18 @@ class GitOperations:
         Returns:
             Commit SHA
         """
-        # Stage files
-        self._run_git('add', *files)
+        self._run_git('commit', '-m', message, '--only', '--', *files)
+        self.invalidate_cache()
+        
+        # Already writing to the repository: speed up later history walks
+        self.ensure_commit_graph()
         
-        # Commit
-        self._run_git('commit', '-m', message)
+        # Read the new HEAD in-process when possible
+        if self._repo is not None:
+            return str(self._repo.head.target)
         
-        # Get commit SHA
         result = self._run_git('rev-parse', 'HEAD')
-        return result.stdout.strip()
+        return _decode_output(result.stdout)
     
     def push_commits(self, branch: Optional[str] = None) -> None:
         """Push commits to remote.
@@ -231,7 +527,9 @@ class GitOperations:
         if branch is None:
             branch = self.get_current_branch()
         self._run_git('push', 'origin', branch)
+        self.invalidate_cache()
     
+    @_cached_query
     def has_remote(self, remote: str = 'origin') -> bool:
         """Check if remote exists.
         
@@ -243,3 +541,40 @@ class GitOperations:
         """
         result = self._run_git('remote', 'get-url', remote, check=False)
         return result.returncode == 0
+    
+    @_cached_query
+    def get_remote_url(self, remote: str = 'origin') -> Optional[str]:
+        """Get the URL of a remote.
+        
+        Args:
+            remote: Remote name
+            
+        Returns:
+            Remote URL or None if the remote doesn't exist
+        """
+        result = self._run_git('remote', 'get-url', remote, check=False)
+        if result.returncode != 0:
+            return None
+        return _decode_output(result.stdout)
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Run the independent read-only queries concurrently.
+        
+        Each query is a separate git subprocess, so running them in threads
+        overlaps their startup cost. Results are cached like the individual
+        queries, except the working tree check, which always runs.
+        
+        Returns:
+            Dict with "version", "branch", "clean" and "has_remote" keys
+        """
+        queries: Dict[str, Callable[[], Any]] = {
+            'version': self.get_current_version,
+            'branch': self.get_current_branch,
+            'clean': self.is_working_tree_clean,
+            'has_remote': self.has_remote,
+        }
+        with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+            futures: Dict[str, Future[Any]] = {
+                key: executor.submit(query) for key, query in queries.items()
+            }
+            return {key: future.result() for key, future in futures.items()}
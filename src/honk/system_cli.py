@@ -4,8 +4,9 @@ import sys
 import typer
 import json
 import os
-import psutil
+import pwd
 import time
+from operator import attrgetter, itemgetter
 
 from .result import EXIT_OK, EXIT_SYSTEM
 from .ui import console, print_error
@@ -13,31 +14,59 @@ from .watchdog.pty_scanner import scan_ptys
 
 system_app = typer.Typer(help="System diagnostics suite")
 
+# Sort keys that run in C rather than through a lambda per item
+_pty_count = attrgetter("pty_count")
 
-def get_process_count():
-    """Get the total number of processes for the current user."""
-    import subprocess
-    result = subprocess.run(['ps', '-U', str(os.getuid())], capture_output=True, text=True)
-    return len(result.stdout.strip().split('\n'))
+
+def _current_username() -> str:
+    """Get the login name psutil reports for processes owned by this user."""
+    try:
+        return pwd.getpwuid(os.getuid()).pw_name
+    except KeyError:
+        return os.environ.get('USER', '')
+
+
+# Resolved once per invocation instead of per process in the scan loops
+_CURRENT_USER = _current_username()
+
+
+def collect_system_facts() -> dict:
+    """Collect the facts reported by ``system summary``.
+    
+    PTY holders come from the lsof-based PTY scanner; all per-process
+    aggregates are built in a single psutil process table pass.
+    """
+    import psutil
+    
+    pty_scan = scan_ptys()
+    
+    uid = os.getuid()
+    total_process_count = 0
+    user_process_count = 0
+    for p in psutil.process_iter(['uids']):
+        total_process_count += 1
+        if p.info['uids'] is not None and p.info['uids'].real == uid:
+            user_process_count += 1
+    
+    return {
+        "pty_usage": {
+            "total_ptys": pty_scan.total_ptys,
+            "process_count": len(pty_scan.processes),
+        },
+        "process_usage": {
+            "user_process_count": user_process_count,
+            "total_process_count": total_process_count,
+        }
+    }
 
 
 @system_app.command("summary")
 def summary(json_output: bool = typer.Option(False, "--json", help="Output as JSON")):
     """A high-level dashboard of system health."""
     try:
-        pty_processes = scan_ptys()
-        total_ptys = sum(p.pty_count for p in pty_processes.values())
-        user_process_count = get_process_count()
-        
-        facts = {
-            "pty_usage": {
-                "total_ptys": total_ptys,
-                "process_count": len(pty_processes),
-            },
-            "process_usage": {
-                "user_process_count": user_process_count,
-            }
-        }
+        facts = collect_system_facts()
+        total_ptys = facts["pty_usage"]["total_ptys"]
+        user_process_count = facts["process_usage"]["user_process_count"]
         
         if json_output:
             print(json.dumps({"command": "system summary", "status": "ok", "facts": facts}, indent=2))
@@ -60,25 +89,38 @@ def processes(
     top: int = typer.Option(10, "--top", help="Number of processes to show."),
 ):
     """Show running processes, sorted by CPU or memory."""
+    import psutil
+
     try:
-        procs = []
-        for p in psutil.process_iter(['pid', 'name', 'username', 'cpu_percent', 'memory_percent']):
-            if p.info['username'] == os.getlogin():
-                procs.append(p.info)
+        if sort_by not in ('cpu', 'mem'):
+            print_error(f"Invalid sort key: {sort_by}")
+            raise typer.Exit(1)
+
+        # Keep the live Process objects so CPU is sampled on the same handle
+        user_procs = [
+            p for p in psutil.process_iter(['pid', 'name', 'username', 'memory_percent'])
+            if p.info['username'] == _CURRENT_USER
+        ]
 
         if sort_by == 'cpu':
-            time.sleep(0.1)
-            for p in procs:
+            # First call primes the CPU counters; the second returns usage since then
+            for p in user_procs:
                 try:
-                    p['cpu_percent'] = psutil.Process(p['pid']).cpu_percent()
-                except psutil.NoSuchProcess:
-                    p['cpu_percent'] = 0
-            procs.sort(key=lambda x: x['cpu_percent'], reverse=True)
-        elif sort_by == 'mem':
-            procs.sort(key=lambda x: x['memory_percent'], reverse=True)
-        else:
-            print_error(f"Invalid sort key: {sort_by}")
-            raise typer.Exit(1)
+                    p.cpu_percent()
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    pass
+            time.sleep(0.1)
+
+        procs = []
+        for p in user_procs:
+            try:
+                p.info['cpu_percent'] = p.cpu_percent() if sort_by == 'cpu' else 0.0
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                p.info['cpu_percent'] = 0.0
+            procs.append(p.info)
+
+        sort_key = 'cpu_percent' if sort_by == 'cpu' else 'memory_percent'
+        procs.sort(key=lambda x: x[sort_key] or 0.0, reverse=True)
 
         from rich.table import Table
         table = Table(title=f"Top {top} Processes by {sort_by.upper()} Usage")
@@ -107,7 +149,7 @@ def processes(
 def pty(json_output: bool = typer.Option(False, "--json", help="Output as JSON")):
     """A detailed report of all processes currently holding PTYs."""
     try:
-        pty_processes = scan_ptys()
+        pty_processes = scan_ptys().processes
         
         if json_output:
             facts = [
@@ -128,7 +170,7 @@ def pty(json_output: bool = typer.Option(False, "--json", help="Output as JSON")
             table.add_column("PTY Count", justify="right")
             table.add_column("PTYs")
 
-            sorted_procs = sorted(pty_processes.values(), key=lambda p: p.pty_count, reverse=True)
+            sorted_procs = sorted(pty_processes.values(), key=_pty_count, reverse=True)
 
             for p in sorted_procs:
                 pty_list = ", ".join(p.ptys)
@@ -154,6 +196,8 @@ def fds(
     pid: int = typer.Option(None, "--pid", help="Show open files for a specific PID."),
 ):
     """Report on file descriptor usage."""
+    import psutil
+
     try:
         from rich.table import Table
         if pid:
@@ -169,14 +213,14 @@ def fds(
         else:
             procs = []
             for p in psutil.process_iter(['pid', 'name', 'username']):
-                if p.info['username'] == os.getlogin():
+                if p.info['username'] == _CURRENT_USER:
                     try:
                         p.info['num_fds'] = p.num_fds()
                         procs.append(p.info)
                     except psutil.AccessDenied:
                         pass
             
-            procs.sort(key=lambda x: x['num_fds'], reverse=True)
+            procs.sort(key=itemgetter('num_fds'), reverse=True)
 
             table = Table(title=f"Top {top} Processes by File Descriptor Count")
             table.add_column("PID", justify="right")
@@ -206,12 +250,24 @@ def network(
     kind: str = typer.Option("listen", "--kind", help="Show 'listen' or 'established' connections."),
 ):
     """Show network connections."""
+    import psutil
+
     try:
         if kind not in ["listen", "established"]:
             print_error("Invalid kind: must be 'listen' or 'established'")
             raise typer.Exit(1)
 
-        connections = psutil.net_connections(kind='inet')
+        # Only TCP sockets have LISTEN/ESTABLISHED states
+        status = psutil.CONN_LISTEN if kind == "listen" else psutil.CONN_ESTABLISHED
+        connections = [c for c in psutil.net_connections(kind='tcp') if c.status == status]
+        
+        # Resolve process names once per PID rather than once per connection
+        names = {}
+        for pid in {conn.pid for conn in connections if conn.pid is not None}:
+            try:
+                names[pid] = psutil.Process(pid).name()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                names[pid] = "?"
         
         from rich.table import Table
         title = f"Network Connections (Status: {kind.upper()})"
@@ -223,23 +279,22 @@ def network(
         table.add_column("Status")
 
         for conn in connections:
-            if conn.status and conn.status.lower() == kind:
-                try:
-                    p = psutil.Process(conn.pid)
-                    proc_name = p.name()
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    proc_name = "?"
-
-                laddr = f"{conn.laddr.ip}:{conn.laddr.port}" if conn.laddr else ""
-                raddr = f"{conn.raddr.ip}:{conn.raddr.port}" if conn.raddr else ""
-                
-                table.add_row(
-                    str(conn.pid) if conn.pid else "",
-                    proc_name,
-                    laddr,
-                    raddr,
-                    conn.status
-                )
+            laddr = f"{conn.laddr.ip}:{conn.laddr.port}" if conn.laddr else ""
+            raddr = f"{conn.raddr.ip}:{conn.raddr.port}" if conn.raddr else ""
+            
+            # Connections owned by other users' processes may have no PID
+            if conn.pid is None:
+                pid_text, proc_name = "", "?"
+            else:
+                pid_text, proc_name = str(conn.pid), names.get(conn.pid, "?")
+            
+            table.add_row(
+                pid_text,
+                proc_name,
+                laddr,
+                raddr,
+                conn.status
+            )
         
         console.print(table)
         sys.exit(EXIT_OK)
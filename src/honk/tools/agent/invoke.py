@@ -1,18 +1,23 @@
 """Agent invocation command."""
+import functools
+import os
 import typer
-import json
 from pathlib import Path
-from rich.console import Console
-from rich.panel import Panel
-from rich.syntax import Syntax
-from rich.table import Table
-from rich.markdown import Markdown
+from typing import TYPE_CHECKING, Optional, Tuple
 
-from honk.result import ResultEnvelope
-from honk.tools.agent.invoke_executor import AgentExecutor
-from honk.tools.agent.result_builder import build_result_envelope
+if TYPE_CHECKING:
+    from rich.console import Console
 
-console = Console()
+    from honk.internal.validation.yaml_validator import ValidationResult
+    from honk.result import ResultEnvelope
+
+
+@functools.cache
+def get_console() -> "Console":
+    """Get the shared console, creating it on first use."""
+    from rich.console import Console
+    
+    return Console()
 
 
 def invoke_agent(
@@ -72,43 +77,50 @@ def invoke_agent(
     # Resolve output format
     if json_output:
         output_format = "json"
+    # JSON mode never renders with Rich, so don't import or set it up
+    plain = output_format == "json"
     
     # Disable colors if requested
-    if no_color:
-        console._color_system = None
+    if no_color and not plain:
+        get_console()._color_system = None
     
     # Validate agent exists
-    agent_path = get_agent_path(agent_name)
-    if not agent_path.exists():
-        console.print(f"[red]Error:[/red] Agent '{agent_name}' not found")
-        console.print("[dim]Hint:[/dim] Run 'honk agent list' to see available agents")
+    agent_path, agent_stat = get_agent_path(agent_name)
+    if agent_stat is None:
+        _print_error(
+            f"Agent '{agent_name}' not found",
+            plain,
+            hint="Run 'honk agent list' to see available agents",
+        )
         raise typer.Exit(1)
     
     # Validate context files exist
     if context:
         for ctx_file in context:
             if not ctx_file.exists():
-                console.print(f"[red]Error:[/red] Context file not found: {ctx_file}")
+                _print_error(f"Context file not found: {ctx_file}", plain)
                 raise typer.Exit(1)
     
     # Load agent definition
-    agent_def = load_agent_definition(agent_path)
+    agent_def = load_agent_definition(agent_path, agent_stat, plain=plain)
     
     # Dry run mode
     if dry_run:
         show_dry_run_info(agent_name, prompt, context, agent_def)
         return
     
+    from honk.tools.agent.invoke_executor import AgentExecutor
+    from honk.tools.agent.result_builder import build_result_envelope
+    
     # Execute agent
     try:
-        executor = AgentExecutor(
+        with AgentExecutor(
             agent_name=agent_name,
             agent_definition=agent_def,
             timeout=timeout,
             log_file=log_file,
-        )
-        
-        result = executor.execute(prompt, context_files=context)
+        ) as executor:
+            result = executor.execute(prompt, context_files=context)
         
         # Build result envelope
         envelope = build_result_envelope(
@@ -128,48 +140,92 @@ def invoke_agent(
             print_text_result(envelope)
         
         # Exit with appropriate code
-        raise typer.Exit(envelope.code)  # type: ignore[arg-type]
+        raise typer.Exit(int(envelope.code))
         
+    except typer.Exit:
+        raise
     except TimeoutError:
-        console.print("[red]Error:[/red] Agent execution timed out")
+        _print_error("Agent execution timed out", plain)
         raise typer.Exit(30)  # system error
     except Exception as e:
-        console.print(f"[red]Error:[/red] Agent invocation failed: {e}")
+        _print_error(f"Agent invocation failed: {e}", plain)
         raise typer.Exit(50)  # bug
 
 
-def get_agent_path(agent_name: str) -> Path:
-    """Get path to agent definition file."""
+def _print_error(message: str, plain: bool, hint: Optional[str] = None) -> None:
+    """Print an error message.
+    
+    Args:
+        message: Error message
+        plain: Write plain text to stderr instead of rendering with Rich
+        hint: Follow-up suggestion for the user
+    """
+    if plain:
+        typer.echo(f"Error: {message}", err=True)
+        if hint:
+            typer.echo(f"Hint: {hint}", err=True)
+        return
+    
+    console = get_console()
+    console.print(f"[red]Error:[/red] {message}")
+    if hint:
+        console.print(f"[dim]Hint:[/dim] {hint}")
+
+
+def get_agent_path(agent_name: str) -> Tuple[Path, Optional[os.stat_result]]:
+    """Get path to agent definition file.
+    
+    Returns:
+        The agent path and its stat result, or the local path and None if
+        the agent does not exist
+    """
     # Try local first: .github/agents/
     local_path = Path(".github/agents") / f"{agent_name}.agent.md"
-    if local_path.exists():
-        return local_path
-    
-    # Try global: ~/.copilot/agents/
+    # Then global: ~/.copilot/agents/
     global_path = Path.home() / ".copilot/agents" / f"{agent_name}.agent.md"
-    if global_path.exists():
-        return global_path
     
-    return local_path  # Return non-existent path for error handling
+    for path in (local_path, global_path):
+        try:
+            return path, os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+    
+    return local_path, None  # Non-existent path for error handling
 
 
-def load_agent_definition(agent_path: Path) -> dict:
-    """Load and parse agent YAML frontmatter."""
-    from honk.tools.agent.validate import YAMLFrontmatterValidator
+def load_agent_definition(
+    agent_path: Path,
+    agent_stat: Optional[os.stat_result] = None,
+    plain: bool = False,
+) -> dict:
+    """Load and parse agent YAML frontmatter.
     
-    content = agent_path.read_text()
-    validator = YAMLFrontmatterValidator()  # type: ignore[call-arg]
-    result = validator.validate(content)  # type: ignore[attr-defined]
+    Args:
+        agent_path: Agent definition file
+        agent_stat: Stat result for agent_path, if already known
+        plain: Report errors as plain text on stderr instead of with Rich
+    """
+    if agent_stat is None:
+        agent_stat = os.stat(agent_path)
+    result = _load_validated(str(agent_path), agent_stat.st_mtime_ns)
     
     if not result.valid:
-        console.print("[red]Error:[/red] Invalid agent definition:")
-        for error in result.errors:
-            console.print(f"  - {error}")
+        details = "".join(f"\n  - {error}" for error in result.errors)
+        _print_error(f"Invalid agent definition:{details}", plain)
         raise typer.Exit(1)
     
     return result.frontmatter
 
 
+@functools.lru_cache(maxsize=64)
+def _load_validated(path: str, mtime_ns: int) -> "ValidationResult":
+    """Read and validate an agent file once per (path, mtime_ns)."""
+    from honk.internal.validation._cache import get_validator
+    from honk.tools.agent.scaffold import SCHEMA_AGENT_V1_PATH
+    
+    return get_validator(SCHEMA_AGENT_V1_PATH).validate_bytes(Path(path).read_bytes())
+
+
 def show_dry_run_info(
     agent_name: str,
     prompt: str,
@@ -177,6 +233,10 @@ def show_dry_run_info(
     agent_def: dict,
 ) -> None:
     """Display what would be executed in dry-run mode."""
+    from rich.panel import Panel
+    from rich.syntax import Syntax
+    
+    console = get_console()
     console.print(Panel.fit(
         "[bold]Dry Run - No execution[/bold]",
         border_style="yellow"
@@ -200,14 +260,17 @@ def show_dry_run_info(
     console.print(syntax)
 
 
-def print_json(envelope: ResultEnvelope) -> None:
+def print_json(envelope: "ResultEnvelope") -> None:
     """Print result as JSON."""
-    output = json.dumps(envelope.model_dump(), indent=2)
-    print(output)
+    print(envelope.model_dump_json(indent=2))
 
 
-def print_text_result(envelope: ResultEnvelope) -> None:
+def print_text_result(envelope: "ResultEnvelope") -> None:
     """Print result in human-readable text format."""
+    from rich.panel import Panel
+    from rich.table import Table
+    
+    console = get_console()
     # Status indicator
     status_color = {
         "ok": "green",
@@ -237,21 +300,24 @@ def print_text_result(envelope: ResultEnvelope) -> None:
     if envelope.links:
         console.print("\n[bold]Learn More:[/bold]")
         for link in envelope.links:
-            console.print(f"  • {link.title}: {link.href}")  # type: ignore[attr-defined]
+            console.print(f"  • {link.rel}: {link.href}")
     
     # Next steps
     if envelope.next:
         console.print("\n[bold]Next Steps:[/bold]")
-        for cmd in envelope.next:
-            console.print(f"  $ {cmd}")
+        for step in envelope.next:
+            console.print(f"  $ {' '.join(step.run)}")
     
     # Footer
     console.print(f"\n[dim]Completed in {envelope.duration_ms}ms[/dim]")
 
 
-def print_markdown_result(envelope: ResultEnvelope) -> None:
+def print_markdown_result(envelope: "ResultEnvelope") -> None:
     """Print result in markdown format."""
-    md = f"""
+    from rich.markdown import Markdown
+    
+    # Collect the pieces and join once instead of growing a string with +=
+    parts = [f"""
 # {envelope.summary}
 
 **Status:** {envelope.status}  
@@ -259,20 +325,20 @@ def print_markdown_result(envelope: ResultEnvelope) -> None:
 
 ## Results
 
-"""
+"""]
     
     if envelope.facts:
-        for key, value in envelope.facts.items():
-            md += f"- **{key}:** {value}\n"
+        parts.extend(f"- **{key}:** {value}\n" for key, value in envelope.facts.items())
     
     if envelope.links:
-        md += "\n## Learn More\n\n"
-        for link in envelope.links:
-            md += f"- [{link.title}]({link.href})\n"  # type: ignore[attr-defined]
+        parts.append("\n## Learn More\n\n")
+        parts.extend(
+            f"- [{link.rel}]({link.href})\n"
+            for link in envelope.links
+        )
     
     if envelope.next:
-        md += "\n## Next Steps\n\n"
-        for cmd in envelope.next:
-            md += f"```bash\n{cmd}\n```\n\n"
+        parts.append("\n## Next Steps\n\n")
+        parts.extend(f"```bash\n{' '.join(step.run)}\n```\n\n" for step in envelope.next)
     
-    console.print(Markdown(md))
+    get_console().print(Markdown("".join(parts)))
@@ -1,19 +1,145 @@
 """Execute GitHub Copilot CLI agent invocations."""
+import asyncio
+import codecs
+import functools
+import shutil
 import subprocess
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from dataclasses import dataclass
-from typing import Optional
+from typing import BinaryIO, Callable, Optional, Union
+
+# Bytes kept per stream; older output is dropped so huge transcripts stay bounded
+OUTPUT_BUFFER_BYTES = 4 * 1024 * 1024
+
+# Pipe read size while streaming agent output
+_READ_CHUNK_SIZE = 64 * 1024
+
+# Context files are read concurrently from this many files up, on at most MAX_READ_WORKERS threads
+PARALLEL_READ_THRESHOLD = 4
+MAX_READ_WORKERS = 8
+
+# Write buffer for the execution log; flushed when an execution finishes
+LOG_BUFFER_SIZE = 128 * 1024
+
+
+@functools.lru_cache(maxsize=4)
+def _probe_copilot(executable: str) -> bool:
+    """Check that a copilot executable runs (cached per path)."""
+    try:
+        subprocess.run(
+            [executable, "--version"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        )
+    except (subprocess.CalledProcessError, OSError):
+        return False
+    return True
+
+
+def _copilot_available() -> bool:
+    """Check whether the GitHub Copilot CLI is installed and runs.
+    
+    PATH lookup is done every time (no subprocess); the `copilot --version`
+    probe runs once per executable path for the life of the process.
+    """
+    executable = shutil.which("copilot")
+    return executable is not None and _probe_copilot(executable)
+
+
+def _read_context_file(path: Path) -> str:
+    """Read a whole context file in one sized read and decode it once.
+    
+    Unbuffered FileIO.readall() sizes its buffer from fstat, so the file is
+    read with a single read call instead of 8 KiB chunks through a text wrapper.
+    """
+    with open(path, "rb", buffering=0) as f:
+        data = f.readall()
+    return data.decode("utf-8")
+
+
+class OutputBuffer:
+    """Ring buffer keeping the most recent bytes written to it."""
+    
+    def __init__(self, max_bytes: int = OUTPUT_BUFFER_BYTES):
+        self.max_bytes = max_bytes
+        self._chunks: deque[bytes] = deque()
+        self._size = 0
+        self.dropped_bytes = 0
+    
+    @property
+    def truncated(self) -> bool:
+        """Whether the start of the output was dropped to stay under max_bytes."""
+        return self.dropped_bytes > 0
+    
+    def append(self, data: bytes) -> None:
+        """Add data, dropping the oldest chunks once over max_bytes."""
+        self._chunks.append(data)
+        self._size += len(data)
+        while self._size > self.max_bytes and len(self._chunks) > 1:
+            dropped = len(self._chunks.popleft())
+            self._size -= dropped
+            self.dropped_bytes += dropped
+    
+    def clear(self) -> None:
+        """Discard all buffered data."""
+        self._chunks.clear()
+        self._size = 0
+        self.dropped_bytes = 0
+    
+    def getvalue(self) -> bytes:
+        """Get the buffered data."""
+        return b"".join(self._chunks)
 
 
-@dataclass
 class ExecutionResult:
-    """Result of agent execution."""
-    success: bool
-    output: str
-    error: str
-    duration_ms: int
-    exit_code: int
+    """Result of agent execution.
+    
+    The agent's output is kept as the raw bytes it wrote; output and error
+    are only decoded when first read. `truncated` is set when either stream
+    outgrew OUTPUT_BUFFER_BYTES and only its tail was kept.
+    """
+    
+    def __init__(
+        self,
+        success: bool,
+        output: Union[str, bytes],
+        error: Union[str, bytes],
+        duration_ms: int,
+        exit_code: int,
+        truncated: bool = False,
+    ):
+        self.success = success
+        self.duration_ms = duration_ms
+        self.exit_code = exit_code
+        self.truncated = truncated
+        if isinstance(output, str):
+            self.__dict__["output"] = output
+            output = output.encode("utf-8")
+        if isinstance(error, str):
+            self.__dict__["error"] = error
+            error = error.encode("utf-8")
+        self.output_bytes = output
+        self.error_bytes = error
+    
+    @functools.cached_property
+    def output(self) -> str:
+        """Agent stdout as text."""
+        return self.output_bytes.decode("utf-8", "replace")
+    
+    @functools.cached_property
+    def error(self) -> str:
+        """Agent stderr as text."""
+        return self.error_bytes.decode("utf-8", "replace")
+    
+    def __repr__(self) -> str:
+        return (
+            f"ExecutionResult(success={self.success!r}, exit_code={self.exit_code!r}, "
+            f"duration_ms={self.duration_ms!r}, output_bytes={len(self.output_bytes)}, "
+            f"error_bytes={len(self.error_bytes)}, truncated={self.truncated!r})"
+        )
 
 
 class AgentExecutor:
@@ -30,18 +156,39 @@ class AgentExecutor:
         self.agent_definition = agent_definition
         self.timeout = timeout
         self.log_file = log_file
+        self._stdout = OutputBuffer()
+        self._stderr = OutputBuffer()
+        self._log_fp: Optional[BinaryIO] = None
+        self._log_second = -1
+        self._log_timestamp = b""
+    
+    def close(self) -> None:
+        """Flush and close the log file, if one was opened."""
+        if self._log_fp is not None:
+            self._log_fp.close()
+            self._log_fp = None
+    
+    def __enter__(self) -> "AgentExecutor":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
     
     def execute(
         self,
         prompt: str,
         context_files: Optional[list[Path]] = None,
+        on_output: Optional[Callable[[str], None]] = None,
     ) -> ExecutionResult:
         """
         Execute agent with prompt and context.
         
+        Synchronous wrapper around execute_async().
+        
         Args:
             prompt: User instruction/question
             context_files: Optional files to include as context
+            on_output: Called with stdout text as it arrives
         
         Returns:
             ExecutionResult with output and metadata
@@ -50,6 +197,30 @@ class AgentExecutor:
             TimeoutError: If execution exceeds timeout
             FileNotFoundError: If copilot CLI not found
         """
+        return asyncio.run(self.execute_async(prompt, context_files, on_output))
+    
+    async def execute_async(
+        self,
+        prompt: str,
+        context_files: Optional[list[Path]] = None,
+        on_output: Optional[Callable[[str], None]] = None,
+    ) -> ExecutionResult:
+        """
+        Execute agent with prompt and context, streaming its output.
+        
+        Args:
+            prompt: User instruction/question
+            context_files: Optional files to include as context
+            on_output: Called with stdout text as it arrives
+        
+        Returns:
+            ExecutionResult with output and metadata
+        
+        Raises:
+            TimeoutError: If execution exceeds timeout (partial output
+                remains available from snapshot())
+            FileNotFoundError: If copilot CLI not found
+        """
         start_time = time.time()
         
         # Build full prompt with context
@@ -64,34 +235,65 @@ class AgentExecutor:
         
         # Execute copilot CLI
         try:
-            result = self._execute_copilot(full_prompt)
+            return await self._run(full_prompt, start_time, on_output)
+        finally:
+            if self._log_fp is not None:
+                self._log_fp.flush()
+    
+    async def _run(
+        self,
+        full_prompt: str,
+        start_time: float,
+        on_output: Optional[Callable[[str], None]] = None,
+    ) -> ExecutionResult:
+        """Run the agent and log the outcome."""
+        try:
+            returncode = await self._execute_copilot(full_prompt, on_output)
             duration_ms = int((time.time() - start_time) * 1000)
-            
             execution_result = ExecutionResult(
-                success=(result.returncode == 0),
-                output=result.stdout.decode('utf-8'),
-                error=result.stderr.decode('utf-8'),
+                success=(returncode == 0),
+                output=self._stdout.getvalue(),
+                error=self._stderr.getvalue(),
                 duration_ms=duration_ms,
-                exit_code=result.returncode,
+                exit_code=returncode,
+                truncated=self._stdout.truncated or self._stderr.truncated,
             )
             
             # Log result
             if self.log_file:
                 self._log(f"Completed in {duration_ms}ms")
-                self._log(f"Exit code: {result.returncode}")
-                if execution_result.output:
+                self._log(f"Exit code: {returncode}")
+                if execution_result.truncated:
+                    self._log(f"Output truncated to the last {OUTPUT_BUFFER_BYTES} bytes")
+                if execution_result.output_bytes:
                     self._log(f"Output:\n{execution_result.output}")
-                if execution_result.error:
+                if execution_result.error_bytes:
                     self._log(f"Error:\n{execution_result.error}")
             
             return execution_result
             
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             duration_ms = int((time.time() - start_time) * 1000)
             if self.log_file:
                 self._log(f"TIMEOUT after {duration_ms}ms")
+                output, _ = self.snapshot()
+                if output:
+                    self._log(f"Partial output:\n{output}")
             raise TimeoutError(f"Agent execution exceeded {self.timeout}s timeout")
     
+    def snapshot(self) -> tuple[str, str]:
+        """
+        Get the output captured so far.
+        
+        Returns:
+            Tuple of (stdout, stderr) text, limited to roughly the last
+            OUTPUT_BUFFER_BYTES bytes of each stream
+        """
+        return (
+            self._stdout.getvalue().decode("utf-8", "replace"),
+            self._stderr.getvalue().decode("utf-8", "replace"),
+        )
+    
     def _build_prompt(
         self,
         prompt: str,
@@ -115,58 +317,131 @@ class AgentExecutor:
             [file contents]
             ```
         """
-        full_prompt = prompt
+        # Collect the pieces and join once; repeated += copies the growing prompt
+        parts = [prompt]
         
         if context_files:
-            full_prompt += "\n\nContext:\n"
+            parts.append("\n\nContext:\n")
             
-            for ctx_file in context_files:
-                content = ctx_file.read_text()
+            # Reads are independent; only pay for a pool when there are enough of them
+            if len(context_files) >= PARALLEL_READ_THRESHOLD:
+                workers = min(MAX_READ_WORKERS, len(context_files))
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    contents = list(pool.map(_read_context_file, context_files))
+            else:
+                contents = [_read_context_file(f) for f in context_files]
+            
+            for ctx_file, content in zip(context_files, contents):
                 ext = ctx_file.suffix.lstrip('.')
                 
-                full_prompt += f"\nFile: {ctx_file}\n"
-                full_prompt += f"```{ext}\n{content}\n```\n"
+                parts.append(f"\nFile: {ctx_file}\n```{ext}\n")
+                parts.append(content)
+                parts.append("\n```\n")
         
-        return full_prompt
+        return "".join(parts)
     
-    def _execute_copilot(self, prompt: str) -> subprocess.CompletedProcess:
+    async def _execute_copilot(
+        self,
+        prompt: str,
+        on_output: Optional[Callable[[str], None]] = None,
+    ) -> int:
         """
         Execute copilot CLI with agent.
         
         Command: copilot @agent-name --input "prompt"
+        
+        Returns:
+            Process exit code
+        
+        Raises:
+            asyncio.TimeoutError: If the process outlives the timeout (it is
+                killed; output read so far stays in the buffers)
         """
         # Verify copilot CLI is available
-        try:
-            subprocess.run(
-                ["copilot", "--version"],
-                capture_output=True,
-                check=True,
-            )
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        if not _copilot_available():
             raise FileNotFoundError(
                 "GitHub Copilot CLI not found. "
                 "Install: https://docs.github.com/copilot/github-copilot-in-the-cli"
             )
         
+        self._stdout.clear()
+        self._stderr.clear()
+        
         # Execute with agent
-        cmd = [
+        proc = await asyncio.create_subprocess_exec(
             "copilot",
             f"@{self.agent_name}",
             "--input",
             prompt,
-        ]
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
         
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            timeout=self.timeout,
+        try:
+            return await asyncio.wait_for(
+                self._communicate(proc, on_output), timeout=self.timeout
+            )
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise
+    
+    async def _communicate(
+        self,
+        proc: asyncio.subprocess.Process,
+        on_output: Optional[Callable[[str], None]] = None,
+    ) -> int:
+        """Stream the process output into the buffers and wait for it to exit."""
+        # Drain both pipes concurrently so neither can fill up and block the agent
+        await asyncio.gather(
+            self._drain(proc.stdout, self._stdout, on_output),
+            self._drain(proc.stderr, self._stderr),
         )
+        return await proc.wait()
+    
+    @staticmethod
+    async def _drain(
+        stream: Optional[asyncio.StreamReader],
+        buffer: OutputBuffer,
+        on_text: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """Read a process stream into a bounded buffer as it arrives.
+        
+        Data is buffered as raw bytes; it is only decoded here when on_text
+        wants it as it arrives.
+        """
+        if stream is None:
+            return
         
-        return result
+        # Incremental decoding keeps multi-byte characters split across reads intact
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        while True:
+            chunk = await stream.read(_READ_CHUNK_SIZE)
+            if chunk:
+                buffer.append(chunk)
+            if on_text is not None:
+                text = decoder.decode(chunk, final=not chunk)
+                if text:
+                    on_text(text)
+            if not chunk:
+                break
     
     def _log(self, message: str) -> None:
-        """Append message to log file."""
+        """Append message to log file.
+        
+        The file is opened once and written through a LOG_BUFFER_SIZE buffer;
+        call close() (or let execute() finish) to flush it.
+        """
         if self.log_file:
-            with open(self.log_file, 'a') as f:
-                timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-                f.write(f"[{timestamp}] {message}\n")
+            if self._log_fp is None:
+                self._log_fp = open(self.log_file, 'ab', buffering=LOG_BUFFER_SIZE)
+            
+            # Second resolution: only reformat the timestamp when it changes
+            now = int(time.time())
+            if now != self._log_second:
+                self._log_second = now
+                self._log_timestamp = time.strftime(
+                    "%Y-%m-%d %H:%M:%S", time.localtime(now)
+                ).encode()
+            
+            self._log_fp.write(b"[%s] %s\n" % (self._log_timestamp, message.encode("utf-8")))
@@ -1,11 +1,28 @@
 """List command for honk agent."""
+import os
 import typer
 from pathlib import Path
-from typing import Optional
-import yaml
+from typing import Dict, Final, Optional, Tuple, Union
 
+from honk.internal.validation.frontmatter import split_frontmatter
 from honk.ui import console
 
+NO_DESCRIPTION = "[dim](No description)[/dim]"
+
+# Bytes read from the top of an agent file when scanning for the description
+FRONTMATTER_SCAN_SIZE = 8192
+
+# Listed descriptions are cut to MAX_DESCRIPTION_CHARS, ending in TRUNCATION_SUFFIX
+MAX_DESCRIPTION_CHARS: Final = 60
+TRUNCATION_SUFFIX: Final = "..."
+
+# Bytes of a scanned description worth decoding; UTF-8 needs at most 4 per character,
+# so this always covers the part that is shown
+MAX_DESCRIPTION_BYTES: Final = MAX_DESCRIPTION_CHARS * 4
+
+# Descriptions keyed by (path, st_mtime_ns, st_size), valid while the file is unchanged
+_description_cache: Dict[Tuple[str, int, int], str] = {}
+
 list_app = typer.Typer(
     invoke_without_command=True,
     no_args_is_help=False
@@ -61,53 +78,130 @@ def list_agents(
     
     if location in ["project", "all"]:
         console.print("[bold]Project Agents[/bold] (.github/agents/):")
-        if project_agents_dir.exists():
-            agents = list(project_agents_dir.glob("*.agent.md"))
-            if agents:
-                for agent_file in sorted(agents):
-                    name = agent_file.stem
-                    description = _extract_description(agent_file)
-                    console.print(f"  [info]{name:20}[/info] - {description}")
-                    total_count += 1
-            else:
-                console.print("  [dim](No agents found)[/dim]")
-        else:
-            console.print("  [dim](Directory not found)[/dim]")
+        total_count += _print_agents(project_agents_dir)
         console.print()
     
     if location in ["global", "all"]:
         console.print("[bold]Global Agents[/bold] (~/.copilot/agents/):")
-        if global_agents_dir.exists():
-            agents = list(global_agents_dir.glob("*.agent.md"))
-            if agents:
-                for agent_file in sorted(agents):
-                    name = agent_file.stem
-                    description = _extract_description(agent_file)
-                    console.print(f"  [info]{name:20}[/info] - {description}")
-                    total_count += 1
-            else:
-                console.print("  [dim](No agents found)[/dim]")
-        else:
-            console.print("  [dim](Directory not found)[/dim]")
+        total_count += _print_agents(global_agents_dir)
         console.print()
     
     console.print(f"[bold]Total:[/bold] {total_count} agent(s)")
 
 
-def _extract_description(agent_file: Path) -> str:
+def _print_agents(agents_dir: Path) -> int:
+    """Print the agents in a directory.
+    
+    Returns:
+        Number of agents listed
+    """
+    # One directory read; entries carry their file type, no per-file stat for filtering
+    try:
+        with os.scandir(agents_dir) as it:
+            agents = sorted(
+                (e for e in it if e.name.endswith(".agent.md") and e.is_file()),
+                key=lambda e: e.name
+            )
+    except (FileNotFoundError, NotADirectoryError):
+        console.print("  [dim](Directory not found)[/dim]")
+        return 0
+    
+    if not agents:
+        console.print("  [dim](No agents found)[/dim]")
+        return 0
+    
+    for entry in agents:
+        name = os.path.splitext(entry.name)[0]
+        description = _extract_description(entry)
+        console.print(f"  [info]{name:20}[/info] - {description}")
+    return len(agents)
+
+
+def _extract_description(agent_file: Union[Path, os.DirEntry]) -> str:
     """Extract description from agent YAML frontmatter."""
     try:
-        content = agent_file.read_text()
-        # Extract frontmatter
-        parts = content.split("---", 2)
-        if len(parts) >= 3:
-            frontmatter = yaml.safe_load(parts[1])
-            if frontmatter and "description" in frontmatter:
-                desc = frontmatter["description"]
-                # Truncate if too long
-                if len(desc) > 60:
-                    desc = desc[:57] + "..."
-                return desc
+        stat = agent_file.stat()
+        key = (os.fspath(agent_file), stat.st_mtime_ns, stat.st_size)
+        description = _description_cache.get(key)
+        if description is None:
+            desc = _scan_description(agent_file)
+            if desc is None:
+                desc = _parse_description(agent_file)
+            description = _description_cache[key] = _format_description(desc)
+        return description
     except Exception:
-        pass
-    return "[dim](No description)[/dim]"
+        return NO_DESCRIPTION
+
+
+def _scan_description(agent_file: Union[Path, os.DirEntry]) -> Optional[str]:
+    """Read a plain `description:` line from the top of the frontmatter.
+    
+    Returns:
+        The description, "" if the frontmatter has none, or None when the
+        frontmatter needs a real YAML parse (multi-line or escaped values,
+        or frontmatter longer than FRONTMATTER_SCAN_SIZE)
+    """
+    with open(agent_file, "rb", buffering=0) as f:
+        head = f.read(FRONTMATTER_SCAN_SIZE)
+    
+    frontmatter = split_frontmatter(head)
+    if frontmatter is None:
+        return None
+    
+    if frontmatter.startswith(b"description:"):
+        start = 0
+    else:
+        start = frontmatter.find(b"\ndescription:")
+        if start < 0:
+            return ""
+        start += 1
+    line_end = frontmatter.find(b"\n", start)
+    if line_end < 0:
+        line_end = len(frontmatter)
+    
+    value = frontmatter[start + len(b"description:"):line_end].strip()
+    next_line = frontmatter[line_end + 1:line_end + 2]
+    if not value or next_line in (b" ", b"\t"):
+        return None  # Block scalar or continued plain scalar
+    
+    quote = value[:1]
+    if quote in (b'"', b"'"):
+        inner = value[1:-1]
+        if len(value) < 2 or value[-1:] != quote or quote in inner or b"\\" in inner:
+            return None
+        value = inner
+    elif value[:1] in b"&*!|>{[%@`#" or b" #" in value:
+        return None
+    
+    # Only the first MAX_DESCRIPTION_CHARS are shown; don't decode the rest
+    return value[:MAX_DESCRIPTION_BYTES].decode("utf-8", "replace")
+
+
+def _parse_description(agent_file: Union[Path, os.DirEntry]) -> Optional[str]:
+    """Get the description by parsing the whole frontmatter with PyYAML."""
+    import yaml
+    
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeLoader  # type: ignore[assignment]
+    
+    content = Path(agent_file).read_bytes()
+    # Decode and parse only the frontmatter, not the prompt body
+    block = split_frontmatter(content)
+    if block is None:
+        return None
+    frontmatter = yaml.load(block.decode("utf-8"), Loader=SafeLoader)
+    if frontmatter and "description" in frontmatter:
+        return frontmatter["description"]
+    return None
+
+
+def _format_description(desc: Optional[str]) -> str:
+    """Truncate a description for the listing."""
+    if not desc:
+        return NO_DESCRIPTION
+    # Truncate if too long
+    if len(desc) <= MAX_DESCRIPTION_CHARS:
+        return desc
+    return f"{desc[:MAX_DESCRIPTION_CHARS - len(TRUNCATION_SUFFIX)]}{TRUNCATION_SUFFIX}"
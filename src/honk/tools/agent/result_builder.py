@@ -1,10 +1,35 @@
 """Build ResultEnvelope from agent execution."""
+import re
+import time
+import uuid
 from pathlib import Path
-from typing import Optional
-from honk.result import ResultEnvelope, Link
+from typing import Any, Dict, Optional
+from honk.result import ResultEnvelope, Link, NextStep
 from honk.tools.agent.invoke_executor import ExecutionResult
-import uuid
-from datetime import datetime
+
+# Error keywords mapped to (status, code); authentication wins over timeout
+_ERROR_CLASSES = {
+    "authentication": ("needs_auth", 11),
+    "timeout": ("error", 30),
+}
+_ERROR_CLASS_RE = re.compile("|".join(_ERROR_CLASSES), re.IGNORECASE)
+
+
+def _classify_error(error: str) -> tuple[str, int]:
+    """Get the status and exit code for a failed execution in one scan of the error."""
+    status, code = "error", 50
+    for match in _ERROR_CLASS_RE.finditer(error):
+        status, code = _ERROR_CLASSES[match.group(0).lower()]
+        if status == "needs_auth":
+            break
+    return status, code
+
+
+def _utc_timestamp() -> str:
+    """Get the current UTC time as ISO 8601 with microseconds and a Z suffix."""
+    now_ns = time.time_ns()
+    seconds, fraction_ns = divmod(now_ns, 1_000_000_000)
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))}.{fraction_ns // 1000:06d}Z"
 
 
 def build_result_envelope(
@@ -31,29 +56,26 @@ def build_result_envelope(
     if execution_result.success:
         status = "ok"
         code = 0
-    elif "authentication" in execution_result.error.lower():
-        status = "needs_auth"
-        code = 11
-    elif "timeout" in execution_result.error.lower():
-        status = "error"
-        code = 30
     else:
-        status = "error"
-        code = 50
+        status, code = _classify_error(execution_result.error)
     
     # Build facts
-    facts = {
+    facts: Dict[str, Any] = {
         "agent_name": agent_name,
         "prompt": prompt,
         "output": execution_result.output,
+        "timestamp": _utc_timestamp(),
     }
     
     if context_files:
-        facts["context_files"] = [str(f) for f in context_files]  # type: ignore[assignment]
+        facts["context_files"] = [str(f) for f in context_files]
     
-    if execution_result.error:
+    if execution_result.error_bytes:
         facts["error"] = execution_result.error
     
+    if execution_result.truncated:
+        facts["output_truncated"] = True
+    
     # Summary
     if status == "ok":
         summary = f"Agent '{agent_name}' executed successfully"
@@ -64,31 +86,33 @@ def build_result_envelope(
     
     # Links
     links = [
-        Link(  # type: ignore[call-arg]
-            title="Agent Documentation",
+        Link(
+            rel="docs",
             href="https://docs.github.com/copilot/github-copilot-in-the-cli/using-github-copilot-in-the-cli#using-custom-agents",
         ),
     ]
     
     # Next steps
-    next_commands = []
+    next_steps = []
     if status == "needs_auth":
-        next_commands.append("gh auth login")
+        next_steps.append(NextStep(run=["gh", "auth", "login"], summary="Log in to GitHub"))
     elif status == "ok" and "test" not in agent_name.lower():
-        next_commands.append(f"honk agent invoke {agent_name} --context <more-files>")
+        next_steps.append(NextStep(
+            run=["honk", "agent", "invoke", agent_name, "--context", "<more-files>"],
+            summary="Invoke the agent again with more context",
+        ))
     
     # Build envelope
-    return ResultEnvelope(  # type: ignore[call-arg]
+    return ResultEnvelope(
         version="1.0",
-        command=command,  # type: ignore[arg-type]
+        command=command.split(),
         status=status,
         changed=False,  # Read-only operation
-        code=code,  # type: ignore[arg-type]
+        code=str(code),
         summary=summary,
         run_id=str(uuid.uuid4()),
-        timestamp=datetime.utcnow().isoformat() + "Z",
         duration_ms=execution_result.duration_ms,
         facts=facts,
         links=links,
-        next=next_commands,  # type: ignore[arg-type]
+        next=next_steps,
     )
@@ -1,19 +1,115 @@
+import functools
+import re
 import typer
+import subprocess
+import textwrap
 from pathlib import Path
-from typing import Optional
+from string import Template
+from typing import List, Optional, Sequence, Union
 import os
 
 from honk.ui import print_success, print_error, print_info, console
+from honk.internal.fs import atomic_write_bytes
 from honk.internal.templates.engine import TemplateEngine
-from honk.internal.validation.yaml_validator import YAMLFrontmatterValidator
 
 scaffold_app = typer.Typer()
 
 # Calculate project root dynamically
-PROJECT_ROOT = Path(__file__).parent.parent.parent.parent.parent
+PROJECT_ROOT = Path(__file__).parents[4]
 TEMPLATE_BASE_DIR = PROJECT_ROOT / "src/honk/tools/agent/templates"
 SCHEMA_AGENT_V1_PATH = PROJECT_ROOT / "schemas/agent.v1.json"
 
+# Rendered in memory when no --template is given; must match templates/default.agent.md
+# (test_builtin_default_matches_packaged_template checks this)
+_DEFAULT_TEMPLATE = Template("""---
+name: ${AGENT_NAME}
+description: ${DESCRIPTION}
+target: ${TARGET}
+tools:
+  ${TOOLS}
+---
+
+# ${AGENT_NAME} Agent Instructions
+
+You are a custom agent named ${AGENT_NAME}.
+Your purpose is: ${DESCRIPTION}
+You have access to the following tools: ${TOOL_NAMES}
+""")
+
+# Seconds to wait for `git add` (e.g. behind a held index.lock) before giving up
+GIT_ADD_TIMEOUT = 5
+
+
+# A line holding only the ${TOOLS} placeholder, as "  ${TOOLS}" or "${TOOLS}"
+_TOOLS_LINE_RE = re.compile(r"^([ \t]*)\$\{TOOLS\}[ \t]*$", re.MULTILINE)
+
+
+def _format_tools_yaml(tools: Union[str, List[str]]) -> str:
+    """Dump the tools value as an unindented YAML block."""
+    import yaml
+    
+    try:
+        from yaml import CSafeDumper as SafeDumper
+    except ImportError:
+        from yaml import SafeDumper  # type: ignore[assignment]
+    
+    dumped = yaml.dump(tools, Dumper=SafeDumper, default_flow_style=False)
+    # A bare plain scalar may be followed by an explicit document end marker
+    return dumped.removesuffix("...\n").rstrip()
+
+
+def _place_tools_yaml(rendered: str, tools_yaml: str, tool_names: str) -> str:
+    """Fill in the ${TOOLS} placeholders left in rendered by the substitution.
+    
+    A placeholder on its own line gets the YAML block at that line's
+    indentation, or two spaces when the line is not indented, so templates
+    may write either "  ${TOOLS}" or "${TOOLS}" under "tools:". A placeholder
+    inside other text gets the comma-separated tool names.
+    """
+    rendered = _TOOLS_LINE_RE.sub(
+        lambda match: textwrap.indent(tools_yaml, match.group(1) or "  "),
+        rendered,
+    )
+    return rendered.replace("${TOOLS}", tool_names)
+
+
+@functools.lru_cache(maxsize=8)
+def _template_engine(template_dir: Path) -> TemplateEngine:
+    """Get the template engine for a template directory (one per process)."""
+    return TemplateEngine(template_dir=template_dir)
+
+
+def stage_files(paths: Sequence[Path]) -> Optional[str]:
+    """Stage scaffolded files with a single `git add` call.
+    
+    Args:
+        paths: Files to stage
+    
+    Returns:
+        None on success, otherwise the reason staging failed
+    """
+    if not paths:
+        return None
+    
+    try:
+        result = subprocess.run(
+            ["git", "add", "--", *map(os.fspath, paths)],
+            cwd=PROJECT_ROOT,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=False,
+            timeout=GIT_ADD_TIMEOUT,
+        )
+    except subprocess.TimeoutExpired:
+        return f"git add timed out after {GIT_ADD_TIMEOUT}s"
+    except OSError as e:
+        return str(e)
+    if result.returncode != 0:
+        return result.stderr.strip() or f"git add exited with {result.returncode}"
+    return None
+
+
 @scaffold_app.command("create")
 def create_agent(
     name: Optional[str] = typer.Option(
@@ -121,18 +217,14 @@ def create_agent(
     # Prepare context for template rendering
     tools_list = [t.strip() for t in tools.split(',')] if tools and tools != "*" else ["*"]  # type: ignore[union-attr]
     
-    tools_yaml_formatted: str
-    if tools_list == ["*"]:
-        tools_yaml_formatted = "*"
-    else:
-        # Format as YAML list items with proper indentation
-        # Template has "tools:\n  ${TOOLS}" so we need "- item\n  - item"
-        tools_yaml_formatted = "- " + "\n  - ".join(tools_list)
+    tools_yaml_formatted = _format_tools_yaml("*" if tools_list == ["*"] else tools_list)
+    tool_names = ", ".join(tools_list)
 
     context = {
         "AGENT_NAME": name,
         "DESCRIPTION": description,
-        "TOOLS": tools_yaml_formatted, # Pass formatted YAML string
+        "TOOLS": "${TOOLS}", # Kept for _place_tools_yaml, which knows the line's indentation
+        "TOOL_NAMES": tool_names, # Plain list for prose
         "TARGET": "github-copilot", # Default target
         "VERSION": "0.1.0", # Initial version
         "CAPABILITIES": "", # Placeholder, can be enhanced later
@@ -140,46 +232,27 @@ def create_agent(
         "MEMORY_LOCATION": "", # Default, research template overrides
     }
 
-    # Move TemplateEngine instantiation inside the function
-    template_engine = TemplateEngine(template_dir=TEMPLATE_BASE_DIR)
-    
-    template_to_use = f"{template}.agent.md" if template else "default.agent.md" # Assuming a default template
     if not template:
-        # Create a very basic default template if none specified
-        default_template_path = TEMPLATE_BASE_DIR / "default.agent.md"
-        if not default_template_path.exists():
-            default_template_path.write_text("""---
-name: ${{AGENT_NAME}}
-description: ${{DESCRIPTION}}
-target: ${{TARGET}}
-tools:
-${{TOOLS}}
----
-
-# ${{AGENT_NAME}} Agent Instructions
+        # Built-in default: no template engine or template file needed
+        rendered_content = _DEFAULT_TEMPLATE.substitute(context)
+    else:
+        template_engine = _template_engine(TEMPLATE_BASE_DIR)
+        template_to_use = f"{template}.agent.md"
+        try:
+            rendered_content = template_engine.render(template_to_use, context)
+        except FileNotFoundError:
+            print_error(f"Template '{template_to_use}' not found. Available templates are: {', '.join(template_engine.available_templates())}")
+            raise typer.Exit(1)
+        except KeyError as e:
+            print_error(f"Missing context variable for template '{template_to_use}': {e}. Please provide all required options or use --interactive.")
+            raise typer.Exit(1)
 
-You are a custom agent named ${{AGENT_NAME}}.
-Your purpose is: ${{DESCRIPTION}}
-You have access to the following tools: ${{TOOLS}}
-""")
-            
-    try:
-        rendered_content = template_engine.render(template_to_use, context)
-    except FileNotFoundError:
-        print_error(f"Template '{template_to_use}' not found. Available templates are: {', '.join([p.stem.replace('.agent', '') for p in template_engine.template_dir.glob('*.agent.md')])}")
-        raise typer.Exit(1)
-    except KeyError as e:
-        print_error(f"Missing context variable for template '{template_to_use}': {e}. Please provide all required options or use --interactive.")
-        raise typer.Exit(1)
+    rendered_content = _place_tools_yaml(rendered_content, tools_yaml_formatted, tool_names)
 
-    # Validate rendered content before writing
-    # Create a temporary file for validation
-    temp_file = agent_dir / f".tmp_{agent_file_name}"
-    temp_file.write_text(rendered_content)
+    # Validate rendered content in memory before writing
+    from honk.internal.validation._cache import get_validator
     
-    validator = YAMLFrontmatterValidator(schema_path=SCHEMA_AGENT_V1_PATH)
-    validation_result = validator.validate_file(temp_file)
-    temp_file.unlink() # Clean up temporary file
+    validation_result = get_validator(SCHEMA_AGENT_V1_PATH).validate_content(rendered_content)
 
     if not validation_result.valid:
         print_error("Generated agent content is invalid:")
@@ -187,19 +260,18 @@ You have access to the following tools: ${{TOOLS}}
             console.print(f"  [error]Error:[/error] {error}")
         raise typer.Exit(1)
 
-    # Write the agent file
-    agent_file_path.write_text(rendered_content)
+    # Write the agent file (encoded once, no text wrapper)
+    atomic_write_bytes(agent_file_path, rendered_content.encode("utf-8"))
     print_success(f"✓ Created agent: {agent_file_path}")
     print_success("✓ Validated YAML schema")
 
     # Add to git if in project location
     if location == "project":
-        try:
-            # This assumes git is initialized and .github/agents is tracked
-            os.system(f"git add {agent_file_path}")
+        git_error = stage_files([agent_file_path])
+        if git_error is None:
             print_success("✓ Added to git staging")
-        except Exception as e:
-            print_info(f"Could not add to git staging: {e}")
+        else:
+            print_info(f"Could not add to git staging: {git_error}")
 
     print_info("\nNext steps:")
     print_info(f"  1. Review and customize: {agent_file_path}")
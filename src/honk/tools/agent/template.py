@@ -1,8 +1,9 @@
+import os
 import typer
 from pathlib import Path
+from typing import List, Optional
 
 from honk.ui import print_success, print_error, console
-from honk.internal.validation.yaml_validator import YAMLFrontmatterValidator
 
 template_app = typer.Typer()
 
@@ -36,25 +37,39 @@ def list_templates():
     console.print("[bold]Available Agent Templates:[/bold]")
     
     console.print("\n[bold]Built-in:[/bold]")
-    builtin_templates = list(BUILTIN_TEMPLATES_DIR.glob("*.agent.md"))
+    builtin_templates = _template_names(BUILTIN_TEMPLATES_DIR)
     if builtin_templates:
-        for template_path in builtin_templates:
-            name = template_path.stem.replace(".agent", "")
+        for name in builtin_templates:
             console.print(f"  [info]{name}[/info]")
     else:
         console.print("  (No built-in templates found)")
 
     console.print("\n[bold]Custom (~/.copilot/honk/agent-templates/):[/bold]")
-    if CUSTOM_TEMPLATES_DIR.exists():
-        custom_templates = list(CUSTOM_TEMPLATES_DIR.glob("*.agent.md"))
-        if custom_templates:
-            for template_path in custom_templates:
-                name = template_path.stem.replace(".agent", "")
-                console.print(f"  [info]{name}[/info]")
-        else:
-            console.print("  (No custom templates found)")
-    else:
+    custom_templates = _template_names(CUSTOM_TEMPLATES_DIR)
+    if custom_templates is None:
         console.print("  (Custom templates directory not found)")
+    elif custom_templates:
+        for name in custom_templates:
+            console.print(f"  [info]{name}[/info]")
+    else:
+        console.print("  (No custom templates found)")
+
+def _template_names(templates_dir: Path) -> Optional[List[str]]:
+    """Get the names of the *.agent.md templates in a directory.
+    
+    Returns:
+        Template names, or None if the directory does not exist
+    """
+    # One directory read; entries carry their file type, no per-file stat
+    try:
+        with os.scandir(templates_dir) as it:
+            return [
+                entry.name[:-len(".agent.md")]
+                for entry in it
+                if entry.name.endswith(".agent.md") and entry.is_file()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        return None
 
 @template_app.command("show")
 def show_template(
@@ -126,7 +141,10 @@ def add_template(
       Source file is validated before being saved as template.
       If validation fails, template is not created.
     """
-    if not from_file.exists():
+    # Read the source once: the same bytes are validated and written out
+    try:
+        data = from_file.read_bytes()
+    except FileNotFoundError:
         print_error(f"Source file not found: {from_file}")
         raise typer.Exit(1)
     
@@ -138,8 +156,10 @@ def add_template(
         raise typer.Exit(1)
     
     # Validate source file before adding as template
-    validator = YAMLFrontmatterValidator(schema_path=Path("schemas/agent.v1.json"))
-    validation_result = validator.validate_file(from_file)
+    from honk.internal.validation._cache import get_validator
+    
+    validator = get_validator(Path("schemas/agent.v1.json"))
+    validation_result = validator.validate_bytes(data)
 
     if not validation_result.valid:
         print_error(f"Source file '{from_file}' is not a valid agent file:")
@@ -147,5 +167,7 @@ def add_template(
             console.print(f"  [error]Error:[/error] {error}")
         raise typer.Exit(1)
 
-    new_template_path.write_text(from_file.read_text())
+    from honk.internal.fs import atomic_write_bytes
+    
+    atomic_write_bytes(new_template_path, data)
     print_success(f"✓ Added custom template '{name}' from '{from_file}' to '{new_template_path}'")
@@ -1,9 +1,9 @@
+import os
 import typer
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Union
 
 from honk.ui import print_success, print_error, print_info, console
-from honk.internal.validation.yaml_validator import YAMLFrontmatterValidator
 
 validate_app = typer.Typer()
 
@@ -65,11 +65,18 @@ def validate_agent(
         print_error(f"Agent directory not found: {agent_dir}")
         raise typer.Exit(1)
 
-    validator = YAMLFrontmatterValidator(schema_path=Path("schemas/agent.v1.json"))
+    from honk.internal.validation._cache import validate_files_cached
     
-    agents_to_validate: List[Path] = []
+    schema_path = Path("schemas/agent.v1.json")
+    
+    agents_to_validate: List[Union[Path, os.DirEntry]] = []
     if all_agents:
-        agents_to_validate = list(agent_dir.glob("*.agent.md"))
+        # One directory read; entries carry their file type, no per-file stat
+        with os.scandir(agent_dir) as it:
+            agents_to_validate = [
+                entry for entry in it
+                if entry.name.endswith(".agent.md") and entry.is_file()
+            ]
     elif name:
         agent_file = agent_dir / f"{name}.agent.md"
         if not agent_file.exists():
@@ -81,16 +88,16 @@ def validate_agent(
         raise typer.Exit(1)
 
     overall_success = True
-    for agent_file in agents_to_validate:
-        console.print(f"Validating [info]{agent_file.name}[/info]...")
-        result = validator.validate_file(agent_file)
+    results = validate_files_cached(agents_to_validate, schema_path)
+    for agent_entry, result in zip(agents_to_validate, results):
+        console.print(f"Validating [info]{agent_entry.name}[/info]...")
         
         if result.valid:
-            print_success(f"✓ Validated: {agent_file.name}")
+            print_success(f"✓ Validated: {agent_entry.name}")
             # TODO: Add strict mode checks here
         else:
             overall_success = False
-            print_error(f"✗ Validation failed for: {agent_file.name}")
+            print_error(f"✗ Validation failed for: {agent_entry.name}")
             for error in result.errors:
                 console.print(f"  [error]Error:[/error] {error}")
         
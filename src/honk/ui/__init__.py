@@ -1,5 +1,7 @@
 """Honk UI utilities."""
 
+from typing import TYPE_CHECKING, Any
+
 from .theme import (
     console,
     print_success,
@@ -10,11 +12,18 @@ from .theme import (
     print_kv,
     print_code,
 )
-from .progress import (
-    progress_step,
-    progress_tracker,
-    ProgressTracker,
-)
+
+if TYPE_CHECKING:
+    from .progress import (
+        progress_step,
+        progress_tracker,
+        ProgressTracker,
+        reset_json_mode,
+    )
+
+# Imported from .progress on first access, so commands without progress
+# bars don't load it
+_PROGRESS_EXPORTS = {"progress_step", "progress_tracker", "ProgressTracker", "reset_json_mode"}
 
 __all__ = [
     "console",
@@ -28,4 +37,13 @@ __all__ = [
     "progress_step",
     "progress_tracker",
     "ProgressTracker",
+    "reset_json_mode",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _PROGRESS_EXPORTS:
+        from . import progress
+        
+        return getattr(progress, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
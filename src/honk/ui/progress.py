@@ -7,18 +7,29 @@ Provides reusable progress indicators (spinners, progress bars) that:
 - Transient (disappear after completion)
 """
 
+import functools
 import os
 import sys
+import time
 from contextlib import contextmanager
-from typing import Iterator
-
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-from rich.console import Console
+from typing import TYPE_CHECKING, Iterator
 
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.progress import TaskID
 
+# advance() hands accumulated units to Rich after this many units or seconds
+ADVANCE_BATCH_SIZE = 16
+ADVANCE_FLUSH_INTERVAL = 0.05
 
+@functools.lru_cache(maxsize=1)
 def _is_json_mode() -> bool:
-    """Check if running in JSON output mode (should be silent)."""
+    """Check if running in JSON output mode (should be silent).
+
+    Decided once per process: the environment and stdout don't change while
+    a command runs, and isatty() is a syscall. Call reset_json_mode() after
+    changing either.
+    """
     return (
         os.getenv("HONK_JSON_MODE") == "1"
         or os.getenv("NO_COLOR") is not None
@@ -26,11 +37,16 @@ def _is_json_mode() -> bool:
     )
 
 
+def reset_json_mode() -> None:
+    """Forget the cached JSON mode decision so the next check re-reads it."""
+    _is_json_mode.cache_clear()
+
+
 @contextmanager
 def progress_step(
     description: str,
     *,
-    console: Console | None = None,
+    console: "Console | None" = None,
     spinner: str = "dots",
     style: str | None = None,
 ) -> Iterator[None]:
@@ -55,9 +71,9 @@ def progress_step(
         return
 
     if console is None:
-        from . import console as default_console
+        from .theme import get_console
 
-        console = default_console
+        console = get_console()
 
     # Use theme's emphasis color if no style specified
     if style is None:
@@ -70,17 +86,18 @@ def progress_step(
 class ProgressTracker:
     """Multi-step progress tracker with optional progress bars."""
 
-    def __init__(self, console: Console | None = None, transient: bool = True):
+    def __init__(self, console: "Console | None" = None, transient: bool = True):
         """Initialize progress tracker.
 
         Args:
             console: Rich Console (default: uses ui.console)
             transient: Clear display after completion (default: True)
         """
-        from rich.progress import TaskID
         self.transient = transient
-        self.current_task_id: TaskID | None = None
+        self.current_task_id: "TaskID | None" = None
         self._silent = _is_json_mode()
+        self._pending = 0
+        self._last_flush = time.monotonic()
 
         if self._silent:
             self.console = None
@@ -88,12 +105,14 @@ class ProgressTracker:
             return
 
         if console is None:
-            from . import console as default_console
+            from .theme import get_console
 
-            console = default_console
+            console = get_console()
 
         self.console = console
 
+        from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+
         # Create Progress with custom columns
         self.progress = Progress(
             SpinnerColumn(),
@@ -113,6 +132,7 @@ class ProgressTracker:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Exit context manager."""
         if not self._silent and self.progress:
+            self._flush_advance()
             self.progress.__exit__(exc_type, exc_val, exc_tb)
 
     def step(
@@ -141,6 +161,7 @@ class ProgressTracker:
 
         # Add new task
         if self.progress is not None:
+            self._flush_advance()
             self.current_task_id = self.progress.add_task(styled_desc, total=total)
 
     def advance(self, n: int = 1) -> None:
@@ -152,8 +173,20 @@ class ProgressTracker:
         if self._silent or self.current_task_id is None:
             return
 
-        if self.progress is not None:
-            self.progress.update(self.current_task_id, advance=n)
+        # Batch updates; each Rich update can trigger a repaint
+        self._pending += n
+        if (
+            self._pending >= ADVANCE_BATCH_SIZE
+            or time.monotonic() - self._last_flush >= ADVANCE_FLUSH_INTERVAL
+        ):
+            self._flush_advance()
+
+    def _flush_advance(self) -> None:
+        """Pass advances accumulated by advance() on to the current task."""
+        if self._pending and self.progress is not None and self.current_task_id is not None:
+            self.progress.update(self.current_task_id, advance=self._pending)
+        self._pending = 0
+        self._last_flush = time.monotonic()
 
     def complete(self, summary: str | None = None) -> None:
         """Complete tracking with optional summary message.
@@ -164,6 +197,7 @@ class ProgressTracker:
         if self._silent:
             return
 
+        self._flush_advance()
         if summary and self.console:
             self.console.print(f"✓ {summary}", style="success")
 
@@ -176,6 +210,7 @@ class ProgressTracker:
         if self._silent:
             return
 
+        self._flush_advance()
         if self.console:
             self.console.print(f"✗ {error}", style="error")
 
@@ -183,7 +218,7 @@ class ProgressTracker:
 @contextmanager
 def progress_tracker(
     *,
-    console: Console | None = None,
+    console: "Console | None" = None,
     transient: bool = True,
 ) -> Iterator[ProgressTracker]:
     """Create multi-step progress tracker.
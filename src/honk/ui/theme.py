@@ -1,11 +1,15 @@
 """Honk CLI design system - colors, styles, and output helpers."""
 
+import functools
 import os
-from rich.console import Console
-from rich.theme import Theme
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.theme import Theme
 
 # Define semantic color tokens
-HONK_THEME = Theme({
+HONK_STYLES = {
     # Status messages
     "success": "bold green",
     "error": "bold red",
@@ -21,11 +25,52 @@ HONK_THEME = Theme({
     
     # Branding (optional)
     "brand": "magenta",
-})
+}
+
+
+@functools.lru_cache(maxsize=1)
+def get_theme() -> "Theme":
+    """Get the Rich theme for HONK_STYLES, importing Rich on first use."""
+    from rich.theme import Theme
+    
+    return Theme(HONK_STYLES)
+
+
+@functools.lru_cache(maxsize=1)
+def get_console() -> "Console":
+    """Get the shared console, created on first use with NO_COLOR support.
+    
+    This is the same instance the print_* helpers use for the color setting
+    in effect at first use, so a process normally builds a single Console.
+    """
+    return _get_console()
+
+
+class _LazyConsole:
+    """Module-level `console` that defers importing Rich until it is used."""
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_console(), name)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(get_console(), name, value)
+    
+    def __enter__(self) -> "Console":
+        return get_console().__enter__()
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        get_console().__exit__(*exc_info)
+
+
+# Shared console instance
+console: "Console" = _LazyConsole()  # type: ignore[assignment]
 
-# Create shared console instance with NO_COLOR support
-_no_color = os.getenv("NO_COLOR") or os.getenv("HONK_NO_COLOR")
-console = Console(theme=HONK_THEME, no_color=bool(_no_color), force_terminal=True)
+
+def __getattr__(name: str) -> Any:
+    # HONK_THEME is built lazily so importing this module doesn't import Rich
+    if name == "HONK_THEME":
+        return get_theme()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Status message helpers with icons
@@ -54,10 +99,22 @@ def print_dim(msg: str) -> None:
     _get_console().print(msg, style="dim")
 
 
-def _get_console() -> Console:
+def _get_console() -> "Console":
     """Get console instance respecting current NO_COLOR setting."""
     no_color = bool(os.getenv("NO_COLOR") or os.getenv("HONK_NO_COLOR"))
-    return Console(theme=HONK_THEME, no_color=no_color, force_terminal=True)
+    return _themed_console(no_color)
+
+
+@functools.lru_cache(maxsize=2)
+def _themed_console(no_color: bool) -> "Console":
+    """Build the themed console once per color setting.
+    
+    The console writes to whatever sys.stdout is at print time, so reusing it
+    is safe even when stdout is swapped (e.g. by test runners).
+    """
+    from rich.console import Console
+    
+    return Console(theme=get_theme(), no_color=no_color, force_terminal=True)
 
 
 # Structured output helpers
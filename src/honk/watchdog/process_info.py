@@ -1,11 +1,20 @@
 """Process identification and naming utilities."""
 
-import psutil
+import functools
+import sys
 from typing import Optional, Dict, List, Tuple
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 from .pty_scanner import PTYProcess
 
+# Resolve names on a thread pool once there are this many processes
+PARALLEL_LOOKUP_THRESHOLD = 4
+MAX_LOOKUP_WORKERS = 16
+
+# Node, Python, Ruby, etc - second arg is usually the real app
+INTERPRETERS = frozenset({'node', 'python', 'python3', 'ruby', 'perl'})
+
 
 def get_human_readable_name(pid: int, command: Optional[str]) -> str:
     """
@@ -26,43 +35,59 @@ def get_human_readable_name(pid: int, command: Optional[str]) -> str:
     if not command:
         return "unknown"
     
+    import psutil
+    
+    try:
+        # Identifies this process instance, so a reused PID misses the cache
+        create_time = psutil.Process(pid).create_time()
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return command.split('/')[-1].split()[0]
+    
+    return _resolve_name(pid, create_time, command)
+
+
+@functools.lru_cache(maxsize=4096)
+def _resolve_name(pid: int, create_time: float, command: str) -> str:
+    """Resolve a process name once per (pid, create_time, command)."""
+    import psutil
+    
     try:
         proc = psutil.Process(pid)
-        cmdline = proc.cmdline()
+        # Fetch everything up front so psutil can share the /proc reads
+        with proc.oneshot():
+            cmdline = proc.cmdline()
+            try:
+                exe = proc.exe()
+            except psutil.AccessDenied:
+                exe = ""  # Only needed for the Homebrew check
         
         # Strategy 1: For interpreters, extract actual application
         base_cmd = command.split('/')[-1].split()[0]
         
-        # Node, Python, Ruby, etc - second arg is usually the real app
-        interpreters = ['node', 'python', 'python3', 'ruby', 'perl']
-        if base_cmd in interpreters and len(cmdline) >= 2:
+        if base_cmd in INTERPRETERS and len(cmdline) >= 2:
             app_arg = cmdline[1]
             app_name = app_arg.split('/')[-1].split()[0]  # Remove path and args
             if app_name and app_name != base_cmd and not app_name.startswith('-'):
                 return f"{base_cmd}:{app_name}"
         
-        # Strategy 2: Check if Homebrew app
-        exe = proc.exe()
-        if 'homebrew' in exe.lower() or 'cellar' in exe.lower():
-            parts = exe.split('/')
-            if 'Cellar' in parts:
-                idx = parts.index('Cellar')
-                if idx + 1 < len(parts):
-                    brew_name = parts[idx + 1]
-                    # For node apps, still try to get the actual app
-                    if brew_name in interpreters and len(cmdline) >= 2:
-                        app_arg = cmdline[1]
-                        app_name = app_arg.split('/')[-1].split()[0]
-                        if app_name and not app_name.startswith('-'):
-                            return f"{brew_name}:{app_name}"
-                    return brew_name
+        # Strategy 2: Check if Homebrew app (.../Cellar/<package>/<version>/...)
+        idx = exe.find('/Cellar/')
+        if idx != -1:
+            brew_name = exe[idx + len('/Cellar/'):].split('/', 1)[0]
+            # For node apps, still try to get the actual app
+            if brew_name in INTERPRETERS and len(cmdline) >= 2:
+                app_arg = cmdline[1]
+                app_name = app_arg.split('/')[-1].split()[0]
+                if app_name and not app_name.startswith('-'):
+                    return f"{brew_name}:{app_name}"
+            return brew_name
         
         # Strategy 3: Fallback to basic command name
         return base_cmd
         
     except (psutil.NoSuchProcess, psutil.AccessDenied, IndexError):
         # Fallback if psutil fails
-        return command.split('/')[-1].split()[0] if command else "unknown"
+        return command.split('/')[-1].split()[0]
 
 
 def get_application_pty_summary(processes: Dict[int, PTYProcess]) -> List[Dict]:
@@ -83,39 +108,38 @@ def get_application_pty_summary(processes: Dict[int, PTYProcess]) -> List[Dict]:
             - process_count: Number of processes for this app
             - pids: List of PIDs belonging to this app
     """
-    from typing import TypedDict
-    
-    class AppStats(TypedDict):
-        total_ptys: int
-        pids: list[int]
-        process_count: int
-    
-    app_usage: dict[str, AppStats] = defaultdict(lambda: {"total_ptys": 0, "pids": [], "process_count": 0})  # type: ignore[misc]
+    # One counter and one PID list per application instead of a stats dict
+    total_ptys: Counter[str] = Counter()
+    pids_by_app: defaultdict[str, list[int]] = defaultdict(list)
     
-    for pid, proc in processes.items():
-        app_name = get_human_readable_name(pid, proc.command)
-        app_usage[app_name]["total_ptys"] += proc.pty_count
-        app_usage[app_name]["pids"].append(pid)
-        app_usage[app_name]["process_count"] += 1
+    for (pid, proc), app_name in zip(processes.items(), _resolve_names(processes)):
+        total_ptys[app_name] += proc.pty_count
+        pids_by_app[app_name].append(pid)
     
-    # Convert to list and sort by total PTYs (descending)
-    summary = [
+    # most_common() sorts by total PTYs (descending), keeping first-seen order for ties
+    return [
         {
             "application": app_name,
-            "total_ptys": stats["total_ptys"],
-            "process_count": stats["process_count"],
-            "pids": stats["pids"],
+            "total_ptys": total,
+            "process_count": len(pids_by_app[app_name]),
+            "pids": pids_by_app[app_name],
         }
-        for app_name, stats in app_usage.items()
+        for app_name, total in total_ptys.most_common()
     ]
+
+
+def _resolve_names(processes: Dict[int, PTYProcess]) -> List[str]:
+    """Get the human-readable name of each process, in dict order."""
+    if len(processes) < PARALLEL_LOOKUP_THRESHOLD:
+        return [get_human_readable_name(pid, proc.command) for pid, proc in processes.items()]
     
-    # Sort by total PTYs (need explicit cast for mypy since dict values are object)
-    def get_pty_count(item: dict[str, object]) -> int:
-        val = item.get("total_ptys") or 0
-        return int(val)  # type: ignore[call-overload]
-    
-    summary.sort(key=get_pty_count, reverse=True)
-    return summary
+    # Lookups mostly wait on /proc reads, so overlap them
+    workers = min(MAX_LOOKUP_WORKERS, len(processes))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(
+            lambda item: get_human_readable_name(item[0], item[1].command),
+            processes.items(),
+        ))
 
 
 def get_process_lineage(pid: int, max_depth: int = 10) -> List[Tuple[int, str]]:
@@ -130,21 +154,40 @@ def get_process_lineage(pid: int, max_depth: int = 10) -> List[Tuple[int, str]]:
         List of (pid, name) tuples from current process up to root
         Example: [(1234, "node:copilot"), (5678, "zsh"), (1, "launchd")]
     """
+    import psutil
+    
     lineage = []
     
     try:
-        proc = psutil.Process(pid)
-        
-        # Add current process
-        lineage.append((proc.pid, proc.name()))
+        name, ppid = _name_and_ppid(pid)
+        lineage.append((pid, name))
         
-        # Walk up the tree
-        for ancestor in proc.parents():
-            lineage.append((ancestor.pid, ancestor.name()))
+        # Walk up the tree by parent PID (0 means no parent)
+        while ppid > 0 and ppid != pid:
+            pid = ppid
+            name, ppid = _name_and_ppid(pid)
+            lineage.append((pid, name))
             if len(lineage) >= max_depth:
                 break
                 
-    except (psutil.NoSuchProcess, psutil.AccessDenied):
+    except (OSError, ValueError, psutil.NoSuchProcess, psutil.AccessDenied):
         pass
     
     return lineage
+
+
+def _name_and_ppid(pid: int) -> Tuple[str, int]:
+    """Get a process's short name and parent PID."""
+    if sys.platform.startswith("linux"):
+        # One read gives both: "PID (comm) state PPID ...". comm may contain
+        # spaces and parentheses, so split on the last ")"
+        with open(f"/proc/{pid}/stat", "rb") as f:
+            stat = f.read().decode("utf-8", "replace")
+        head, _, rest = stat.rpartition(")")
+        return head.partition("(")[2], int(rest.split()[1])
+    
+    import psutil
+    
+    proc = psutil.Process(pid)
+    with proc.oneshot():
+        return proc.name(), proc.ppid()
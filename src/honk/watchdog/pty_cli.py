@@ -2,6 +2,7 @@
 
 import sys
 import time
+import selectors
 import signal
 import json
 import subprocess
@@ -11,9 +12,9 @@ import typer
 from ..result import EXIT_OK, EXIT_PREREQ_FAILED, EXIT_SYSTEM
 from ..ui import console, print_success, print_error, print_info
 from ..version import format_version_banner
-from .pty_scanner import scan_ptys, kill_processes, get_heavy_users, get_suspected_leaks
+from .pty_scanner import scan_ptys, kill_processes, wait_for_exit, get_heavy_users_and_leaks, get_suspected_leaks
 from .process_info import get_human_readable_name, get_application_pty_summary
-from ..log import log_event, LOG_FILE_PATH
+from ..log import log_event, read_lines_reversed, LOG_FILE_PATH
 
 pty_app = typer.Typer(help="PTY session monitoring and cleanup")
 
@@ -38,41 +39,42 @@ def show(
 ):
     """Display current PTY usage and detect potential leaks."""
     try:
-        processes = scan_ptys()
-        total_ptys = sum(p.pty_count for p in processes.values())
-        heavy_users = get_heavy_users(processes, threshold=4)
-        suspected_leaks = get_suspected_leaks(processes, threshold=4)
+        scan = scan_ptys()
+        processes = scan.processes
+        total_ptys = scan.total_ptys
+        heavy_users, suspected_leaks = get_heavy_users_and_leaks(processes, threshold=4)
         app_summary = get_application_pty_summary(processes)
         
-        facts = {
-            "total_ptys": total_ptys,
-            "process_count": len(processes),
-            "applications": app_summary,  # NEW: Application-level view
-            "heavy_users": [
-                {
-                    "pid": p.pid,
-                    "command": p.command,
-                    "application": get_human_readable_name(p.pid, p.command),  # NEW: Better name
-                    "parent_pid": p.parent_pid,
-                    "pty_count": p.pty_count,
-                    "ptys": p.ptys[:5] + (["..."] if p.pty_count > 5 else [])
-                }
-                for p in heavy_users
-            ],
-            "suspected_leaks": [
-                {
-                    "pid": p.pid,
-                    "command": p.command,
-                    "application": get_human_readable_name(p.pid, p.command),  # NEW: Better name
-                    "parent_pid": p.parent_pid,
-                    "pty_count": p.pty_count,
-                    "reason": "copilot-like process with >4 PTYs"
-                }
-                for p in suspected_leaks
-            ],
-        }
-        
         if json_output:
+            # Only JSON output needs the per-process fact dicts
+            facts = {
+                "total_ptys": total_ptys,
+                "process_count": len(processes),
+                "applications": app_summary,  # NEW: Application-level view
+                "heavy_users": [
+                    {
+                        "pid": p.pid,
+                        "command": p.command,
+                        "application": get_human_readable_name(p.pid, p.command),  # NEW: Better name
+                        "parent_pid": p.parent_pid,
+                        "pty_count": p.pty_count,
+                        "ptys": p.ptys[:5] + (["..."] if p.pty_count > 5 else [])
+                    }
+                    for p in heavy_users
+                ],
+                "suspected_leaks": [
+                    {
+                        "pid": p.pid,
+                        "command": p.command,
+                        "application": get_human_readable_name(p.pid, p.command),  # NEW: Better name
+                        "parent_pid": p.parent_pid,
+                        "pty_count": p.pty_count,
+                        "reason": "copilot-like process with >4 PTYs"
+                    }
+                    for p in suspected_leaks
+                ],
+            }
+            
             envelope = build_result_envelope(
                 command=["honk", "watchdog", "pty", "show"],
                 status="ok",
@@ -132,8 +134,9 @@ def clean(
 ):
     """Kill processes with orphaned PTY sessions."""
     try:
-        processes_before = scan_ptys()
-        total_ptys_before = sum(p.pty_count for p in processes_before.values())
+        scan_before = scan_ptys()
+        processes_before = scan_before.processes
+        total_ptys_before = scan_before.total_ptys
         suspected_leaks = get_suspected_leaks(processes_before, threshold=threshold)
         
         if not suspected_leaks:
@@ -189,12 +192,13 @@ def clean(
 
         kill_results = kill_processes(pids_to_kill)
         
-        time.sleep(0.5)
-        processes_after = scan_ptys()
-        total_ptys_after = sum(p.pty_count for p in processes_after.values())
+        wait_for_exit(pid for pid, killed in kill_results.items() if killed)
+        scan_after = scan_ptys()
+        processes_after = scan_after.processes
+        total_ptys_after = scan_after.total_ptys
         freed_ptys = total_ptys_before - total_ptys_after
         
-        killed_list = [{"pid": p.pid, "command": p.command, "parent_pid": p.parent_pid, "pty_count": p.pty_count, "success": kill_results.get(p.pid, False)} for p in suspected_leaks if p.pid in pids_to_kill]
+        killed_list = [{"pid": p.pid, "command": p.command, "parent_pid": p.parent_pid, "pty_count": p.pty_count, "success": kill_results.get(p.pid, False)} for p in suspected_leaks if p.pid in kill_results]
         
         if json_output:
             envelope = build_result_envelope(
@@ -227,14 +231,73 @@ def clean(
         sys.exit(EXIT_SYSTEM)
 
 
+# Takes the message and title as arguments so they are never parsed as AppleScript
+NOTIFY_SCRIPT = [
+    "on run argv",
+    "display notification (item 1 of argv) with title (item 2 of argv)",
+    "end run",
+]
+
+
 def send_notification(title, message):
     """Send a system notification on macOS."""
+    cmd = ["osascript"]
+    for line in NOTIFY_SCRIPT:
+        cmd.extend(["-e", line])
     try:
-        subprocess.run(['osascript', '-e', f'display notification "{message}" with title "{title}"'])
+        subprocess.run(cmd + [message, title], check=False)
     except FileNotFoundError:
         pass
 
 
+class _StopSignals:
+    """Interruptible sleep for watch: wakes as soon as SIGINT or SIGTERM arrives.
+    
+    The handlers only set a flag; a signal.set_wakeup_fd pipe makes the
+    selector return immediately, so the loop stops between iterations
+    instead of exiting from inside a signal handler.
+    """
+    
+    def __init__(self) -> None:
+        self.stopped = False
+    
+    def __enter__(self) -> "_StopSignals":
+        self._read_fd, self._write_fd = os.pipe()
+        os.set_blocking(self._read_fd, False)
+        os.set_blocking(self._write_fd, False)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._read_fd, selectors.EVENT_READ)
+        self._previous_handlers = {
+            sig: signal.signal(sig, self._handle) for sig in (signal.SIGINT, signal.SIGTERM)
+        }
+        self._previous_wakeup_fd = signal.set_wakeup_fd(self._write_fd)
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        signal.set_wakeup_fd(self._previous_wakeup_fd)
+        for sig, handler in self._previous_handlers.items():
+            signal.signal(sig, handler)
+        self._selector.close()
+        os.close(self._read_fd)
+        os.close(self._write_fd)
+    
+    def _handle(self, sig, frame) -> None:
+        self.stopped = True
+    
+    def wait(self, timeout: float) -> None:
+        """Sleep for timeout seconds, returning early once stopped."""
+        deadline = time.monotonic() + timeout
+        while not self.stopped:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            if self._selector.select(remaining):
+                try:
+                    os.read(self._read_fd, 4096)  # Drain the wakeup bytes
+                except BlockingIOError:
+                    pass
+
+
 @pty_app.command("watch")
 def watch(
     interval: int = typer.Option(5, "--interval", help="Check interval in seconds"),
@@ -244,54 +307,54 @@ def watch(
 ):
     """Monitor PTY usage and auto-clean when thresholds are exceeded."""
     try:
-        def signal_handler(sig, frame):
-            if not json_output:
-                console.print("\n[bold]Stopping watch...[/bold]")
-            sys.exit(EXIT_OK)
-        
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
-        
         if not json_output:
             console.print(f"\n[bold cyan]Watching PTY usage every {interval}s...[/bold cyan] [dim](Ctrl+C to stop)[/dim]\n")
         
-        while True:
-            processes = scan_ptys()
-            total_ptys = sum(p.pty_count for p in processes.values())
-            
-            if json_output:
-                event = {"event": "scan", "total_ptys": total_ptys, "process_count": len(processes)}
-                console.print(json.dumps(event))
-            else:
-                timestamp = time.strftime("%H:%M:%S")
-                status_line = f"[{timestamp}] PTYs={total_ptys}  procs={len(processes)}"
+        with _StopSignals() as stop_signals:
+            while not stop_signals.stopped:
+                scan = scan_ptys()
+                processes = scan.processes
+                total_ptys = scan.total_ptys
                 
-                if total_ptys > max_ptys:
-                    console.print(f"{status_line}  [bold red]!! HIGH — cleaning…[/bold red]")
+                if json_output:
+                    event = {"event": "scan", "total_ptys": total_ptys, "process_count": len(processes)}
+                    # One compact line per tick: skip Rich markup parsing and wrapping
+                    print(json.dumps(event, separators=(",", ":")), flush=True)
+                else:
+                    timestamp = time.strftime("%H:%M:%S")
+                    status_line = f"[{timestamp}] PTYs={total_ptys}  procs={len(processes)}"
                     
-                    suspected_leaks = get_suspected_leaks(processes, threshold=4)
-                    if suspected_leaks:
-                        pids_to_kill = [p.pid for p in suspected_leaks]
-                        kill_processes(pids_to_kill)
+                    if total_ptys > max_ptys:
+                        console.print(f"{status_line}  [bold red]!! HIGH — cleaning…[/bold red]")
                         
-                        time.sleep(0.5)
-                        processes_after = scan_ptys()
-                        freed = total_ptys - sum(p.pty_count for p in processes_after.values())
-                        
-                        console.print(f"  [green]→ Killed {len(suspected_leaks)} processes ({freed} PTYs freed)[/green]")
+                        # Checked every high tick: a process can become an orphan or a
+                        # zombie without its PTYs or the PID set changing
+                        suspected_leaks = get_suspected_leaks(processes, threshold=4)
+                        if suspected_leaks:
+                            pids_to_kill = [p.pid for p in suspected_leaks]
+                            kill_results = kill_processes(pids_to_kill)
+                            
+                            wait_for_exit(pid for pid, killed in kill_results.items() if killed)
+                            freed = total_ptys - scan_ptys().total_ptys
+                            
+                            console.print(f"  [green]→ Killed {len(suspected_leaks)} processes ({freed} PTYs freed)[/green]")
 
-                        if notify:
-                            send_notification("Honk PTY Watchdog", f"Killed {len(suspected_leaks)} processes, freed {freed} PTYs")
+                            if notify:
+                                send_notification("Honk PTY Watchdog", f"Killed {len(suspected_leaks)} processes, freed {freed} PTYs")
 
-                        log_event("pty_cleanup", {
-                            "killed_count": len(suspected_leaks),
-                            "freed_ptys": freed,
-                            "killed_pids": pids_to_kill
-                        })
-                else:
-                    console.print(status_line)
-            
-            time.sleep(interval)
+                            log_event("pty_cleanup", {
+                                "killed_count": len(suspected_leaks),
+                                "freed_ptys": freed,
+                                "killed_pids": pids_to_kill
+                            })
+                    else:
+                        console.print(status_line)
+                
+                stop_signals.wait(interval)
+        
+        if not json_output:
+            console.print("\n[bold]Stopping watch...[/bold]")
+        sys.exit(EXIT_OK)
         
     except RuntimeError as e:
         print_error(str(e))
@@ -311,19 +374,18 @@ def history(
         sys.exit(EXIT_OK)
         
     try:
-        with open(LOG_FILE_PATH, "r") as f:
-            lines = f.readlines()
-            
         from typing import Any
         entries: list[dict[str, Any]] = []
-        for line in reversed(lines):
+        # Newest first, stopping once enough entries are found
+        for line in read_lines_reversed(LOG_FILE_PATH):
             if len(entries) >= limit:
                 break
             try:
                 log_entry = json.loads(line)
                 data_str = log_entry.get("data")
                 if data_str:
-                    data = json.loads(data_str)
+                    # setup_logging's formatter embeds the event as a JSON object
+                    data = data_str if isinstance(data_str, dict) else json.loads(data_str)
                     if data.get("event_type") == "pty_cleanup":
                         data['timestamp'] = log_entry.get("timestamp")
                         entries.append(data)
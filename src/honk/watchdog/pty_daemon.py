@@ -11,7 +11,7 @@ from datetime import datetime, timezone
 from typing import Optional
 from dataclasses import dataclass
 
-from .pty_scanner import scan_ptys, kill_processes, get_heavy_users, get_suspected_leaks
+from .pty_scanner import scan_ptys, kill_processes, get_heavy_users_and_leaks
 
 
 @dataclass
@@ -219,10 +219,10 @@ class PTYDaemon:
             self._log(f"Scan #{self.scan_count} starting...")
             
             # Scan PTYs
-            processes = scan_ptys()
-            total_ptys = sum(p.pty_count for p in processes.values())
-            heavy_users = get_heavy_users(processes, threshold=4)
-            suspected_leaks = get_suspected_leaks(processes, threshold=4)
+            scan = scan_ptys()
+            processes = scan.processes
+            total_ptys = scan.total_ptys
+            heavy_users, suspected_leaks = get_heavy_users_and_leaks(processes, threshold=4)
             
             # Auto-kill if threshold exceeded
             killed = []
@@ -1,16 +1,14 @@
 """PTY scanner and process detection."""
 
+import functools
 import subprocess
 import os
 import signal
-from typing import Dict, List
+from typing import Dict, Iterable, List, Tuple
 from dataclasses import dataclass
 
-try:
-    import psutil  # noqa: F401
-    HAS_PSUTIL = True
-except ImportError:
-    HAS_PSUTIL = False
+# Seconds to wait for killed processes to exit before rescanning
+KILL_WAIT_TIMEOUT = 2.0
 
 
 @dataclass
@@ -24,6 +22,18 @@ class PTYProcess:
     @property
     def pty_count(self) -> int:
         return len(self.ptys)
+    
+    @functools.cached_property
+    def command_folded(self) -> str:
+        """Case-folded command for matching, computed once (after parsing)."""
+        return (self.command or "").casefold()
+
+
+@dataclass
+class ScanResult:
+    """Processes holding PTYs and the total number of PTYs they hold."""
+    processes: Dict[int, PTYProcess]
+    total_ptys: int
 
 
 def run_lsof() -> str:
@@ -58,7 +68,13 @@ def run_lsof() -> str:
 
 def parse_lsof_output(output: str) -> Dict[int, PTYProcess]:
     """Parse lsof output into process → PTY mapping."""
+    return _parse_lsof(output).processes
+
+
+def _parse_lsof(output: str) -> ScanResult:
+    """Parse lsof output, counting PTYs as they are added."""
     processes: Dict[int, PTYProcess] = {}
+    total_ptys = 0
     current_pid: int | None = None
     
     for line in output.splitlines():
@@ -80,14 +96,15 @@ def parse_lsof_output(output: str) -> Dict[int, PTYProcess]:
         elif line.startswith("n/dev/ttys"):  # PTY path
             if current_pid and current_pid in processes:
                 processes[current_pid].ptys.append(line[1:])
+                total_ptys += 1
     
-    return processes
+    return ScanResult(processes=processes, total_ptys=total_ptys)
 
 
-def scan_ptys() -> Dict[int, PTYProcess]:
+def scan_ptys() -> ScanResult:
     """Scan system for PTY usage."""
     output = run_lsof()
-    return parse_lsof_output(output)
+    return _parse_lsof(output)
 
 
 def is_leak_candidate(proc: PTYProcess, threshold: int = 4) -> bool:
@@ -127,6 +144,20 @@ def kill_processes(pids: List[int]) -> Dict[int, bool]:
     return results
 
 
+def wait_for_exit(pids: Iterable[int], timeout: float = KILL_WAIT_TIMEOUT) -> None:
+    """Wait until the processes have exited, or until timeout seconds pass."""
+    import psutil
+    
+    procs = []
+    for pid in pids:
+        try:
+            procs.append(psutil.Process(pid))
+        except psutil.NoSuchProcess:
+            pass  # Already gone
+    # Returns as soon as all of them are gone
+    psutil.wait_procs(procs, timeout=timeout)
+
+
 def get_heavy_users(processes: Dict[int, PTYProcess], threshold: int = 4) -> List[PTYProcess]:
     """Find processes using more than threshold PTYs."""
     return [p for p in processes.values() if p.pty_count > threshold]
@@ -134,4 +165,24 @@ def get_heavy_users(processes: Dict[int, PTYProcess], threshold: int = 4) -> Lis
 
 def get_suspected_leaks(processes: Dict[int, PTYProcess], threshold: int = 4) -> List[PTYProcess]:
     """Find suspected leak candidates."""
-    return [p for p in processes.values() if is_leak_candidate(p, threshold)]
+    from .safety import process_cache
+    
+    with process_cache():
+        return [p for p in processes.values() if is_leak_candidate(p, threshold)]
+
+
+def get_heavy_users_and_leaks(
+    processes: Dict[int, PTYProcess], threshold: int = 4
+) -> Tuple[List[PTYProcess], List[PTYProcess]]:
+    """Find heavy users and suspected leak candidates in one pass."""
+    from .safety import process_cache
+    
+    heavy_users: List[PTYProcess] = []
+    suspected_leaks: List[PTYProcess] = []
+    with process_cache():
+        for p in processes.values():
+            if p.pty_count > threshold:
+                heavy_users.append(p)
+            if is_leak_candidate(p, threshold):
+                suspected_leaks.append(p)
+    return heavy_users, suspected_leaks
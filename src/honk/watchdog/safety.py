@@ -1,11 +1,42 @@
 """Safety check utilities for PTY process management."""
 
 import os
-from typing import Tuple
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
 import psutil
 
 from .pty_scanner import PTYProcess
 
+# psutil.Process objects shared by the checks while a process_cache() is open
+_proc_cache: Optional[Dict[int, psutil.Process]] = None
+
+
+@contextmanager
+def process_cache() -> Iterator[None]:
+    """Share one psutil.Process per PID between the checks in this block.
+    
+    Only meant for a single pass over a scan: the cache is dropped on exit,
+    so a PID reused by a new process later never gets a stale object.
+    """
+    global _proc_cache
+    outer = _proc_cache
+    if outer is None:
+        _proc_cache = {}
+    try:
+        yield
+    finally:
+        _proc_cache = outer
+
+
+def _get_process(pid: int) -> psutil.Process:
+    """Get a psutil.Process for pid, reusing one inside process_cache()."""
+    if _proc_cache is None:
+        return psutil.Process(pid)
+    proc = _proc_cache.get(pid)
+    if proc is None:
+        proc = _proc_cache[pid] = psutil.Process(pid)
+    return proc
+
 
 def has_controlling_terminal(pid: int) -> bool:
     """
@@ -23,7 +54,7 @@ def has_controlling_terminal(pid: int) -> bool:
         False if no controlling terminal (potentially safe to kill)
     """
     try:
-        proc = psutil.Process(pid)
+        proc = _get_process(pid)
         terminal = proc.terminal()
         return terminal is not None
     except (psutil.NoSuchProcess, psutil.AccessDenied):
@@ -46,7 +77,7 @@ def is_zombie(pid: int) -> bool:
         False otherwise
     """
     try:
-        proc = psutil.Process(pid)
+        proc = _get_process(pid)
         return proc.status() == psutil.STATUS_ZOMBIE
     except (psutil.NoSuchProcess, psutil.AccessDenied):
         return False
@@ -67,7 +98,7 @@ def is_orphan(pid: int) -> bool:
         False otherwise
     """
     try:
-        proc = psutil.Process(pid)
+        proc = _get_process(pid)
         return proc.ppid() == 1
     except (psutil.NoSuchProcess, psutil.AccessDenied):
         return False
@@ -144,7 +175,7 @@ def is_system_critical(pid: int) -> bool:
         return True
     
     try:
-        proc = psutil.Process(pid)
+        proc = _get_process(pid)
         
         # Check if root-owned and in critical list
         if proc.username() == 'root':
@@ -199,10 +230,8 @@ def is_safe_to_kill(pid: int, proc: PTYProcess, threshold: int = 4) -> Tuple[boo
     
     # Level 3: Context-Specific Rules
     
-    cmd = (proc.command or "").lower()
-    
     # Copilot/Node processes: More lenient threshold
-    if "copilot" in cmd:
+    if "copilot" in proc.command_folded:
         if proc.pty_count > 10:
             return (True, f"Copilot process with excessive PTYs ({proc.pty_count}/10)")
         else:
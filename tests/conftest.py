@@ -0,0 +1,9 @@
+"""Shared pytest configuration."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def no_persisted_validation_cache(monkeypatch):
+    """Keep test runs from reading or writing the user's validation cache."""
+    monkeypatch.setenv("HONK_NO_VALIDATION_CACHE", "1")
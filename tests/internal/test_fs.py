@@ -0,0 +1,30 @@
+import pytest
+
+from honk.internal.fs import atomic_write_bytes
+
+
+def test_atomic_write_bytes_replaces_file(tmp_path):
+    """Test the new content replaces the old and no temp file is left."""
+    target = tmp_path / "a.agent.md"
+    target.write_bytes(b"old")
+    
+    atomic_write_bytes(target, b"new")
+    
+    assert target.read_bytes() == b"new"
+    assert [p.name for p in tmp_path.iterdir()] == ["a.agent.md"]
+
+
+def test_atomic_write_bytes_keeps_original_on_failure(tmp_path, monkeypatch):
+    """Test a failed rename leaves the original file and removes the temp file."""
+    target = tmp_path / "a.agent.md"
+    target.write_bytes(b"old")
+    
+    def fail(src, dst):
+        raise OSError("rename failed")
+    
+    monkeypatch.setattr("honk.internal.fs.os.replace", fail)
+    with pytest.raises(OSError):
+        atomic_write_bytes(target, b"new")
+    
+    assert target.read_bytes() == b"old"
+    assert [p.name for p in tmp_path.iterdir()] == ["a.agent.md"]
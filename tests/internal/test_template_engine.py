@@ -0,0 +1,46 @@
+import pytest
+
+from honk.internal.templates.engine import TemplateEngine
+
+
+def test_render_reuses_parsed_template_until_file_changes(tmp_path):
+    """Test a template is parsed once and re-read only after it changes."""
+    template_file = tmp_path / "greeting.md"
+    template_file.write_text("Hello ${NAME}")
+    engine = TemplateEngine(template_dir=tmp_path)
+
+    assert engine.render("greeting.md", {"NAME": "honk"}) == "Hello honk"
+    parsed = engine._compiled["greeting.md"][1]
+    assert engine.render("greeting.md", {"NAME": "goose"}) == "Hello goose"
+    assert engine._compiled["greeting.md"][1] is parsed
+
+    template_file.write_text("Bye ${NAME}!")
+    assert engine.render("greeting.md", {"NAME": "honk"}) == "Bye honk!"
+
+
+def test_render_missing_template_raises(tmp_path):
+    """Test rendering a missing template raises FileNotFoundError."""
+    engine = TemplateEngine(template_dir=tmp_path)
+    (tmp_path / "subdir").mkdir()
+
+    with pytest.raises(FileNotFoundError):
+        engine.render("missing.md", {})
+    with pytest.raises(FileNotFoundError):
+        engine.render("subdir", {})
+
+
+def test_available_templates_follows_directory_changes(tmp_path):
+    """Test the cached template listing is refreshed when the directory changes."""
+    import os
+
+    (tmp_path / "research.agent.md").write_text("")
+    (tmp_path / "notes.txt").write_text("")
+    engine = TemplateEngine(template_dir=tmp_path)
+
+    assert engine.available_templates() == ("research",)
+
+    (tmp_path / "debug.agent.md").write_text("")
+    # Make sure the mtime moves even on coarse-grained filesystems
+    st = os.stat(tmp_path)
+    os.utime(tmp_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert sorted(engine.available_templates()) == ["debug", "research"]
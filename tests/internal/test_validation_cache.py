@@ -0,0 +1,170 @@
+import json
+import os
+
+from honk.internal.validation._cache import get_validator
+
+
+def test_get_validator_reuses_instance_per_schema(tmp_path, monkeypatch):
+    """Test the same schema, by relative or absolute path, shares one validator."""
+    schema_file = tmp_path / "schema.json"
+    schema_file.write_text(json.dumps({"type": "object"}))
+    monkeypatch.chdir(tmp_path)
+    
+    validator = get_validator("schema.json")
+    
+    assert get_validator(schema_file) is validator
+    assert validator.schema_path == schema_file
+
+
+def test_get_validator_separates_working_directories(tmp_path, monkeypatch):
+    """Test a relative schema path is resolved against the current directory."""
+    for name in ("a", "b"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "schema.json").write_text(json.dumps({"type": "object"}))
+    
+    monkeypatch.chdir(tmp_path / "a")
+    first = get_validator("schema.json")
+    monkeypatch.chdir(tmp_path / "b")
+    second = get_validator("schema.json")
+    
+    assert first is not second
+    assert os.fspath(second.schema_path) == os.fspath(tmp_path / "b" / "schema.json")
+
+
+def test_tracked_lru_cache_evicts_least_recently_used():
+    """Test the cache counts hits/misses and drops the oldest entry."""
+    from honk.internal.validation._cache import TrackedLRUCache
+    
+    cache = TrackedLRUCache(maxsize=2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache.get("a") == 1
+    cache["c"] = 3
+    
+    assert cache.get("b") is None
+    assert [key for key, _ in cache.items()] == ["a", "c"]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_validate_file_cached_reuses_and_persists_results(tmp_path, monkeypatch):
+    """Test unchanged content is validated once and saved for the next run."""
+    from honk.internal.validation import _cache
+    
+    monkeypatch.setattr(_cache, "_results", _cache.TrackedLRUCache(10))
+    monkeypatch.setattr(_cache, "_results_loaded", True)
+    monkeypatch.setattr(_cache, "_results_dirty", True)
+    
+    schema_file = tmp_path / "schema.json"
+    schema_file.write_text(json.dumps({"type": "object", "required": ["name"]}))
+    agent_file = tmp_path / "a.agent.md"
+    agent_file.write_text("---\nname: a\n---\nBody\n")
+    
+    first = _cache.validate_file_cached(agent_file, schema_file)
+    second = _cache.validate_file_cached(agent_file, schema_file)
+    
+    assert first.valid
+    assert second.frontmatter == first.frontmatter
+    assert _cache._results.hits == 1
+    
+    cache_file = tmp_path / _cache.VALIDATION_CACHE_FILE
+    _cache._save_results(cache_file)
+    saved = json.loads(cache_file.read_text())
+    assert saved["format"] == _cache._cache_stamp()
+    assert list(saved["entries"].values()) == [
+        {"valid": True, "errors": [], "frontmatter": {"name": "a"}}
+    ]
+    assert [p.name for p in cache_file.parent.iterdir()] == ["validation.json"]
+
+
+def test_load_results_drops_other_versions(tmp_path, monkeypatch):
+    """Test results saved by another format or honk version are not reused."""
+    from honk.internal.validation import _cache
+    
+    entry = {"valid": True, "errors": [], "frontmatter": {"name": "a"}}
+    cache_file = tmp_path / "honk" / "validation.json"
+    cache_file.parent.mkdir()
+    monkeypatch.delenv(_cache.NO_CACHE_ENV, raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    
+    for stamp, expected in (("0:0.0.0", 0), (_cache._cache_stamp(), 1)):
+        cache_file.write_text(json.dumps({"format": stamp, "entries": {"k": entry}}))
+        monkeypatch.setattr(_cache, "_results", _cache.TrackedLRUCache(10))
+        monkeypatch.setattr(_cache, "_results_loaded", False)
+        _cache._load_results()
+        assert len(_cache._results) == expected
+
+
+def test_validate_file_cached_returns_copies(tmp_path, monkeypatch):
+    """Test changing a returned result doesn't change later cache hits."""
+    from honk.internal.validation import _cache
+    
+    monkeypatch.setattr(_cache, "_results", _cache.TrackedLRUCache(10))
+    monkeypatch.setattr(_cache, "_results_loaded", True)
+    monkeypatch.setattr(_cache, "_results_dirty", True)
+    
+    schema_file = tmp_path / "schema.json"
+    schema_file.write_text(json.dumps({"type": "object"}))
+    agent_file = tmp_path / "a.agent.md"
+    agent_file.write_text("---\nname: a\ntools: [read]\n---\n")
+    
+    first = _cache.validate_file_cached(agent_file, schema_file)
+    first.frontmatter["tools"].append("edit")
+    first.errors.append("added by caller")
+    second = _cache.validate_file_cached(agent_file, schema_file)
+    
+    assert second.frontmatter == {"name": "a", "tools": ["read"]}
+    assert second.errors == []
+
+
+def test_cache_file_location(tmp_path, monkeypatch):
+    """Test the results file follows XDG_CACHE_HOME and can be turned off."""
+    from honk.internal.validation import _cache
+    
+    monkeypatch.delenv(_cache.NO_CACHE_ENV, raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert _cache._cache_file() == tmp_path / "honk" / "validation.json"
+    
+    monkeypatch.setenv(_cache.NO_CACHE_ENV, "1")
+    assert _cache._cache_file() is None
+
+
+def test_save_registered_only_for_new_results(tmp_path, monkeypatch):
+    """Test nothing is written at exit unless a result was added and persistence is on."""
+    from honk.internal.validation import _cache
+    
+    registered = []
+    monkeypatch.setattr(_cache.atexit, "register", lambda *args: registered.append(args))
+    monkeypatch.setattr(_cache, "_results_dirty", False)
+    monkeypatch.setenv(_cache.NO_CACHE_ENV, "1")
+    _cache._mark_dirty()
+    assert registered == []
+    
+    monkeypatch.setattr(_cache, "_results_dirty", False)
+    monkeypatch.delenv(_cache.NO_CACHE_ENV)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    _cache._mark_dirty()
+    _cache._mark_dirty()
+    assert registered == [(_cache._save_results, tmp_path / "honk" / "validation.json")]
+
+
+def test_validate_files_cached_keeps_order(tmp_path, monkeypatch):
+    """Test batches read concurrently still report results in input order."""
+    from honk.internal.validation import _cache
+    
+    monkeypatch.setattr(_cache, "_results", _cache.TrackedLRUCache(10))
+    monkeypatch.setattr(_cache, "_results_loaded", True)
+    monkeypatch.setattr(_cache, "_results_dirty", True)
+    
+    schema_file = tmp_path / "schema.json"
+    schema_file.write_text(json.dumps({"type": "object", "required": ["name"]}))
+    files = []
+    for i in range(6):
+        agent_file = tmp_path / f"{i}.agent.md"
+        agent_file.write_text("---\nname: a\n---\n" if i % 2 else "---\nother: a\n---\n")
+        files.append(agent_file)
+    files.append(tmp_path / "missing.agent.md")
+    
+    results = list(_cache.validate_files_cached(files, schema_file))
+    
+    assert [r.valid for r in results] == [False, True, False, True, False, True, False]
+    assert "File not found" in results[-1].errors[0]
@@ -140,3 +140,54 @@ Content.
         result = validator.validate_file(test_file)
         assert not result.valid
         assert "Validation Error: 'name' is a required property" in result.errors[0]
+
+    def test_validate_content_returns_frontmatter(self, validator):
+        """Test validating content directly exposes the parsed frontmatter."""
+        content = """---
+name: test-agent
+description: "A test agent"
+tools:
+  - read
+---
+Content.
+"""
+        result = validator.validate_content(content)
+        assert result.valid
+        assert result.frontmatter == {
+            "name": "test-agent",
+            "description": "A test agent",
+            "tools": ["read"],
+        }
+
+    def test_schema_checker_is_compiled_once(self, validator):
+        """Test repeated validations reuse one compiled schema validator."""
+        content = """---
+name: test-agent
+description: "A test agent"
+---
+"""
+        assert validator.validate_content(content).valid
+        checker = validator.checker
+        assert not validator.validate_content("---\nname: x\n---\n").valid
+        assert validator.checker is checker
+
+    def test_validate_bytes_ignores_markdown_body(self, validator):
+        """Test only the frontmatter block is parsed, whatever the body contains."""
+        data = b"""---
+name: test-agent
+description: "Uses --- in a value"
+---
+# Body
+: not: [valid yaml
+---
+\xff\xfe not utf-8
+"""
+        result = validator.validate_bytes(data)
+        assert result.valid
+        assert result.frontmatter["description"] == "Uses --- in a value"
+
+    def test_validate_bytes_invalid_utf8_frontmatter(self, validator):
+        """Test undecodable frontmatter fails validation instead of raising."""
+        result = validator.validate_bytes(b"---\nname: caf\xe9\ndescription: x\n---\n")
+        assert not result.valid
+        assert "not valid UTF-8" in result.errors[0]
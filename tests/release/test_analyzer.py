@@ -53,3 +53,23 @@ class TestCommitAnalyzer:
         
         assert analysis.recommended_type == ReleaseType.PATCH
         assert len(analysis.fixes) == 1
+    
+    def test_analyze_consumes_iterator_once(self):
+        """Test analysis of a lazy commit stream keeps parsed messages."""
+        messages = ["feat: a", "fix: b", "chore: c"] * 200
+        commits = (
+            Commit(
+                sha=str(i), short_sha=str(i), author="Test",
+                email="test@example.com", date=datetime.now(),
+                message=message, body=""
+            )
+            for i, message in enumerate(messages)
+        )
+        
+        analyzer = CommitAnalyzer()
+        analysis = analyzer.analyze(commits)
+        
+        assert analysis.total_commits == 600
+        assert len(analysis.features) == 200
+        assert [c.message for c in analysis.commits] == messages
+        assert [p.raw_message for p in analysis.parsed] == messages
@@ -42,3 +42,19 @@ class TestConventionalCommitParser:
         """Test checking if message is conventional."""
         assert ConventionalCommitParser.is_conventional("feat: add feature") is True
         assert ConventionalCommitParser.is_conventional("Random message") is False
+    
+    def test_affects_changelog(self):
+        """Test only features, fixes and breaking changes affect the changelog."""
+        assert ConventionalCommitParser.parse("feat: add").affects_changelog is True
+        assert ConventionalCommitParser.parse("fix: bug").affects_changelog is True
+        assert ConventionalCommitParser.parse("chore!: drop py3.11").affects_changelog is True
+        assert ConventionalCommitParser.parse("docs: readme").affects_changelog is False
+    
+    def test_parse_body_breaking_change(self):
+        """Test BREAKING CHANGE footer in body marks commit as breaking."""
+        message = "refactor(core): rework config\n\nBREAKING CHANGE: new format"
+        parsed = ConventionalCommitParser.parse(message)
+        
+        assert parsed.description == "rework config"
+        assert parsed.body == "BREAKING CHANGE: new format"
+        assert parsed.breaking is True
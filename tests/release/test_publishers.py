@@ -45,6 +45,22 @@ class TestPyPIPublisher:
             
             publisher.publish(artifacts=artifacts, dry_run=False)
     
+    def test_publish_streams_stdout(self, publisher, tmp_path):
+        """Test uv output is not buffered, only stderr is captured."""
+        artifacts = [tmp_path / "test.tar.gz"]
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        
+        with patch('subprocess.run', return_value=mock_result) as mock_run, \
+             patch.dict(os.environ, {'PYPI_TOKEN': 'test-token'}):
+            
+            publisher.publish(artifacts=artifacts, dry_run=False)
+        
+        kwargs = mock_run.call_args[1]
+        assert "capture_output" not in kwargs
+        assert kwargs["stdout"] is None
+        assert kwargs["stderr"] is not None
+    
     def test_publish_failure(self, publisher, tmp_path):
         """Test publish failure."""
         artifacts = [tmp_path / "test.tar.gz"]
@@ -64,8 +80,9 @@ class TestGitHubPublisher:
     
     @pytest.fixture
     def publisher(self, tmp_path):
-        """Create publisher with temp directory."""
-        return GitHubPublisher(project_root=tmp_path)
+        """Create publisher with temp directory (no token, uses gh CLI)."""
+        with patch.dict(os.environ, {}, clear=True):
+            return GitHubPublisher(project_root=tmp_path)
     
     def test_create_release_dry_run(self, publisher, capsys):
         """Test dry run doesn't create release."""
@@ -130,3 +147,110 @@ class TestGitHubPublisher:
                     changelog="Test release",
                     dry_run=False
                 )
+
+
+class TestGitHubPublisherAPI:
+    """Tests for GitHub publisher using the REST API."""
+    
+    @pytest.fixture
+    def client(self):
+        """Create mock HTTP client."""
+        client = MagicMock()
+        client.post.return_value.status_code = 201
+        client.post.return_value.json.return_value = {
+            "upload_url": "https://uploads.github.com/repos/o/r/releases/1/assets{?name,label}"
+        }
+        return client
+    
+    def test_create_release_uses_api(self, tmp_path, client):
+        """Test release is created via REST API without forking gh."""
+        publisher = GitHubPublisher(project_root=tmp_path, repo="o/r", client=client)
+        
+        with patch('subprocess.run') as mock_run:
+            publisher.create_release(
+                version="1.0.0",
+                changelog="Test release",
+                prerelease=True,
+                dry_run=False
+            )
+        
+        assert mock_run.call_count == 0
+        url = client.post.call_args[0][0]
+        payload = client.post.call_args[1]["json"]
+        assert url == "/repos/o/r/releases"
+        assert payload["tag_name"] == "v1.0.0"
+        assert payload["prerelease"] is True
+    
+    def test_create_release_uploads_artifacts(self, tmp_path, client):
+        """Test artifacts are uploaded to the release upload URL."""
+        artifact = tmp_path / "test.tar.gz"
+        artifact.write_bytes(b"data")
+        publisher = GitHubPublisher(project_root=tmp_path, repo="o/r", client=client)
+        
+        publisher.create_release(
+            version="1.0.0",
+            changelog="Test release",
+            artifacts=[artifact],
+            dry_run=False
+        )
+        
+        upload_call = client.post.call_args_list[1]
+        assert upload_call[0][0] == "https://uploads.github.com/repos/o/r/releases/1/assets"
+        assert upload_call[1]["params"] == {"name": "test.tar.gz"}
+        assert upload_call[1]["content"] == b"data"
+    
+    def test_create_release_uploads_all_artifacts(self, tmp_path, client):
+        """Test every artifact is uploaded when there are several."""
+        artifacts = []
+        for name in ["a.whl", "b.whl", "c.tar.gz"]:
+            artifact = tmp_path / name
+            artifact.write_bytes(name.encode())
+            artifacts.append(artifact)
+        publisher = GitHubPublisher(project_root=tmp_path, repo="o/r", client=client)
+        
+        publisher.create_release(
+            version="1.0.0",
+            changelog="Test release",
+            artifacts=artifacts,
+            dry_run=False
+        )
+        
+        uploaded = {c[1]["params"]["name"] for c in client.post.call_args_list[1:]}
+        assert uploaded == {"a.whl", "b.whl", "c.tar.gz"}
+    
+    def test_create_release_api_failure(self, tmp_path, client):
+        """Test API error raises RuntimeError."""
+        client.post.return_value.status_code = 422
+        client.post.return_value.text = "Validation Failed"
+        publisher = GitHubPublisher(project_root=tmp_path, repo="o/r", client=client)
+        
+        with pytest.raises(RuntimeError, match="GitHub release failed"):
+            publisher.create_release(
+                version="1.0.0",
+                changelog="Test release",
+                dry_run=False
+            )
+    
+    def test_repo_detected_from_origin(self, tmp_path, client):
+        """Test owner/name is parsed from the origin remote URL."""
+        publisher = GitHubPublisher(project_root=tmp_path, client=client)
+        
+        with patch(
+            'honk.shared.git.GitOperations.get_remote_url',
+            return_value="git@github.com:joelklabo/honk.git"
+        ):
+            publisher.create_release(version="1.0.0", changelog="", dry_run=False)
+        
+        assert client.post.call_args[0][0] == "/repos/joelklabo/honk/releases"
+    
+    def test_created_client_closed_after_release(self, tmp_path, client, monkeypatch):
+        """Test a client opened from the token is closed once the release is done."""
+        monkeypatch.setenv("GITHUB_TOKEN", "t")
+        publisher = GitHubPublisher(project_root=tmp_path, repo="o/r")
+        
+        with patch("httpx.Client") as mock_client_cls:
+            mock_client_cls.return_value.__enter__.return_value = client
+            publisher.create_release(version="1.0.0", changelog="", dry_run=False)
+        
+        assert client.post.call_args[0][0] == "/repos/o/r/releases"
+        mock_client_cls.return_value.__exit__.assert_called_once()
@@ -1,6 +1,8 @@
 """Tests for version bumper."""
 
-from honk.release.versioning.bumper import Version
+import pytest
+
+from honk.release.versioning.bumper import Version, VersionBumper
 from honk.release.analyzer import ReleaseType
 
 
@@ -19,6 +21,17 @@ class TestVersion:
         assert v.minor == 2
         assert v.patch == 3
     
+    def test_parse_prerelease_and_build(self):
+        """Test parsing prerelease and build metadata."""
+        v = Version.parse("v1.2.3-beta.1+build.123")
+        assert v.prerelease == "beta.1"
+        assert v.build == "build.123"
+    
+    def test_parse_invalid(self):
+        """Test invalid version strings raise ValueError."""
+        with pytest.raises(ValueError):
+            Version.parse("1.2")
+    
     def test_bump_major(self):
         """Test bumping major version."""
         v = Version(1, 2, 3)
@@ -41,3 +54,50 @@ class TestVersion:
         """Test string representation."""
         v = Version(1, 2, 3)
         assert str(v) == "1.2.3"
+
+
+class TestVersionBumper:
+    def test_get_current_version_from_pyproject(self, tmp_path):
+        """Test reading the top-level version from pyproject.toml."""
+        (tmp_path / "pyproject.toml").write_text(
+            '[project]\nname = "demo"\nversion = "1.4.2"\n\n'
+            '[tool.other]\ntarget-version = "9.9.9"\n'
+        )
+        assert VersionBumper(tmp_path).get_current_version() == Version(1, 4, 2)
+    
+    def test_get_current_version_missing(self, tmp_path):
+        """Test empty pyproject.toml raises ValueError."""
+        (tmp_path / "pyproject.toml").write_text("")
+        with pytest.raises(ValueError):
+            VersionBumper(tmp_path).get_current_version()
+    
+    def test_bump_version_updates_files(self, tmp_path):
+        """Test bumping rewrites existing version files and skips missing ones."""
+        (tmp_path / "pyproject.toml").write_text('[project]\nversion = "1.4.2"\n')
+        
+        old, new = VersionBumper(tmp_path).bump_version(ReleaseType.MINOR)
+        
+        assert str(old) == "1.4.2"
+        assert str(new) == "1.5.0"
+        assert 'version = "1.5.0"' in (tmp_path / "pyproject.toml").read_text()
+        assert not (tmp_path / "src" / "honk" / "__init__.py").exists()
+    
+    def test_bump_version_uses_given_current_version(self, tmp_path):
+        """Test a version that was already read is not read again."""
+        old, new = VersionBumper(tmp_path).bump_version(
+            ReleaseType.PATCH, dry_run=True, current_version=Version(1, 4, 2)
+        )
+        
+        assert str(old) == "1.4.2"
+        assert str(new) == "1.4.3"
+    
+    def test_bump_version_updates_package_init(self, tmp_path):
+        """Test bumping rewrites __version__ in the package."""
+        (tmp_path / "pyproject.toml").write_text('[project]\nversion = "1.4.2"\n')
+        init = tmp_path / "src" / "honk" / "__init__.py"
+        init.parent.mkdir(parents=True)
+        init.write_text('__version__ = "1.4.2"\n')
+        
+        VersionBumper(tmp_path).bump_version(ReleaseType.PATCH)
+        
+        assert init.read_text() == '__version__ = "1.4.3"\n'
@@ -13,6 +13,7 @@ class TestReleaseWorkflowIntegration:
     @pytest.fixture
     def workflow(self, tmp_path):
         """Create workflow with temp directory."""
+        (tmp_path / "pyproject.toml").write_text('[project]\nversion = "0.1.0"\n')
         return ReleaseWorkflow(project_root=tmp_path)
     
     def test_execute_with_clean_repo(self, workflow):
@@ -119,3 +120,39 @@ class TestReleaseWorkflowIntegration:
             assert result.success
             assert result.release_type == ReleaseType.MAJOR
             assert result.new_version == "1.0.0"
+    
+    def test_execute_dirty_tree_fails(self, workflow):
+        """Test workflow stops when working tree is dirty."""
+        with patch.object(workflow.git, 'is_working_tree_clean', return_value=False), \
+             patch.object(workflow.git, 'get_commits_since_last_tag', return_value=[]):
+            
+            result = workflow.execute(dry_run=False)
+            
+            assert not result.success
+            assert result.error == "Working tree is not clean"
+    
+    def test_execute_bumps_version_read_during_preflight(self, workflow):
+        """Test the version read alongside the git queries is handed to the bumper."""
+        from honk.shared.git import Commit
+        from honk.release.versioning.bumper import Version
+        from datetime import datetime
+        
+        mock_commits = [
+            Commit(
+                sha="abc123",
+                short_sha="abc123",
+                author="test",
+                email="test@example.com",
+                date=datetime.now(),
+                message="fix: bug fix",
+                body=""
+            )
+        ]
+        
+        with patch.object(workflow.git, 'get_commits_since_last_tag', return_value=mock_commits), \
+             patch.object(workflow.bumper, 'bump_version', return_value=("0.1.0", "0.1.1")) as mock_bump:
+            
+            result = workflow.execute(dry_run=True)
+            
+            assert result.success
+            assert mock_bump.call_args.kwargs["current_version"] == Version(0, 1, 0)
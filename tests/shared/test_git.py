@@ -1,7 +1,42 @@
 """Tests for shared Git operations."""
 
+import subprocess
 from datetime import datetime
-from honk.shared.git import Commit
+from unittest.mock import patch
+
+import pytest
+
+from honk.shared import git as git_module
+from honk.shared.git import Commit, GitOperations
+
+
+@pytest.fixture
+def git_repo(tmp_path, monkeypatch):
+    """Create a repository with a tagged commit followed by three more commits."""
+    for key in ("AUTHOR", "COMMITTER"):
+        monkeypatch.setenv(f"GIT_{key}_NAME", "Test")
+        monkeypatch.setenv(f"GIT_{key}_EMAIL", "test@example.com")
+    
+    def git(*args):
+        subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+    
+    git("init", "-q")
+    git("commit", "-q", "--allow-empty", "-m", "chore: initial\n\nSetup")
+    git("tag", "v0.1.0")
+    git("commit", "-q", "--allow-empty", "-m", "feat: add thing\n\nDetails here")
+    git("commit", "-q", "--allow-empty", "-m", "docs: no body")
+    git("commit", "-q", "--allow-empty", "-m", "fix(api): fix thing\n\nBREAKING CHANGE: yes")
+    return tmp_path
+
+
+@pytest.fixture(params=["cli", "pygit2"])
+def git_ops(request, git_repo, monkeypatch):
+    """GitOperations on the test repository for each available backend."""
+    if request.param == "pygit2":
+        pytest.importorskip("pygit2")
+    else:
+        monkeypatch.setattr(git_module, "HAS_PYGIT2", False)
+    return GitOperations(git_repo)
 
 
 class TestCommit:
@@ -38,6 +73,42 @@ class TestCommit:
             )
             assert commit.type == expected_type
     
+    def test_scope_and_description(self):
+        """Test scope and description come from the conventional prefix only."""
+        commit = Commit(
+            sha="abc", short_sha="abc", author="Test",
+            email="test@example.com", date=datetime.now(),
+            message="fix(api): handle foo() call", body=""
+        )
+        assert commit.type == "fix"
+        assert commit.scope == "api"
+        assert commit.description == "handle foo() call"
+        
+        plain = Commit(
+            sha="abc", short_sha="abc", author="Test",
+            email="test@example.com", date=datetime.now(),
+            message="Call foo() twice", body=""
+        )
+        assert plain.type is None
+        assert plain.scope is None
+        assert plain.description == "Call foo() twice"
+    
+    def test_is_immutable(self):
+        """Test commits are frozen and slotted."""
+        commit = Commit(
+            sha="abc", short_sha="abc", author="Test",
+            email="test@example.com", date=datetime.now(),
+            message="feat: add thing", body=""
+        )
+        with pytest.raises(AttributeError):
+            commit.message = "fix: other"
+        assert not hasattr(commit, "__dict__")
+        assert commit == Commit(
+            sha="abc", short_sha="abc", author="Test",
+            email="test@example.com", date=commit.date,
+            message="feat: add thing", body=""
+        )
+    
     def test_is_breaking_with_exclamation(self):
         """Test breaking change detection with ! syntax."""
         commit = Commit(
@@ -46,3 +117,180 @@ class TestCommit:
             message="feat!: breaking change", body=""
         )
         assert commit.is_breaking() is True
+    
+    @pytest.mark.parametrize("body,expected", [
+        ("BREAKING CHANGE: api removed", True),
+        ("Details\n\nbreaking-change: renamed", True),
+        ("Not breaking anything", False),
+    ])
+    def test_is_breaking_from_body(self, body, expected):
+        """Test breaking change detection from the commit body."""
+        commit = Commit(
+            sha="abc", short_sha="abc", author="Test",
+            email="test@example.com", date=datetime.now(),
+            message="feat: change", body=body
+        )
+        assert commit.is_breaking() is expected
+        assert commit.is_breaking() is expected
+
+
+class TestGitOperations:
+    """Tests for GitOperations against a real repository."""
+    
+    def test_get_current_version(self, git_ops):
+        """Test version comes from the latest tag without v prefix."""
+        assert git_ops.get_current_version() == "0.1.0"
+    
+    def test_get_commits_since_last_tag(self, git_ops):
+        """Test only commits after the tag are returned, newest first."""
+        commits = git_ops.get_commits_since_last_tag()
+        
+        assert [c.message for c in commits] == [
+            "fix(api): fix thing", "docs: no body", "feat: add thing"
+        ]
+        assert commits[1].body == ""
+        assert commits[2].body == "Details here"
+        assert commits[0].date.tzinfo is not None
+        assert commits[0].body == "BREAKING CHANGE: yes"
+        assert commits[0].author == "Test"
+        assert commits[0].email == "test@example.com"
+        assert commits[0].sha.startswith(commits[0].short_sha)
+        assert commits[0].is_breaking() is True
+    
+    def test_read_queries_are_cached_until_write(self, git_repo, monkeypatch):
+        """Test repeated queries reuse results and writes invalidate them."""
+        monkeypatch.setattr(git_module, "HAS_PYGIT2", False)
+        git_ops = GitOperations(git_repo)
+        
+        with patch.object(git_ops, "_run_git", wraps=git_ops._run_git) as mock_run:
+            assert git_ops.get_current_version() == "0.1.0"
+            assert git_ops.get_current_version() == "0.1.0"
+            assert git_ops.has_remote() is False
+            assert git_ops.has_remote() is False
+            assert mock_run.call_count == 2
+            
+            git_ops.create_tag("0.2.0", "Release 0.2.0")
+            assert git_ops.get_current_version() == "0.2.0"
+    
+    def test_run_git_uses_cwd_without_optional_locks(self, git_repo):
+        """Test git runs in the repo directory with optional locks disabled."""
+        git_ops = GitOperations(git_repo)
+        
+        with patch.object(git_module.subprocess, "run", wraps=subprocess.run) as mock_run:
+            git_ops._run_git("status", "--porcelain")
+        
+        args, kwargs = mock_run.call_args
+        assert args[0] == ["git", "status", "--porcelain"]
+        assert kwargs["cwd"] == git_repo
+        assert kwargs["env"]["GIT_OPTIONAL_LOCKS"] == "0"
+    
+    def test_reading_history_does_not_write_commit_graph(self, git_ops, git_repo):
+        """Test read-only history walks leave the repository untouched."""
+        graph = git_repo / ".git" / "objects" / "info" / "commit-graph"
+        
+        git_ops.get_commits_since_last_tag()
+        
+        assert not graph.exists()
+    
+    def test_commit_graph_written_once(self, git_ops, git_repo):
+        """Test committing writes a commit-graph only when missing."""
+        graph = git_repo / ".git" / "objects" / "info" / "commit-graph"
+        version_file = git_repo / "VERSION"
+        version_file.write_text("0.1.0\n")
+        subprocess.run(["git", "add", "VERSION"], cwd=git_repo, check=True)
+        subprocess.run(["git", "commit", "-qm", "add version"], cwd=git_repo, check=True)
+        version_file.write_text("0.2.0\n")
+        
+        git_ops.commit_files(["VERSION"], "chore(release): bump version to 0.2.0")
+        assert graph.exists()
+        
+        with patch.object(git_module.subprocess, "run", wraps=subprocess.run) as mock_run:
+            git_ops.ensure_commit_graph()
+            GitOperations(git_repo).ensure_commit_graph()
+        
+        assert all("commit-graph" not in call.args[0] for call in mock_run.call_args_list)
+    
+    def test_is_working_tree_clean(self, git_repo):
+        """Test unstaged, staged and untracked changes make the tree dirty."""
+        readme = git_repo / "README"
+        readme.write_text("readme")
+        subprocess.run(["git", "add", "README"], cwd=git_repo, check=True)
+        subprocess.run(["git", "commit", "-qm", "docs: readme"], cwd=git_repo, check=True)
+        assert GitOperations(git_repo).is_working_tree_clean() is True
+        
+        readme.write_text("changed")
+        assert GitOperations(git_repo).is_working_tree_clean() is False
+        
+        subprocess.run(["git", "add", "README"], cwd=git_repo, check=True)
+        assert GitOperations(git_repo).is_working_tree_clean() is False
+        
+        subprocess.run(["git", "commit", "-qm", "docs: update"], cwd=git_repo, check=True)
+        (git_repo / ".git" / "info" / "exclude").write_text("*.log\n")
+        (git_repo / "debug.log").write_text("ignored")
+        assert GitOperations(git_repo).is_working_tree_clean() is True
+        
+        (git_repo / "new.txt").write_text("untracked")
+        assert GitOperations(git_repo).is_working_tree_clean() is False
+    
+    def test_is_working_tree_clean_sees_direct_edits(self, git_ops, git_repo):
+        """Test a file edited outside GitOperations is seen by the same instance."""
+        readme = git_repo / "README"
+        readme.write_text("readme")
+        subprocess.run(["git", "add", "README"], cwd=git_repo, check=True)
+        subprocess.run(["git", "commit", "-qm", "docs: readme"], cwd=git_repo, check=True)
+        assert git_ops.is_working_tree_clean() is True
+        
+        readme.write_text("bumped")
+        assert git_ops.is_working_tree_clean() is False
+    
+    def test_snapshot(self, git_ops, git_repo):
+        """Test snapshot gathers the independent queries."""
+        (git_repo / "untracked.txt").write_text("x")
+        
+        assert git_ops.snapshot() == {
+            "version": "0.1.0",
+            "branch": git_ops.get_current_branch(),
+            "clean": False,
+            "has_remote": False,
+        }
+    
+    def test_commit_files(self, git_ops, git_repo):
+        """Test committing changed tracked files returns the new HEAD."""
+        version_file = git_repo / "VERSION"
+        version_file.write_text("0.1.0\n")
+        subprocess.run(["git", "add", "VERSION"], cwd=git_repo, check=True)
+        subprocess.run(["git", "commit", "-qm", "add version"], cwd=git_repo, check=True)
+        (git_repo / "untracked.txt").write_text("not part of the release\n")
+        version_file.write_text("0.2.0\n")
+        
+        sha = git_ops.commit_files(["VERSION"], "chore(release): bump version to 0.2.0")
+        
+        head = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=git_repo, capture_output=True, text=True
+        ).stdout.strip()
+        committed = subprocess.run(
+            ["git", "show", "HEAD:VERSION"], cwd=git_repo, capture_output=True, text=True
+        ).stdout
+        assert sha == head
+        assert committed == "0.2.0\n"
+        assert git_ops.is_working_tree_clean() is False  # untracked.txt remains
+    
+    def test_iter_commits_stops_early(self, git_ops):
+        """Test iterating lazily yields the newest commit first."""
+        commits = git_ops.iter_commits_since_last_tag()
+        
+        assert next(commits).message == "fix(api): fix thing"
+        commits.close()
+    
+    def test_get_commits_limit(self, git_ops):
+        """Test limit caps the number of commits returned."""
+        commits = git_ops.get_commits_since_last_tag(limit=2)
+        
+        assert [c.message for c in commits] == ["fix(api): fix thing", "docs: no body"]
+    
+    def test_untagged_history_is_read_in_full(self, git_ops, monkeypatch):
+        """Test a repository without tags yields every commit unless a limit is given."""
+        monkeypatch.setattr(git_ops, "_get_last_tag", lambda: None)
+        
+        assert len(git_ops.get_commits_since_last_tag()) == 4
+        assert len(git_ops.get_commits_since_last_tag(limit=3)) == 3
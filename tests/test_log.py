@@ -0,0 +1,34 @@
+"""Tests for honk logging helpers."""
+
+import pytest
+
+from honk.log import read_lines_reversed
+
+
+class TestReadLinesReversed:
+    """Test reading a file's lines from the end."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 64 * 1024])
+    def test_lines_in_reverse_order(self, tmp_path, chunk_size):
+        """Test lines come back newest first regardless of chunk boundaries."""
+        path = tmp_path / "honk.log"
+        lines = [f"line {i} " + "x" * i for i in range(20)]
+        path.write_text("\n".join(lines) + "\n")
+
+        result = list(read_lines_reversed(str(path), chunk_size=chunk_size))
+
+        assert result == [line.encode() for line in reversed(lines)]
+
+    def test_no_trailing_newline(self, tmp_path):
+        """Test the last line is returned without a trailing newline."""
+        path = tmp_path / "honk.log"
+        path.write_bytes(b"first\nsecond")
+
+        assert list(read_lines_reversed(str(path), chunk_size=4)) == [b"second", b"first"]
+
+    def test_empty_file(self, tmp_path):
+        """Test an empty file yields nothing."""
+        path = tmp_path / "honk.log"
+        path.write_bytes(b"")
+
+        assert list(read_lines_reversed(str(path))) == []
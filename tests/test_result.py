@@ -1,5 +1,8 @@
 """Tests for result envelope."""
 
+import pytest
+from pydantic import ValidationError
+
 from honk.result import ResultEnvelope, Link, NextStep, EXIT_OK
 
 
@@ -50,6 +53,34 @@ def test_result_envelope_with_next_steps():
     assert result.next[0].run == ["honk", "next"]
 
 
+def test_result_envelope_is_frozen():
+    """Test result envelope can't be mutated after construction."""
+    result = ResultEnvelope(
+        command=["honk", "test"],
+        status="ok",
+        code="test.ok",
+        summary="Test passed",
+        run_id="test-123",
+        duration_ms=100,
+    )
+    with pytest.raises(ValidationError):
+        result.status = "failed"
+
+
+def test_result_envelope_rejects_unknown_fields():
+    """Test result envelope rejects fields outside the v1 schema."""
+    with pytest.raises(ValidationError):
+        ResultEnvelope(
+            command=["honk", "test"],
+            status="ok",
+            code="test.ok",
+            summary="Test passed",
+            run_id="test-123",
+            duration_ms=100,
+            unknown="value",
+        )
+
+
 def test_exit_codes():
     """Test exit code constants."""
     assert EXIT_OK == 0
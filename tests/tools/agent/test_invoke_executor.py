@@ -1,4 +1,9 @@
 """Unit tests for AgentExecutor."""
+import os
+import subprocess
+from unittest.mock import patch
+
+import pytest
 
 
 def test_build_prompt_basic():
@@ -57,6 +62,37 @@ def test_build_prompt_with_multiple_context_files(tmp_path):
     assert "class Admin(User):" in prompt
 
 
+def test_build_prompt_reads_large_utf8_context(tmp_path):
+    """Test context files larger than the default buffer are read whole."""
+    from honk.tools.agent.invoke_executor import AgentExecutor
+    
+    content = "# ünïcode\n" + "x = 1\n" * 50_000
+    context_file = tmp_path / "big.py"
+    context_file.write_text(content, encoding="utf-8")
+    
+    executor = AgentExecutor("test-agent", {})
+    prompt = executor._build_prompt("Review", context_files=[context_file])
+    
+    assert f"```py\n{content}\n```" in prompt
+
+
+def test_build_prompt_keeps_order_with_many_context_files(tmp_path):
+    """Test files read in parallel still appear in the order given."""
+    from honk.tools.agent.invoke_executor import AgentExecutor
+    
+    files = []
+    for i in range(12):
+        ctx_file = tmp_path / f"mod{i}.py"
+        ctx_file.write_text(f"value = {i}")
+        files.append(ctx_file)
+    
+    executor = AgentExecutor("test-agent", {})
+    prompt = executor._build_prompt("Review", context_files=files)
+    
+    positions = [prompt.index(f"File: {f}\n```py\nvalue = {i}\n```") for i, f in enumerate(files)]
+    assert positions == sorted(positions)
+
+
 def test_build_prompt_preserves_file_extension_in_code_block(tmp_path):
     """Test that code blocks use correct syntax highlighting."""
     from honk.tools.agent.invoke_executor import AgentExecutor
@@ -137,6 +173,7 @@ def test_log_writes_to_file(tmp_path):
     )
     
     executor._log("Test message")
+    executor.close()
     
     assert log_file.exists()
     content = log_file.read_text()
@@ -159,12 +196,28 @@ def test_log_appends_to_existing_file(tmp_path):
     )
     
     executor._log("New message")
+    executor.close()
     
     content = log_file.read_text()
     assert "Existing content" in content
     assert "New message" in content
 
 
+
+def test_executor_context_manager_closes_log(tmp_path):
+    """Test leaving the with block flushes and closes the log file."""
+    from honk.tools.agent.invoke_executor import AgentExecutor
+    
+    log_file = tmp_path / "test.log"
+    
+    with AgentExecutor("test-agent", {}, log_file=log_file) as executor:
+        executor._log("Buffered message")
+        log_fp = executor._log_fp
+    
+    assert log_fp.closed
+    assert executor._log_fp is None
+    assert "Buffered message" in log_file.read_text()
+
 def test_execution_result_dataclass():
     """Test ExecutionResult dataclass."""
     from honk.tools.agent.invoke_executor import ExecutionResult
@@ -200,3 +253,164 @@ def test_execution_result_with_error():
     assert result.output == ""
     assert result.error == "Authentication required"
     assert result.exit_code == 11
+
+
+def test_execution_result_decodes_bytes_lazily():
+    """Test ExecutionResult keeps raw output and decodes it on first access."""
+    from honk.tools.agent.invoke_executor import ExecutionResult
+    
+    result = ExecutionResult(
+        success=True,
+        output="héllo".encode("utf-8"),
+        error=b"bad \xff",
+        duration_ms=10,
+        exit_code=0
+    )
+    
+    assert "output" not in vars(result)
+    assert result.output_bytes == "héllo".encode("utf-8")
+    assert result.output == "héllo"
+    assert result.error == "bad \ufffd"
+
+
+def _install_fake_copilot(tmp_path, monkeypatch, body):
+    """Put a fake `copilot` executable first on PATH."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    script = bin_dir / "copilot"
+    script.write_text(
+        "#!/bin/sh\n"
+        "if [ \"$1\" = \"--version\" ]; then echo 1.0.0; exit 0; fi\n"
+        f"{body}\n"
+    )
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}:{os.environ['PATH']}")
+
+
+def test_execute_streams_output(tmp_path, monkeypatch):
+    """Test execute collects stdout/stderr and reports it as it arrives."""
+    from honk.tools.agent.invoke_executor import AgentExecutor
+    
+    _install_fake_copilot(
+        tmp_path, monkeypatch,
+        'echo "agent says hi"; echo "careful" >&2; exit 3'
+    )
+    
+    seen = []
+    executor = AgentExecutor("test-agent", {})
+    result = executor.execute("Do it", on_output=seen.append)
+    
+    assert result.success is False
+    assert result.exit_code == 3
+    assert result.output == "agent says hi\n"
+    assert result.error == "careful\n"
+    assert "".join(seen) == "agent says hi\n"
+
+
+def test_execute_reports_truncated_output(tmp_path, monkeypatch):
+    """Test ExecutionResult flags output that outgrew the buffer."""
+    from honk.tools.agent.invoke_executor import AgentExecutor, OutputBuffer
+    
+    _install_fake_copilot(tmp_path, monkeypatch, 'echo "first"; sleep 0.2; echo "last"')
+    
+    executor = AgentExecutor("test-agent", {})
+    executor._stdout = OutputBuffer(max_bytes=5)
+    result = executor.execute("Do it")
+    
+    assert result.output == "last\n"
+    assert result.truncated is True
+
+
+def test_truncated_output_reaches_result_envelope(tmp_path, monkeypatch):
+    """Test the truncation flag survives from the buffer to the JSON envelope."""
+    import json
+    from honk.tools.agent.invoke_executor import AgentExecutor, OutputBuffer
+    from honk.tools.agent.result_builder import build_result_envelope
+    
+    _install_fake_copilot(tmp_path, monkeypatch, 'echo "first"; sleep 0.2; echo "last"')
+    
+    executor = AgentExecutor("test-agent", {})
+    executor._stdout = OutputBuffer(max_bytes=5)
+    envelope = build_result_envelope(
+        command="honk agent invoke test-agent",
+        agent_name="test-agent",
+        prompt="Do it",
+        context_files=None,
+        execution_result=executor.execute("Do it"),
+    )
+    
+    facts = json.loads(envelope.model_dump_json())["facts"]
+    assert facts["output"] == "last\n"
+    assert facts["output_truncated"] is True
+
+
+def test_execute_flushes_log(tmp_path, monkeypatch):
+    """Test the execution log is written out when execute returns."""
+    from honk.tools.agent.invoke_executor import AgentExecutor
+    
+    _install_fake_copilot(tmp_path, monkeypatch, 'echo "done"')
+    
+    log_file = tmp_path / "agent.log"
+    executor = AgentExecutor("test-agent", {}, log_file=log_file)
+    executor.execute("Do it")
+    
+    content = log_file.read_text()
+    assert "Executing agent: test-agent" in content
+    assert "Exit code: 0" in content
+    assert "Output:\ndone" in content
+
+
+def test_execute_timeout_keeps_partial_output(tmp_path, monkeypatch):
+    """Test a timed out agent is stopped and its partial output kept."""
+    from honk.tools.agent.invoke_executor import AgentExecutor
+    
+    _install_fake_copilot(tmp_path, monkeypatch, 'echo "started"; exec sleep 10')
+    
+    executor = AgentExecutor("test-agent", {}, timeout=1)
+    with pytest.raises(TimeoutError):
+        executor.execute("Do it")
+    
+    assert executor.snapshot() == ("started\n", "")
+
+
+def test_output_buffer_drops_oldest_text():
+    """Test OutputBuffer stays bounded."""
+    from honk.tools.agent.invoke_executor import OutputBuffer
+    
+    buffer = OutputBuffer(max_bytes=10)
+    buffer.append(b"aaaa")
+    assert buffer.truncated is False
+    
+    for chunk in (b"bbbb", b"cccc"):
+        buffer.append(chunk)
+    
+    assert buffer.getvalue() == b"bbbbcccc"
+    assert buffer.truncated is True
+    assert buffer.dropped_bytes == 4
+    
+    buffer.clear()
+    assert buffer.truncated is False
+
+
+def test_copilot_probe_is_cached(tmp_path, monkeypatch):
+    """Test the copilot --version probe runs once per executable."""
+    from honk.tools.agent import invoke_executor
+    
+    _install_fake_copilot(tmp_path, monkeypatch, 'exit 0')
+    invoke_executor._probe_copilot.cache_clear()
+    
+    with patch.object(invoke_executor.subprocess, "run", wraps=subprocess.run) as mock_run:
+        assert invoke_executor._copilot_available() is True
+        assert invoke_executor._copilot_available() is True
+    
+    assert mock_run.call_count == 1
+
+
+def test_copilot_missing(tmp_path, monkeypatch):
+    """Test execute reports a missing copilot CLI without running anything."""
+    from honk.tools.agent.invoke_executor import AgentExecutor
+    
+    monkeypatch.setenv("PATH", str(tmp_path))
+    
+    with pytest.raises(FileNotFoundError, match="Copilot CLI not found"):
+        AgentExecutor("test-agent", {}).execute("Do it")
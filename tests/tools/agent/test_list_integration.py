@@ -138,3 +138,66 @@ description: This is a very long description that should be truncated because it
         # Assert
         assert result.exit_code == 0
         assert "..." in result.stdout  # Should show truncation
+
+    def test_list_reads_quoted_and_folded_descriptions(self):
+        """Should read quoted descriptions and fall back to YAML for block scalars."""
+        # Arrange
+        quoted = """---
+name: quoted
+description: "Reviews code: style and bugs"
+---
+# Quoted
+"""
+        folded = """---
+description: >
+  Folded description
+  over two lines
+---
+# Folded
+"""
+        Path(".github/agents/quoted.agent.md").write_text(quoted)
+        Path(".github/agents/folded.agent.md").write_text(folded)
+        
+        # Act
+        result = runner.invoke(app, ["agent", "list", "agents"])
+        
+        # Assert
+        assert result.exit_code == 0
+        assert "Reviews code: style and bugs" in result.stdout
+        assert "Folded description over two lines" in result.stdout
+
+    def test_list_ignores_prompt_body(self):
+        """Should read the description without depending on a large prompt body."""
+        # Arrange
+        content = """---
+name: long-prompt
+description: Has a long prompt
+---
+""" + "# Prompt\n" + "description: not this one\n" * 2000
+        Path(".github/agents/long-prompt.agent.md").write_text(content)
+        
+        # Act
+        result = runner.invoke(app, ["agent", "list", "agents"])
+        
+        # Assert
+        assert result.exit_code == 0
+        assert "Has a long prompt" in result.stdout
+        assert "not this one" not in result.stdout
+
+    def test_list_accepts_frontmatter_after_blank_lines(self):
+        """Should find frontmatter the same way agent validate does."""
+        # Arrange
+        content = """
+---
+description: Starts after a blank line
+---
+# Prompt
+"""
+        Path(".github/agents/padded.agent.md").write_text(content)
+        
+        # Act
+        result = runner.invoke(app, ["agent", "list", "agents"])
+        
+        # Assert
+        assert result.exit_code == 0
+        assert "Starts after a blank line" in result.stdout
@@ -23,9 +23,9 @@ def test_build_result_envelope_success():
     )
     
     assert envelope.version == "1.0"
-    assert envelope.command == "honk agent invoke test-agent"
+    assert envelope.command == ["honk", "agent", "invoke", "test-agent"]
     assert envelope.status == "ok"
-    assert envelope.code == 0
+    assert envelope.code == "0"
     assert envelope.changed is False  # Read-only operation
     assert "test-agent" in envelope.summary
     assert "successfully" in envelope.summary.lower()
@@ -36,9 +36,10 @@ def test_build_result_envelope_success():
     assert envelope.facts["prompt"] == "Generate code"
     assert envelope.facts["output"] == "Generated code successfully"
     
-    # Should have run_id and timestamp
-    assert envelope.run_id is not None
-    assert envelope.timestamp is not None
+    # Should have run_id (a UUID string, like other honk commands) and timestamp
+    import uuid
+    assert str(uuid.UUID(envelope.run_id)) == envelope.run_id
+    assert envelope.facts["timestamp"] is not None
 
 
 def test_build_result_envelope_with_context_files(tmp_path):
@@ -91,7 +92,7 @@ def test_build_result_envelope_authentication_error():
     )
     
     assert envelope.status == "needs_auth"
-    assert envelope.code == 11
+    assert envelope.code == "11"
     assert "authentication" in envelope.summary.lower()
     
     # Should have error in facts
@@ -100,7 +101,7 @@ def test_build_result_envelope_authentication_error():
     
     # Should suggest next step
     assert len(envelope.next) > 0
-    assert any("gh auth login" in cmd for cmd in envelope.next)
+    assert any(step.run == ["gh", "auth", "login"] for step in envelope.next)
 
 
 def test_build_result_envelope_timeout_error():
@@ -125,7 +126,7 @@ def test_build_result_envelope_timeout_error():
     )
     
     assert envelope.status == "error"
-    assert envelope.code == 30  # Timeout code
+    assert envelope.code == "30"  # Timeout code
     assert "error" in envelope.facts
 
 
@@ -151,7 +152,7 @@ def test_build_result_envelope_generic_error():
     )
     
     assert envelope.status == "error"
-    assert envelope.code == 50  # Generic error code
+    assert envelope.code == "50"  # Generic error code
     assert "failed" in envelope.summary.lower()
 
 
@@ -184,7 +185,6 @@ def test_result_envelope_has_required_fields():
         "code",
         "summary",
         "run_id",
-        "timestamp",
         "duration_ms"
     ]
     
@@ -243,7 +243,7 @@ def test_result_envelope_timestamp_is_iso8601():
     )
     
     # Should be able to parse timestamp
-    timestamp = datetime.fromisoformat(envelope.timestamp.replace('Z', '+00:00'))
+    timestamp = datetime.fromisoformat(envelope.facts["timestamp"].replace('Z', '+00:00'))
     assert timestamp is not None
 
 
@@ -277,3 +277,38 @@ def test_result_envelope_run_id_is_unique():
     )
     
     assert envelope1.run_id != envelope2.run_id
+
+
+def test_classify_error_prefers_authentication_over_timeout():
+    """Test authentication errors win even when a timeout is mentioned first."""
+    from honk.tools.agent.result_builder import _classify_error
+    
+    assert _classify_error("Timeout waiting for AUTHENTICATION") == ("needs_auth", 11)
+    assert _classify_error("request TIMEOUT") == ("error", 30)
+    assert _classify_error("segfault") == ("error", 50)
+
+
+def test_result_envelope_reports_truncated_output():
+    """Test envelope facts flag output that outgrew the capture buffer."""
+    from honk.tools.agent.result_builder import build_result_envelope
+    from honk.tools.agent.invoke_executor import ExecutionResult
+    
+    def envelope_for(truncated):
+        exec_result = ExecutionResult(
+            success=True,
+            output="...tail of a long transcript",
+            error="",
+            duration_ms=1000,
+            exit_code=0,
+            truncated=truncated
+        )
+        return build_result_envelope(
+            command="honk agent invoke test",
+            agent_name="test",
+            prompt="test",
+            context_files=None,
+            execution_result=exec_result
+        )
+    
+    assert envelope_for(True).facts["output_truncated"] is True
+    assert "output_truncated" not in envelope_for(False).facts
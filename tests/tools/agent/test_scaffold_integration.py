@@ -92,6 +92,60 @@ class TestAgentScaffoldIntegration:
         assert "name: my-test-agent" in content
         assert "description: A test agent" in content
         assert "tools:\n  - read\n  - edit" in content # Check formatted tools
+        assert "You have access to the following tools: read, edit" in content
+        assert not list(agent_file.parent.glob("*.tmp"))  # Written via atomic rename
+
+    def test_scaffold_create_all_tools(self):
+        """Test the "*" wildcard is written as a quoted YAML scalar."""
+        result = runner.invoke(
+            app,
+            [
+                "agent", "scaffold", "create",
+                "--name", "all-tools-agent",
+                "--description", "Uses every tool",
+                "--tools", "*"
+            ]
+        )
+        assert result.exit_code == 0
+        content = Path(".github/agents/all-tools-agent.agent.md").read_text()
+        assert "tools:\n  '*'\n" in content
+
+    def test_scaffold_create_without_default_template_file(self):
+        """Test the built-in default template needs no file on disk."""
+        default_template = Path("src/honk/tools/agent/templates/default.agent.md")
+        default_template.unlink()
+        
+        result = runner.invoke(
+            app,
+            [
+                "agent", "scaffold", "create",
+                "--name", "fallback-agent",
+                "--description", "Uses the fallback template",
+                "--tools", "read,search"
+            ]
+        )
+        assert result.exit_code == 0
+        assert not default_template.exists()
+        content = Path(".github/agents/fallback-agent.agent.md").read_text()
+        assert "name: fallback-agent" in content
+        assert "tools:\n  - read\n  - search" in content
+
+    def test_builtin_default_matches_packaged_template(self):
+        """Test the in-memory default renders the same as templates/default.agent.md."""
+        from string import Template
+        
+        packaged = Path(scaffold.__file__).parent / "templates" / "default.agent.md"
+        context = {
+            "AGENT_NAME": "drift-check",
+            "DESCRIPTION": "Keeps the two defaults in sync",
+            "TOOLS": "- read",
+            "TOOL_NAMES": "read",
+            "TARGET": "github-copilot",
+        }
+        
+        assert scaffold._DEFAULT_TEMPLATE.substitute(context) == (
+            Template(packaged.read_text()).substitute(context)
+        )
 
     def test_scaffold_create_existing_agent_fails(self):
         """Test creating an agent with an existing name fails."""
@@ -166,6 +220,33 @@ custom_field: true
         assert "custom_field: true" in content
         assert "tools:\n  - read" in content  # Check properly formatted YAML list
 
+    def test_scaffold_create_with_indented_tools_placeholder(self):
+        """Test templates written with an indented "  ${TOOLS}" line still render valid YAML."""
+        template_path = Path("src/honk/tools/agent/templates/indented.agent.md")
+        template_path.write_text("""---
+name: ${AGENT_NAME}
+description: ${DESCRIPTION}
+tools:
+  ${TOOLS}
+---
+
+You have access to the following tools: ${TOOLS}
+""")
+        result = runner.invoke(
+            app,
+            [
+                "agent", "scaffold", "create",
+                "--name", "indented-agent",
+                "--description", "From an indented template",
+                "--tools", "read,edit",
+                "--template", "indented"
+            ]
+        )
+        assert result.exit_code == 0
+        content = Path(".github/agents/indented-agent.agent.md").read_text()
+        assert "tools:\n  - read\n  - edit\n---" in content
+        assert "You have access to the following tools: read, edit" in content
+
     def test_scaffold_create_invalid_template_fails(self):
         """Test creating an agent with a non-existent template fails."""
         result = runner.invoke(
@@ -225,3 +306,24 @@ custom_field: true
         assert result.exit_code == 0
         assert "✓ Created agent:" in result.stdout
 
+
+    def test_stage_files_stages_all_paths(self, tmp_path):
+        """Test scaffolded files are staged with one git add."""
+        import subprocess
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+        first = tmp_path / ".github/agents/one.agent.md"
+        second = tmp_path / ".github/agents/two.agent.md"
+        first.write_text("one")
+        second.write_text("two")
+        
+        assert scaffold.stage_files([first, second]) is None
+        
+        staged = subprocess.run(
+            ["git", "diff", "--cached", "--name-only"],
+            cwd=tmp_path, check=True, capture_output=True, text=True
+        ).stdout.split()
+        assert staged == [".github/agents/one.agent.md", ".github/agents/two.agent.md"]
+
+    def test_stage_files_reports_failure(self):
+        """Test a failed git add is reported instead of claiming success."""
+        assert scaffold.stage_files([Path("not-a-repo.agent.md")]) is not None
@@ -4,7 +4,15 @@ import io
 import pytest
 from rich.console import Console
 
-from honk.ui.progress import progress_step, progress_tracker, _is_json_mode
+from honk.ui.progress import progress_step, progress_tracker, reset_json_mode, _is_json_mode
+
+
+@pytest.fixture(autouse=True)
+def fresh_json_mode():
+    """Re-detect JSON mode for each test's environment."""
+    reset_json_mode()
+    yield
+    reset_json_mode()
 
 
 class TestJsonModeDetection:
@@ -30,6 +38,19 @@ class TestJsonModeDetection:
         result = _is_json_mode()
         assert isinstance(result, bool)
 
+    def test_reset_json_mode_rereads_environment(self, monkeypatch):
+        """reset_json_mode() drops the cached decision."""
+        monkeypatch.setenv("HONK_JSON_MODE", "1")
+        assert _is_json_mode() is True
+        
+        monkeypatch.delenv("HONK_JSON_MODE")
+        monkeypatch.delenv("NO_COLOR", raising=False)
+        monkeypatch.setattr("sys.stdout.isatty", lambda: True)
+        assert _is_json_mode() is True  # Still cached
+        
+        reset_json_mode()
+        assert _is_json_mode() is False
+
 
 class TestProgressStep:
     """Tests for progress_step context manager."""
@@ -216,3 +237,34 @@ class TestProgressIntegration:
 
         # Should have cleaned up properly
         assert True
+
+
+class TestAdvanceBatching:
+    """Tests for batched advance() updates."""
+
+    def test_advance_batches_updates(self, monkeypatch):
+        """Small advances are handed to Rich in batches and flushed on exit."""
+        from honk.ui import progress as progress_module
+
+        monkeypatch.delenv("HONK_JSON_MODE", raising=False)
+        monkeypatch.delenv("NO_COLOR", raising=False)
+        monkeypatch.setattr("sys.stdout.isatty", lambda: True)
+        monkeypatch.setattr(progress_module, "ADVANCE_FLUSH_INTERVAL", 3600)
+
+        output = io.StringIO()
+        console = Console(file=output, force_terminal=True, width=80)
+
+        with progress_tracker(console=console) as tracker:
+            tracker.step("Processing", total=100)
+            updates = []
+            original_update = tracker.progress.update
+            monkeypatch.setattr(
+                tracker.progress, "update",
+                lambda task_id, **kwargs: (updates.append(kwargs.get("advance")), original_update(task_id, **kwargs)),
+            )
+            for _ in range(40):
+                tracker.advance()
+            task = tracker.progress.tasks[0]
+
+        assert updates == [16, 16, 8]
+        assert task.completed == 40
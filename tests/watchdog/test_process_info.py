@@ -0,0 +1,130 @@
+"""Tests for process naming utilities."""
+
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from honk.watchdog.process_info import (
+    _resolve_name,
+    get_application_pty_summary,
+    get_human_readable_name,
+    get_process_lineage,
+)
+from honk.watchdog.pty_scanner import PTYProcess
+
+
+def make_proc(cmdline, exe="/usr/bin/node", create_time=1000.0):
+    """Build a mock psutil.Process."""
+    proc = MagicMock()
+    proc.cmdline.return_value = cmdline
+    proc.exe.return_value = exe
+    proc.create_time.return_value = create_time
+    return proc
+
+
+@pytest.fixture(autouse=True)
+def clear_name_cache():
+    """Start every test with an empty name cache."""
+    _resolve_name.cache_clear()
+    yield
+    _resolve_name.cache_clear()
+
+
+class TestGetHumanReadableName:
+    """Test application name resolution."""
+
+    def test_interpreter_uses_script_name(self):
+        """Test node processes are named after the script they run."""
+        proc = make_proc(["node", "/opt/homebrew/bin/copilot"])
+        with patch("psutil.Process", return_value=proc):
+            assert get_human_readable_name(1234, "node") == "node:copilot"
+
+    def test_homebrew_package_name(self):
+        """Test Homebrew binaries are named after their Cellar package."""
+        proc = make_proc(["tmux"], exe="/opt/homebrew/Cellar/tmux/3.4/bin/tmux")
+        with patch("psutil.Process", return_value=proc):
+            assert get_human_readable_name(1234, "tmux: server") == "tmux"
+
+    def test_homebrew_interpreter_uses_script_name(self):
+        """Test Homebrew interpreters still report the script they run."""
+        proc = make_proc(["nodejs", "/srv/app/server.js"], exe="/opt/homebrew/Cellar/node/22.1.0/bin/node")
+        with patch("psutil.Process", return_value=proc):
+            assert get_human_readable_name(1234, "nodejs") == "node:server.js"
+
+    def test_no_command(self):
+        """Test a missing command is reported as unknown."""
+        assert get_human_readable_name(1234, None) == "unknown"
+
+    def test_name_cached_per_process(self):
+        """Test repeat lookups don't re-read the command line."""
+        proc = make_proc(["node", "/opt/homebrew/bin/copilot"])
+        with patch("psutil.Process", return_value=proc):
+            get_human_readable_name(1234, "node")
+            get_human_readable_name(1234, "node")
+
+        assert proc.cmdline.call_count == 1
+
+    def test_reused_pid_is_resolved_again(self):
+        """Test a new process with a recycled PID doesn't get the old name."""
+        old = make_proc(["node", "/opt/homebrew/bin/copilot"], create_time=1000.0)
+        new = make_proc(["node", "/srv/app/server.js"], create_time=2000.0)
+
+        with patch("psutil.Process", return_value=old):
+            assert get_human_readable_name(1234, "node") == "node:copilot"
+        with patch("psutil.Process", return_value=new):
+            assert get_human_readable_name(1234, "node") == "node:server.js"
+
+
+class TestGetApplicationPtySummary:
+    """Test per-application PTY aggregation."""
+
+    def test_groups_and_sorts_by_total_ptys(self):
+        """Test processes are grouped by name and sorted by PTY count."""
+        processes = {
+            1: PTYProcess(pid=1, command="bash", ptys=["/dev/ttys001"]),
+            2: PTYProcess(pid=2, command="zsh", ptys=["/dev/ttys002", "/dev/ttys003"]),
+            3: PTYProcess(pid=3, command="bash", ptys=["/dev/ttys004", "/dev/ttys005"]),
+        }
+        with patch("psutil.Process", side_effect=lambda pid: make_proc([], exe="", create_time=float(pid))):
+            summary = get_application_pty_summary(processes)
+
+        assert summary == [
+            {"application": "bash", "total_ptys": 3, "process_count": 2, "pids": [1, 3]},
+            {"application": "zsh", "total_ptys": 2, "process_count": 1, "pids": [2]},
+        ]
+
+    def test_many_processes_keep_order(self):
+        """Test parallel name lookups keep the first-seen order for ties."""
+        processes = {
+            pid: PTYProcess(pid=pid, command=f"cmd{pid}", ptys=["/dev/ttys001"])
+            for pid in range(1, 21)
+        }
+        with patch("psutil.Process", side_effect=lambda pid: make_proc([], exe="", create_time=float(pid))):
+            summary = get_application_pty_summary(processes)
+
+        assert [app["application"] for app in summary] == [f"cmd{pid}" for pid in range(1, 21)]
+
+
+class TestGetProcessLineage:
+    """Test parent chain lookup."""
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc directly on Linux")
+    def test_lineage_starts_with_process_and_parent(self):
+        """Test the chain starts at the process and walks to its parent."""
+        lineage = get_process_lineage(os.getpid())
+
+        assert lineage[0][0] == os.getpid()
+        assert lineage[1][0] == os.getppid()
+        assert all(name for _, name in lineage)
+
+    def test_max_depth(self):
+        """Test the chain is cut off at max_depth entries."""
+        assert len(get_process_lineage(os.getpid(), max_depth=2)) <= 2
+
+    def test_missing_process(self):
+        """Test a PID that doesn't exist has no lineage."""
+        with patch("honk.watchdog.process_info._name_and_ppid", side_effect=FileNotFoundError):
+            assert get_process_lineage(999999) == []
+
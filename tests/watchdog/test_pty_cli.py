@@ -1,27 +1,33 @@
 """Tests for PTY CLI commands."""
 
+import click
 import json
 import pytest
 from unittest.mock import patch
 from typer.testing import CliRunner
 
 from honk.cli import app
-from honk.watchdog.pty_scanner import PTYProcess
+from honk.watchdog.pty_scanner import PTYProcess, ScanResult
 
 runner = CliRunner()
 
 
+def make_scan(processes):
+    """Build a scan result for mocked scan_ptys() calls."""
+    return ScanResult(processes=processes, total_ptys=sum(p.pty_count for p in processes.values()))
+
+
 class TestPtyShow:
     """Test pty show command."""
     
     @patch("honk.watchdog.pty_cli.scan_ptys")
     def test_show_command_text_output(self, mock_scan):
         """Test show command with text output."""
-        mock_scan.return_value = {
+        mock_scan.return_value = make_scan({
             1234: PTYProcess(1234, "node /usr/local/bin/copilot-agent", 
                            [f"/dev/ttys{i:03d}" for i in range(10)]),
             5678: PTYProcess(5678, "python3", ["/dev/ttys001", "/dev/ttys002"]),
-        }
+        })
         
         result = runner.invoke(app, ["watchdog", "pty", "show", "--no-color"])
         
@@ -34,11 +40,11 @@ class TestPtyShow:
     @patch("honk.watchdog.pty_cli.scan_ptys")
     def test_show_command_json_output(self, mock_scan):
         """Test show command with JSON output."""
-        mock_scan.return_value = {
+        mock_scan.return_value = make_scan({
             1234: PTYProcess(1234, "node /usr/local/bin/copilot-agent", 
                            [f"/dev/ttys{i:03d}" for i in range(10)]),
             5678: PTYProcess(5678, "python3", ["/dev/ttys001", "/dev/ttys002"]),
-        }
+        })
         
         result = runner.invoke(app, ["watchdog", "pty", "show", "--json"])
         
@@ -52,7 +58,7 @@ class TestPtyShow:
     @patch("honk.watchdog.pty_cli.scan_ptys")
     def test_show_no_ptys(self, mock_scan):
         """Test show with no PTYs."""
-        mock_scan.return_value = {}
+        mock_scan.return_value = make_scan({})
         
         result = runner.invoke(app, ["watchdog", "pty", "show", "--no-color"])
         
@@ -70,7 +76,7 @@ class TestPtyClean:
         """Test clean command in plan mode."""
         leak_process = PTYProcess(1234, "node /usr/local/bin/copilot-agent", 
                                  [f"/dev/ttys{i:03d}" for i in range(10)])
-        mock_scan.return_value = {1234: leak_process}
+        mock_scan.return_value = make_scan({1234: leak_process})
         mock_leaks.return_value = [leak_process]
         
         result = runner.invoke(app, ["watchdog", "pty", "clean", "--plan", "--no-color"])
@@ -84,9 +90,9 @@ class TestPtyClean:
     @patch("honk.watchdog.pty_cli.scan_ptys")
     def test_clean_no_leaks(self, mock_scan, mock_leaks, mock_kill):
         """Test clean with no leaks found."""
-        mock_scan.return_value = {
+        mock_scan.return_value = make_scan({
             1234: PTYProcess(1234, "bash", ["/dev/ttys001"]),
-        }
+        })
         mock_leaks.return_value = []
         
         result = runner.invoke(app, ["watchdog", "pty", "clean", "--no-color"])
@@ -102,7 +108,7 @@ class TestPtyClean:
         """Test clean command with JSON output."""
         leak_process = PTYProcess(1234, "node /usr/local/bin/copilot-agent", 
                                  [f"/dev/ttys{i:03d}" for i in range(10)])
-        mock_scan.return_value = {1234: leak_process}
+        mock_scan.return_value = make_scan({1234: leak_process})
         mock_leaks.return_value = [leak_process]
         
         result = runner.invoke(app, ["watchdog", "pty", "clean", "--plan", "--json"])
@@ -126,7 +132,7 @@ class TestPtyWatch:
         """Test watch command monitors PTYs."""
         # Simulate KeyboardInterrupt to exit loop
         mock_scan.side_effect = [
-            {},  # First scan
+            make_scan({}),  # First scan
             KeyboardInterrupt(),  # Exit
         ]
         mock_leaks.return_value = []
@@ -135,3 +141,94 @@ class TestPtyWatch:
         
         # Should exit gracefully on KeyboardInterrupt
         assert result.exit_code == 0
+    
+    @patch("honk.watchdog.pty_cli.scan_ptys")
+    def test_watch_stops_on_sigterm(self, mock_scan):
+        """Test SIGTERM ends the wait between scans right away."""
+        import os
+        import signal
+        import time
+        
+        def scan_then_terminate():
+            os.kill(os.getpid(), signal.SIGTERM)
+            return make_scan({})
+        
+        mock_scan.side_effect = scan_then_terminate
+        
+        start = time.monotonic()
+        result = runner.invoke(app, ["watchdog", "pty", "watch", "--interval", "30"])
+        
+        assert result.exit_code == 0
+        assert "Stopping watch" in result.stdout
+        assert time.monotonic() - start < 5
+        assert mock_scan.call_count == 1
+
+    
+    @patch("honk.watchdog.pty_cli.wait_for_exit")
+    @patch("honk.watchdog.pty_cli.kill_processes")
+    @patch("honk.watchdog.safety.is_safe_to_kill")
+    @patch("honk.watchdog.pty_cli.scan_ptys")
+    def test_watch_cleans_process_orphaned_between_identical_scans(
+        self, mock_scan, mock_safe, mock_kill, mock_wait
+    ):
+        """Test a high tick rechecks leaks even when PTYs and PIDs are unchanged."""
+        import os
+        import signal
+        
+        mock_scan.return_value = make_scan({
+            4321: PTYProcess(4321, "node", [f"/dev/ttys{i:03d}" for i in range(6)]),
+        })
+        # Parent still alive on the first scan, exited (ppid 1) by the second
+        mock_safe.side_effect = [(False, "Has a live parent"), (True, "Orphan process with 6 PTYs (leak)")]
+        
+        def kill_then_terminate(pids):
+            os.kill(os.getpid(), signal.SIGTERM)
+            return {pid: True for pid in pids}
+        
+        mock_kill.side_effect = kill_then_terminate
+        
+        result = runner.invoke(app, ["watchdog", "pty", "watch", "--interval", "0", "--max-ptys", "2"])
+        
+        assert result.exit_code == 0
+        assert mock_safe.call_count == 2
+        mock_kill.assert_called_once_with([4321])
+
+
+class TestPtyHistory:
+    """Test pty history command."""
+    
+    def test_history_reads_logged_events(self, tmp_path):
+        """Test events logged as JSON objects or JSON strings are both listed, newest first."""
+        log_file = tmp_path / "honk.log"
+        cleanup = {"event_type": "pty_cleanup", "killed_count": 2, "freed_ptys": 5}
+        log_file.write_text("\n".join([
+            json.dumps({"timestamp": "2025-11-18 10:00:00,000", "level": "INFO", "data": json.dumps({**cleanup, "killed_count": 1})}),
+            json.dumps({"timestamp": "2025-11-18 10:05:00,000", "level": "INFO", "data": {"event_type": "pty_scan"}}),
+            json.dumps({"timestamp": "2025-11-18 10:10:00,000", "level": "INFO", "data": cleanup}),
+        ]) + "\n")
+        
+        with patch("honk.watchdog.pty_cli.LOG_FILE_PATH", str(log_file)):
+            result = runner.invoke(app, ["watchdog", "pty", "history"])
+        
+        output = click.unstyle(result.stdout)
+        assert result.exit_code == 0
+        assert output.index("[2025-11-18 10:10:00,000] Killed 2 processes, freed 5 PTYs") < (
+            output.index("[2025-11-18 10:00:00,000] Killed 1 processes, freed 5 PTYs")
+        )
+        assert "2025-11-18 10:05:00,000" not in output
+
+
+class TestSendNotification:
+    """Test macOS notifications."""
+    
+    @patch("honk.watchdog.pty_cli.subprocess.run")
+    def test_text_passed_as_arguments(self, mock_run):
+        """Test title and message are passed to osascript, not spliced into the script."""
+        from honk.watchdog.pty_cli import send_notification
+        
+        send_notification("Honk", 'Killed "2" processes')
+        
+        cmd = mock_run.call_args[0][0]
+        assert cmd[0] == "osascript"
+        assert cmd[-2:] == ['Killed "2" processes', "Honk"]
+        assert not any("Killed" in arg for arg in cmd[:-2])
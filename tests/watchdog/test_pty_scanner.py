@@ -4,11 +4,14 @@ from unittest.mock import patch
 
 from honk.watchdog.pty_scanner import (
     PTYProcess,
+    ScanResult,
     parse_lsof_output,
     scan_ptys,
     get_heavy_users,
     get_suspected_leaks,
+    get_heavy_users_and_leaks,
     kill_processes,
+    wait_for_exit,
 )
 
 
@@ -42,6 +45,11 @@ class TestPTYProcess:
             parent_pid=5678
         )
         assert proc2.parent_pid == 5678
+    
+    def test_command_folded(self):
+        """Test the case-folded command used for matching."""
+        assert PTYProcess(pid=1, command="Node Copilot", ptys=[]).command_folded == "node copilot"
+        assert PTYProcess(pid=1, command=None, ptys=[]).command_folded == ""
 
 
 class TestParseLsofOutput:
@@ -138,18 +146,21 @@ p5678
 cpython3
 n/dev/ttys002
 """
-        processes = scan_ptys()
+        result = scan_ptys()
         
-        assert len(processes) == 2
-        assert 1234 in processes
-        assert 5678 in processes
+        assert isinstance(result, ScanResult)
+        assert len(result.processes) == 2
+        assert 1234 in result.processes
+        assert 5678 in result.processes
+        assert result.total_ptys == 2
     
     @patch("honk.watchdog.pty_scanner.run_lsof")
     def test_scan_ptys_empty(self, mock_lsof):
         """Test scan with no PTYs."""
         mock_lsof.return_value = ""
-        processes = scan_ptys()
-        assert len(processes) == 0
+        result = scan_ptys()
+        assert len(result.processes) == 0
+        assert result.total_ptys == 0
 
 
 class TestGetHeavyUsers:
@@ -227,6 +238,26 @@ class TestGetSuspectedLeaks:
         assert len(leaks) == 0
 
 
+class TestGetHeavyUsersAndLeaks:
+    """Test the combined heavy user and leak pass."""
+    
+    @patch('honk.watchdog.safety.is_safe_to_kill')
+    def test_matches_separate_functions(self, mock_is_safe_to_kill):
+        """Test both lists match what the separate functions return."""
+        mock_is_safe_to_kill.side_effect = lambda pid, proc, threshold=4: (pid == 5678, "")
+        
+        processes = {
+            1234: PTYProcess(1234, "zsh", [f"/dev/ttys{i:03d}" for i in range(6)]),
+            5678: PTYProcess(5678, "node", ["/dev/ttys010", "/dev/ttys011"]),
+        }
+        
+        heavy, leaks = get_heavy_users_and_leaks(processes, threshold=4)
+        
+        assert heavy == get_heavy_users(processes, threshold=4)
+        assert leaks == get_suspected_leaks(processes, threshold=4)
+        assert [p.pid for p in heavy] == [1234]
+        assert [p.pid for p in leaks] == [5678]
+
 class TestKillProcesses:
     """Test process killing."""
     
@@ -260,3 +291,20 @@ class TestKillProcesses:
         results = kill_processes(pids)
         
         assert results[99999] is False
+
+
+class TestWaitForExit:
+    """Test waiting for killed processes."""
+    
+    @patch("psutil.wait_procs")
+    @patch("psutil.Process")
+    def test_waits_for_live_processes(self, mock_process, mock_wait):
+        """Test only processes that still exist are waited on."""
+        import psutil
+        
+        live = object()
+        mock_process.side_effect = [live, psutil.NoSuchProcess(5678)]
+        
+        wait_for_exit([1234, 5678], timeout=1.5)
+        
+        mock_wait.assert_called_once_with([live], timeout=1.5)
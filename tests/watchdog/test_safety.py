@@ -11,6 +11,7 @@ from honk.watchdog.safety import (
     is_in_own_tree,
     is_system_critical,
     is_safe_to_kill,
+    process_cache,
 )
 from honk.watchdog.pty_scanner import PTYProcess
 
@@ -408,3 +409,34 @@ class TestIsSafeToKill:
         
         assert safe is False
         assert "below threshold" in reason.lower()
+
+
+class TestProcessCache:
+    """Test sharing psutil.Process objects between checks."""
+    
+    @patch('honk.watchdog.safety.psutil.Process')
+    def test_one_process_per_pid_inside_cache(self, mock_process_class):
+        """Checks in one process_cache() block share a Process."""
+        mock_proc = Mock()
+        mock_proc.status.return_value = 'sleeping'
+        mock_proc.ppid.return_value = 1
+        mock_process_class.return_value = mock_proc
+        
+        with process_cache():
+            is_zombie(1234)
+            is_orphan(1234)
+        
+        assert mock_process_class.call_count == 1
+    
+    @patch('honk.watchdog.safety.psutil.Process')
+    def test_no_reuse_outside_cache(self, mock_process_class):
+        """Without process_cache(), every check looks the process up again."""
+        mock_proc = Mock()
+        mock_proc.status.return_value = 'sleeping'
+        mock_process_class.return_value = mock_proc
+        
+        with process_cache():
+            is_zombie(1234)
+        is_zombie(1234)
+        
+        assert mock_process_class.call_count == 2